@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+ASL Translator - Batch Transcription Entry Point
+Transcribes a directory of videos across a process pool (one detector per worker)
+"""
+import sys
+import os
+import argparse
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+# Import and run
+from batch_transcriber import transcribe_directory
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batch-transcribe a directory of ASL videos")
+    parser.add_argument("input_dir", help="Directory containing video files")
+    parser.add_argument("-o", "--output", default="transcripts",
+                        help="Directory for per-video results and the throughput report")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="Worker processes (default: number of CPU cores)")
+    parser.add_argument("--fps", type=float, default=None,
+                        help="Frame rate for hold-time timestamps (default: each video's rate)")
+    parser.add_argument("--model", default="asl_model.pkl", help="Trained model file")
+    parser.add_argument("--data", default="training_data.json", help="Training data file")
+    parser.add_argument("--mirror", action="store_true",
+                        help="Flip frames horizontally (raw camera footage only)")
+    parser.add_argument("--landmark-cache", default=None, metavar="DIR",
+                        help="Cache MediaPipe landmarks per video in DIR and replay them on later runs")
+    parser.add_argument("--adaptive-skip", action="store_true",
+                        help="Extrapolate landmarks on stable frames (default: infer every frame)")
+    parser.add_argument("--roi", action="store_true",
+                        help="Run MediaPipe on hand crops (default: full frames)")
+    parser.add_argument("--smoothing", choices=["moving_average", "one_euro", "kalman"], default="moving_average",
+                        help="Landmark smoother (default: the original 7-frame weighted average)")
+    args = parser.parse_args()
+
+    try:
+        report = transcribe_directory(args.input_dir, args.output, workers=args.workers, fps=args.fps,
+                                      data_file=args.data, model_file=args.model, mirror=args.mirror,
+                                      cache_dir=args.landmark_cache, adaptive_skip=args.adaptive_skip,
+                                      roi_mode=args.roi, smoothing=args.smoothing)
+
+        print("=" * 60)
+        print("📊 THROUGHPUT REPORT")
+        print("=" * 60)
+        for pid, stats in report['workers'].items():
+            print(f"Worker {pid}: {stats['videos']} videos, {stats['frames']} frames, {stats['fps']:.1f} fps")
+        print(f"Overall: {report['frames']} frames in {report['wall_seconds']:.1f}s "
+              f"({report['overall_fps']:.1f} fps)")
+        if report['failed']:
+            print(f"❌ Failed videos: {report['failed']}")
+        print(f"💾 Report: {os.path.join(args.output, 'throughput_report.json')}")
+        print("=" * 60)
+    except KeyboardInterrupt:
+        print("\n\n👋 Goodbye!")
+        sys.exit(0)
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -5,6 +5,7 @@ Fast launcher with optimized imports
 """
 import sys
 import os
+import argparse
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -13,9 +14,34 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from asl_translator import ASLTranslator
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ASL Translator")
+    parser.add_argument("--pipelined", action="store_true",
+                        help="Run detect/classify/render on separate worker threads")
+    parser.add_argument("--draw-level", choices=["off", "minimal", "full"], default="full",
+                        help="Hand overlay detail (minimal = skeleton only, cheapest to draw)")
+    parser.add_argument("--multiplayer", action="store_true",
+                        help="Track two hands and keep a separate text per signer")
+    parser.add_argument("--backend", choices=["solutions", "live_stream"], default="solutions",
+                        help="Landmark backend (live_stream = asynchronous Tasks HandLandmarker)")
+    parser.add_argument("--hand-model", default="models/hand_landmarker.task",
+                        help="hand_landmarker.task model bundle for the live_stream backend")
+    parser.add_argument("--adaptive-skip", action="store_true",
+                        help="Extrapolate landmarks instead of running MediaPipe on stable frames")
+    parser.add_argument("--roi", action="store_true",
+                        help="Run MediaPipe on a crop around the previous hand box")
+    parser.add_argument("--latency-target", type=float, default=None, metavar="MS",
+                        help="Downscale the detector input to meet this inference budget (e.g. 25)")
+    parser.add_argument("--smoothing", choices=["moving_average", "one_euro", "kalman"], default="moving_average",
+                        help="Landmark smoother (default: the original 7-frame weighted average)")
+    args = parser.parse_args()
+    
     try:
-        translator = ASLTranslator()
-        translator.run()
+        translator = ASLTranslator(draw_level=args.draw_level, multiplayer=args.multiplayer,
+                                   backend=args.backend,
+                                   backend_params={"model_path": args.hand_model} if args.backend == "live_stream" else None,
+                                   adaptive_skip=args.adaptive_skip, roi_mode=args.roi,
+                                   latency_target_ms=args.latency_target, smoothing=args.smoothing)
+        translator.run(pipelined=args.pipelined)
     except KeyboardInterrupt:
         print("\n\n👋 Goodbye!")
         sys.exit(0)
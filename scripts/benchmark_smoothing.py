@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Landmark Smoothing Micro-Benchmark
+Compares the old list-of-lists weighted average with the NumPy ring buffer
+Also checks that both produce identical smoothed landmarks
+"""
+import os
+import sys
+import time
+from collections import deque
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from landmark_buffer import LandmarkRingBuffer
+
+
+def legacy_weighted_average(landmark_buffer):
+    """The original find_position smoothing loop (deque of [id, x, y] lists)"""
+    smoothed = []
+    buffer_size = len(landmark_buffer)
+
+    for i in range(21):
+        weighted_x = 0
+        weighted_y = 0
+        total_weight = 0
+
+        for j, frame in enumerate(landmark_buffer):
+            weight = (j + 1) / buffer_size
+            weighted_x += frame[i][1] * weight
+            weighted_y += frame[i][2] * weight
+            total_weight += weight
+
+        smoothed.append([i, int(weighted_x / total_weight), int(weighted_y / total_weight)])
+
+    return smoothed
+
+
+def generate_frames(count, seed=0):
+    """Random-walk hand landmarks in 960x540 pixel space, as [id, x, y] lists"""
+    rng = np.random.RandomState(seed)
+    base = rng.randint(300, 600, size=(21, 2))
+    frames = []
+    for _ in range(count):
+        base = base + rng.randint(-3, 4, size=(21, 2))
+        frames.append([[i, int(x), int(y)] for i, (x, y) in enumerate(base)])
+    return frames
+
+
+def main():
+    frames = generate_frames(20000)
+
+    print("=" * 60)
+    print("⚡ LANDMARK SMOOTHING BENCHMARK")
+    print("=" * 60)
+
+    # Correctness: both implementations see the same frame sequence
+    legacy_buffer = deque(maxlen=7)
+    ring_buffer = LandmarkRingBuffer(capacity=7)
+    mismatches = 0
+    for frame in frames:
+        legacy_buffer.append(frame)
+        ring_buffer.append(np.array(frame)[:, 1:])
+        if len(legacy_buffer) >= 3:
+            expected = legacy_weighted_average(legacy_buffer)
+            actual = [[i, x, y] for i, (x, y) in enumerate(ring_buffer.weighted_average().tolist())]
+            mismatches += expected != actual
+    print(f"✅ Identical output on {len(frames)} frames" if mismatches == 0
+          else f"❌ {mismatches} frames differ")
+
+    # Timing: append + smooth per frame (what find_position does)
+    legacy_buffer = deque(maxlen=7)
+    start = time.perf_counter()
+    for frame in frames:
+        legacy_buffer.append(frame)
+        if len(legacy_buffer) >= 3:
+            legacy_weighted_average(legacy_buffer)
+    legacy_us = (time.perf_counter() - start) / len(frames) * 1e6
+
+    ring_buffer = LandmarkRingBuffer(capacity=7)
+    points = [np.array(frame)[:, 1:] for frame in frames]
+    start = time.perf_counter()
+    for frame in points:
+        ring_buffer.append(frame)
+        if len(ring_buffer) >= 3:
+            ring_buffer.weighted_average()
+    ring_us = (time.perf_counter() - start) / len(frames) * 1e6
+
+    print(f"Before (nested Python loops): {legacy_us:8.1f} µs/frame")
+    print(f"After  (NumPy ring buffer):   {ring_us:8.1f} µs/frame")
+    print(f"Speedup: {legacy_us / ring_us:.1f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ import numpy as np
 import math
 from collections import deque
 from feature_extraction import AdvancedFeatureExtractor, DataPreprocessor
+from hand_geometry import HandGeometry, as_geometry
 
 
 class ASLClassifier:
@@ -54,7 +55,7 @@ class ASLClassifier:
         Calculate how curved a finger is (0=bent, 1=straight)
         
         Args:
-            landmarks: Hand landmarks
+            landmarks: Hand landmarks or HandGeometry (reuses its distance matrix)
             finger_idx: 0=thumb, 1=index, 2=middle, 3=ring, 4=pinky
         
         Returns:
@@ -69,17 +70,8 @@ class ASLClassifier:
         if any(j >= len(landmarks) for j in joints):
             return 0.0
         
-        # Calculate direct distance (straight line)
-        direct = self.calculate_distance(landmarks[joints[0]][1:], landmarks[joints[-1]][1:])
-        
-        # Calculate sum of segments (actual path)
-        segments = sum(
-            self.calculate_distance(landmarks[joints[i]][1:], landmarks[joints[i+1]][1:])
-            for i in range(len(joints) - 1)
-        )
-        
-        # Straightness ratio (1.0 = perfectly straight)
-        return direct / (segments + 0.001)
+        # Straightness ratio (1.0 = perfectly straight): direct distance over the sum of segments
+        return as_geometry(landmarks).finger_curvature(joints)
     
     def calculate_hand_orientation(self, landmarks):
         """
@@ -103,21 +95,21 @@ class ASLClassifier:
         Returns list of 4 distances: [thumb-index, index-middle, middle-ring, ring-pinky]
         """
         tips = [4, 8, 12, 16, 20]  # Thumb to pinky tips
-        spreads = []
-        
-        for i in range(len(tips) - 1):
-            dist = self.calculate_distance(landmarks[tips[i]][1:], landmarks[tips[i+1]][1:])
-            spreads.append(dist)
-        
-        return spreads
+        geometry = as_geometry(landmarks)
+        return [geometry.distance(tips[i], tips[i + 1]) for i in range(len(tips) - 1)]
     
     def get_advanced_confidence_boost(self, landmarks, letter, base_confidence):
         """
         Use advanced features to boost confidence for ambiguous letters
         Helps differentiate V/W/U, O/C, E/M/N, etc.
+        
+        Args:
+            landmarks: Hand landmarks or HandGeometry (reuses its feature vector)
+            letter: Letter predicted by the rules
+            base_confidence: Confidence of that prediction
         """
-        # Extract all features
-        features = self.feature_extractor.extract_all_features(landmarks)
+        # Extract all features (computed once per HandGeometry)
+        features = as_geometry(landmarks).features
         
         if not features:
             return base_confidence
@@ -252,7 +244,7 @@ class ASLClassifier:
         Based on successful MediaPipe hand tracking projects
         
         Args:
-            landmarks: List of landmarks [[id, x, y], ...]
+            landmarks: Landmarks (or list of [id, x, y])
             is_back_of_hand: Whether viewing back of hand
         
         Returns:
@@ -315,24 +307,28 @@ class ASLClassifier:
         Optimized for back-of-hand view with ML-inspired features
         
         Args:
-            landmarks: List of hand landmarks [[id, x, y], ...]
+            landmarks: Landmarks, HandGeometry (or list of [id, x, y])
             is_back_of_hand: Whether viewing back of hand
             
         Returns:
             Tuple of (predicted letter, confidence score)
         """
-        if len(landmarks) < 21:
+        # OPTIMIZED: distances and angles come from one HandGeometry (21x21 distance
+        # matrix and joint-angle table) instead of dozens of separate calculations
+        geometry = as_geometry(landmarks)
+        if len(geometry) < 21:
             return "", 0.0
         
         # NEW: Apply preprocessing for better stability
-        self.landmark_history.append(landmarks)
+        self.landmark_history.append(geometry.landmarks)
         if len(self.landmark_history) >= 3:
-            # Apply Kalman filtering for smoother landmarks
-            landmarks = self.preprocessor.apply_kalman_filter(
-                landmarks, 
+            # Apply Kalman filtering for smoother landmarks (they get their own geometry)
+            geometry = HandGeometry(self.preprocessor.apply_kalman_filter(
+                geometry.landmarks, 
                 list(self.landmark_history),
                 alpha=0.8  # Weight current frame highly but smooth noise
-            )
+            ))
+        landmarks = geometry
         
         fingers = self.fingers_up(landmarks, is_back_of_hand)
         
@@ -367,17 +363,17 @@ class ASLClassifier:
         wrist = landmarks[0]
         
         # Calculate critical distances
-        thumb_index_dist = self.calculate_distance(thumb_tip[1:], index_tip[1:])
-        thumb_middle_dist = self.calculate_distance(thumb_tip[1:], middle_tip[1:])
-        thumb_ring_dist = self.calculate_distance(thumb_tip[1:], ring_tip[1:])
-        thumb_pinky_dist = self.calculate_distance(thumb_tip[1:], pinky_tip[1:])
+        thumb_index_dist = geometry.distance(4, 8)
+        thumb_middle_dist = geometry.distance(4, 12)
+        thumb_ring_dist = geometry.distance(4, 16)
+        thumb_pinky_dist = geometry.distance(4, 20)
         
-        index_middle_dist = self.calculate_distance(index_tip[1:], middle_tip[1:])
-        middle_ring_dist = self.calculate_distance(middle_tip[1:], ring_tip[1:])
-        ring_pinky_dist = self.calculate_distance(ring_tip[1:], pinky_tip[1:])
+        index_middle_dist = geometry.distance(8, 12)
+        middle_ring_dist = geometry.distance(12, 16)
+        ring_pinky_dist = geometry.distance(16, 20)
         
         # Calculate palm width for normalization
-        palm_width = self.calculate_distance(index_mcp[1:], pinky_mcp[1:])
+        palm_width = geometry.palm_width
         
         # Normalize distances by palm width for scale independence
         def norm_dist(dist):
@@ -391,9 +387,9 @@ class ASLClassifier:
         thumb_pinky_norm = norm_dist(thumb_pinky_dist)
         
         # Calculate angles for better precision
-        index_angle = self.calculate_angle(index_mcp[1:], index_pip[1:], index_tip[1:])
-        middle_angle = self.calculate_angle(middle_mcp[1:], middle_pip[1:], middle_tip[1:])
-        ring_angle = self.calculate_angle(ring_mcp[1:], ring_pip[1:], ring_tip[1:])
+        index_angle = geometry.angle(5, 6, 8)
+        middle_angle = geometry.angle(9, 10, 12)
+        ring_angle = geometry.angle(13, 14, 16)
         
         # NEW: Calculate finger curvatures (0=bent, 1=straight)
         index_curvature = self.calculate_finger_curvature(landmarks, 1)
@@ -566,7 +562,7 @@ class ASLClassifier:
         
         if fingers == [1, 1, 0, 0, 0]:
             # Check angle between thumb and index
-            ti_angle = self.calculate_angle(thumb_tip[1:], wrist[1:], index_tip[1:])
+            ti_angle = geometry.angle(4, 0, 8)
             
             # D: Thumb touching middle finger area (priority check)
             if thumb_middle_norm < 0.6 and index_angle > 115:
@@ -599,9 +595,9 @@ class ASLClassifier:
         
         if fingers == [0, 0, 0, 0, 0]:
             # Check thumb position relative to finger knuckles
-            thumb_to_index_mcp = self.calculate_distance(thumb_tip[1:], index_mcp[1:])
-            thumb_to_middle_mcp = self.calculate_distance(thumb_tip[1:], middle_mcp[1:])
-            thumb_to_ring_mcp = self.calculate_distance(thumb_tip[1:], ring_mcp[1:])
+            thumb_to_index_mcp = geometry.distance(4, 5)
+            thumb_to_middle_mcp = geometry.distance(4, 9)
+            thumb_to_ring_mcp = geometry.distance(4, 13)
             
             thumb_index_mcp_norm = norm_dist(thumb_to_index_mcp)
             thumb_middle_mcp_norm = norm_dist(thumb_to_middle_mcp)
@@ -656,7 +652,7 @@ class ASLClassifier:
         # I: Only pinky extended (little finger up)
         if fingers == [0, 0, 0, 0, 1]:
             # Pinky clearly extended, others closed (VERY RELAXED)
-            pinky_angle = self.calculate_angle(pinky_mcp[1:], pinky_pip[1:], pinky_tip[1:])
+            pinky_angle = geometry.angle(17, 18, 20)
             if pinky_angle > 115:  # Much more lenient
                 return "I", 0.92
             elif pinky_angle > 115:
@@ -672,7 +668,7 @@ class ASLClassifier:
             v_spread = index_middle_spread > 0.15  # Reasonable spread for V
             
             # Thumb MUST be touching/near middle finger base (KEY DIFFERENCE FROM A!)
-            thumb_to_middle_mcp = self.calculate_distance(thumb_tip[1:], middle_mcp[1:])
+            thumb_to_middle_mcp = geometry.distance(4, 9)
             thumb_touching_middle = norm_dist(thumb_to_middle_mcp) < 0.30  # Close to middle knuckle
             
             # Thumb should be relatively HIGH (not super low like A)
@@ -766,6 +762,9 @@ class ASLClassifier:
         Enhanced classification using both geometric rules AND advanced features
         Returns letter with boosted confidence
         """
+        # One geometry for both stages (the feature boost reuses its distances)
+        landmarks = as_geometry(landmarks)
+        
         # Get base classification
         letter, base_confidence = self.classify_letter(landmarks, is_back_of_hand)
         
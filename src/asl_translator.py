@@ -5,6 +5,7 @@ Enhanced version with back-of-hand support and improved UI
 Optimized for fast startup and crash prevention
 """
 import cv2
+import threading
 import time
 import numpy as np
 import os
@@ -16,6 +17,12 @@ from typing import Optional, Tuple
 try:
     from hand_detector import HandDetector
     from asl_classifier import ASLClassifier
+    from frame_grabber import FrameGrabber
+    from frame_pipeline import FramePipeline
+    from video_recorder import AsyncVideoRecorder
+    from overlay import blend_rect
+    from prediction_cache import PredictionCache
+    from hand_geometry import as_geometry
 except ImportError:
     print("❌ Error: Could not import required modules")
     print("Make sure you're running from the correct directory")
@@ -26,10 +33,31 @@ MLTrainer = None
 
 
 class ASLTranslator:
-    def __init__(self):
-        """Initialize the ASL Translator with ENHANCED features"""
+    def __init__(self, draw_level='full', multiplayer=False, backend='solutions', backend_params=None,
+                 adaptive_skip=False, roi_mode=False, latency_target_ms=None, smoothing='moving_average'):
+        """
+        Initialize the ASL Translator with ENHANCED features
+        
+        Args:
+            draw_level: Hand overlay detail - 'off', 'minimal' (skeleton only) or 'full'
+            multiplayer: Track two hands and keep a separate text per signer
+            backend: Landmark backend ('solutions', 'live_stream' or 'replay', see detector_backends)
+            backend_params: Optional dict of backend arguments (e.g. model_path for live_stream)
+            adaptive_skip: Extrapolate landmarks instead of running MediaPipe on stable frames
+            roi_mode: Run MediaPipe on a crop around the previous hand box
+            latency_target_ms: Inference budget that drives input downscaling (None = full resolution)
+            smoothing: Landmark smoother - 'moving_average' (the original 7-frame weighted
+                       average the classifier was trained on), 'one_euro' or 'kalman'
+        
+        The defaults give the baseline detector (full inference on every full
+        frame); the speed modes trade some accuracy for frame rate and are
+        opt-in.
+        """
         try:
-            self.detector = HandDetector(max_hands=1, detection_con=0.8)
+            self.detector = HandDetector(max_hands=2 if multiplayer else 1, detection_con=0.8,
+                                         adaptive_skip=adaptive_skip, roi_mode=roi_mode,
+                                         latency_target_ms=latency_target_ms, smoothing=smoothing,
+                                         draw_level=draw_level, backend=backend, backend_params=backend_params)
             self.classifier = ASLClassifier()
         except Exception as e:
             print(f"❌ Failed to initialize: {e}")
@@ -44,6 +72,10 @@ class ASLTranslator:
         self.last_letter_added_time = 0  # Track when last letter was added
         self.letter_cooldown = 1.5  # 1.5 second pause between letters
         
+        # Guards current_text, player texts and letter_history: in pipelined mode the
+        # classify worker inserts letters while the main thread handles keys
+        self.text_lock = threading.RLock()
+        
         # History tracking
         self.letter_history = deque(maxlen=10)
         self.gesture_timeline = deque(maxlen=20)
@@ -62,17 +94,24 @@ class ASLTranslator:
         # GAMIFICATION FEATURES DISABLED (but initialized to prevent errors)
         self.practice_mode = False  # Disabled
         self.recording = False  # Disabled
-        self.video_writer = None  # Disabled
+        self.recorder = None  # Disabled (AsyncVideoRecorder while recording)
         self.recording_start_time = 0  # Disabled
+        self.record_raw = False  # Record the camera frame instead of the annotated one
+        self.recording_scale = 1.0  # e.g. 0.5 to halve the encoded resolution
+        self.recording_fps = 30.0  # Constant output rate (frames are placed by timestamp)
+        self.recording_policy = 'drop'  # 'drop' or 'block' when the writer falls behind
         self.custom_words = []  # Disabled
         self.voice_enabled = False  # Disabled
         
         # UI settings
+        self.window_name = "ASL Translator - Enhanced v2.0 🚀"
         self.font = cv2.FONT_HERSHEY_SIMPLEX
         self.font_scale = 1
         self.font_thickness = 2
         
         # Animation variables
+        self.greeting_end_time = 0  # Track when to stop showing greeting
+        self.prev_frame_time = 0
         self.letter_flash_time = 0
         self.flash_duration = 0.5
         self.show_help = False
@@ -96,10 +135,12 @@ class ASLTranslator:
         
         # ========== NEW ADVANCED FEATURES ==========
         
-        # Multiplayer Mode (two hands)
-        self.multiplayer_enabled = False
+        # Multiplayer Mode (two hands) - each hand's track ID is bound to a player
+        self.multiplayer_enabled = multiplayer
         self.player1_text = ""
         self.player2_text = ""
+        self.player_tracks = {}  # track_id -> player number (1 or 2)
+        self.active_track = None  # Track whose letters are being classified
         
         # Performance Analytics
         self.analytics = {
@@ -115,6 +156,8 @@ class ASLTranslator:
         # Initialize ML trainer for adaptive learning (lazy loaded)
         self.ml_trainer = None
         self.ml_trainer_loaded = False
+        # Change gate: skip re-classifying a hand that has barely moved since the last evaluation
+        self.prediction_cache = PredictionCache(epsilon=0.05)
         
         # Learning Mode (RE-ENABLED for real training)
         self.learning_mode = False
@@ -143,6 +186,10 @@ class ASLTranslator:
         
         # Debug mode (can be toggled with 'D' key)
         self.debug_mode = False
+        self.verbose = True  # Per-frame prediction logs (disabled for offline runs)
+        
+        # Pipelined mode: frames allowed to wait in front of each stage
+        self.pipeline_queue_size = 2
     
 
     def load_ml_trainer(self):
@@ -205,9 +252,7 @@ class ASLTranslator:
         h, w, c = img.shape
         
         # Semi-transparent background
-        overlay = img.copy()
-        cv2.rectangle(overlay, (50, 50), (w - 50, h - 50), self.color_bg, -1)
-        img_out = cv2.addWeighted(overlay, 0.9, img, 0.1, 0)
+        img_out = blend_rect(img, (50, 50), (w - 50, h - 50), self.color_bg, 0.9)
         
         # Title
         cv2.putText(img_out, "ASL LETTER GUIDE (Back of Hand View)", (80, 100), 
@@ -280,9 +325,7 @@ class ASLTranslator:
         h, w, c = img.shape
         
         # Create semi-transparent overlay for header
-        overlay = img.copy()
-        cv2.rectangle(overlay, (0, 0), (w, 80), self.color_bg, -1)
-        cv2.addWeighted(overlay, 0.7, img, 0.3, 0, img)
+        blend_rect(img, (0, 0), (w, 80), self.color_bg, 0.7)
         
         # ML Status Indicator (top-left corner)
         ml_status = "🤖 ML: ON" if self.ml_enabled else "⚠️  ML: OFF"
@@ -303,10 +346,7 @@ class ASLTranslator:
         info_y = 100
         
         # Semi-transparent info box
-        overlay = img.copy()
-        cv2.rectangle(overlay, (info_x - 10, info_y - 10), 
-                     (w - 10, info_y + 200), self.color_bg, -1)
-        cv2.addWeighted(overlay, 0.7, img, 0.3, 0, img)
+        blend_rect(img, (info_x - 10, info_y - 10), (w - 10, info_y + 200), self.color_bg, 0.7)
         
         # Hand orientation indicator
         hand_status = "BACK" if is_back_of_hand else "PALM"
@@ -379,10 +419,7 @@ class ASLTranslator:
         box_height = 60
         box_y = h - box_height - 140
         
-        overlay = img.copy()
-        cv2.rectangle(overlay, (20, box_y), (w - 20, box_y + box_height), 
-                     self.color_bg, -1)
-        cv2.addWeighted(overlay, 0.7, img, 0.3, 0, img)
+        blend_rect(img, (20, box_y), (w - 20, box_y + box_height), self.color_bg, 0.7)
         
         # Title
         cv2.putText(img, "Recent Gestures:", (30, box_y + 25), 
@@ -519,9 +556,7 @@ class ASLTranslator:
         h, w, c = img.shape
         
         # Semi-transparent background
-        overlay = img.copy()
-        cv2.rectangle(overlay, (50, 50), (w - 50, h - 50), self.color_bg, -1)
-        img_out = cv2.addWeighted(overlay, 0.9, img, 0.1, 0)
+        img_out = blend_rect(img, (50, 50), (w - 50, h - 50), self.color_bg, 0.9)
         
         # Title
         cv2.putText(img_out, "SESSION STATISTICS", (w // 2 - 200, 120), 
@@ -550,9 +585,7 @@ class ASLTranslator:
         h, w, c = img.shape
         
         # Create semi-transparent overlay for header
-        overlay = img.copy()
-        cv2.rectangle(overlay, (0, 0), (w, 80), self.color_bg, -1)
-        cv2.addWeighted(overlay, 0.7, img, 0.3, 0, img)
+        blend_rect(img, (0, 0), (w, 80), self.color_bg, 0.7)
         
         # Display translated text with better formatting
         text_display = self.current_text if self.current_text else "Start signing..."
@@ -567,10 +600,7 @@ class ASLTranslator:
         info_y = 100
         
         # Semi-transparent info box
-        overlay = img.copy()
-        cv2.rectangle(overlay, (info_x - 10, info_y - 10), 
-                     (w - 10, info_y + 200), self.color_bg, -1)
-        cv2.addWeighted(overlay, 0.7, img, 0.3, 0, img)
+        blend_rect(img, (info_x - 10, info_y - 10), (w - 10, info_y + 200), self.color_bg, 0.7)
         
         # Hand orientation indicator
         hand_status = "BACK" if is_back_of_hand else "PALM"
@@ -666,23 +696,29 @@ class ASLTranslator:
         return img
     
     def start_recording(self, frame_width, frame_height):
-        """Start video recording"""
+        """Start video recording (encoding runs on a background thread)"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"asl_recording_{timestamp}.mp4"
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-        self.video_writer = cv2.VideoWriter(filename, fourcc, 20.0, (frame_width, frame_height))
+        # Raw camera frames are un-mirrored; flip them so recordings look like the display
+        self.recorder = AsyncVideoRecorder(filename, (frame_width, frame_height),
+                                           fps=self.recording_fps, scale=self.recording_scale,
+                                           policy=self.recording_policy, mirror=self.record_raw).start()
         self.recording = True
         self.recording_start_time = time.time()
-        print(f"🎥 Recording started: {filename}")
+        print(f"🎥 Recording started: {filename}" + (" (raw frames)" if self.record_raw else ""))
     
     def stop_recording(self):
         """Stop video recording"""
-        if self.video_writer:
-            self.video_writer.release()
-            self.video_writer = None
         self.recording = False
+        stats = None
+        if self.recorder:
+            stats = self.recorder.stop()
+            self.recorder = None
         duration = time.time() - self.recording_start_time
         print(f"🎥 Recording stopped (Duration: {duration:.1f}s)")
+        if stats:
+            print(f"   {stats['written']} frames written, {stats['dropped']} dropped (writer busy), "
+                  f"{stats['repeated']} repeated / {stats['skipped']} skipped for constant frame rate")
     
     def draw_practice_mode(self, img):
         """Draw practice mode interface"""
@@ -692,9 +728,7 @@ class ASLTranslator:
         h, w, c = img.shape
         
         # Draw semi-transparent overlay
-        overlay = img.copy()
-        cv2.rectangle(overlay, (w//2 - 300, 50), (w//2 + 300, 250), (40, 40, 40), -1)
-        img = cv2.addWeighted(overlay, 0.8, img, 0.2, 0)
+        img = blend_rect(img, (w//2 - 300, 50), (w//2 + 300, 250), (40, 40, 40), 0.8)
         
         # Title
         cv2.putText(img, "PRACTICE MODE", (w//2 - 200, 100), 
@@ -795,14 +829,807 @@ class ASLTranslator:
             print(f"❌ Error processing label: {e}")
             return False
     
-    def run(self):
-        """Main loop for the ASL translator with OPTIMIZED performance"""
+    def detect_frame(self, img, mirror=True, draw=True):
+        """
+        Detection stage: mirror the camera frame and find hand landmarks
+        
+        Args:
+            img: Raw camera frame (BGR)
+            mirror: Flip horizontally (webcam mirror effect)
+            draw: Draw hand landmarks on the frame
+        
+        Returns:
+            (annotated image, landmarks)
+        """
+        # Raw recording takes the camera frame before any processing or overlays
+        if self.recording and self.recorder and self.record_raw:
+            self.recorder.write(img, copy=False)
+        
+        # Detect hands with enhanced visuals (flipped for mirror effect)
+        img = self.detector.find_hands(img, draw=draw, mirror=mirror)
+        hand_no = self.select_player_hand() if self.multiplayer_enabled else 0
+        landmarks = self.detector.find_position(img, hand_no)
+        
+        return img, landmarks
+    
+    def select_player_hand(self):
+        """
+        Pick which hand to classify in multiplayer mode and bind new tracks to players
+        
+        The active hand stays the same track while it is visible, so a held
+        letter is never interrupted by the other signer; when it disappears
+        the first visible hand takes over.
+        
+        Returns:
+            hand_no of the active hand (0 when no hand is visible)
+        """
+        track_ids = [self.detector.get_track_id(hand_no) for hand_no in range(len(self.detector.hand_tracks))]
+        
+        # Forget players whose hand has been gone long enough for its track to be dropped
+        self.player_tracks = {tid: player for tid, player in self.player_tracks.items()
+                              if tid in self.detector.tracks}
+        for track_id in track_ids:
+            if track_id not in self.player_tracks:
+                taken = set(self.player_tracks.values())
+                free = [player for player in (1, 2) if player not in taken]
+                if free:
+                    self.player_tracks[track_id] = free[0]
+        
+        if self.active_track not in track_ids:
+            self.active_track = track_ids[0] if track_ids else None
+        return track_ids.index(self.active_track) if self.active_track is not None else 0
+    
+    def evaluate_hand(self, img, landmarks):
+        """
+        Full ML evaluation of one hand: finger states, hand crop + HOG, model prediction
+        
+        Args:
+            img: Frame the landmarks belong to
+            landmarks: Landmarks or HandGeometry of the hand
+        
+        Returns:
+            (finger_states, ml_prediction, ml_confidence)
+        """
+        # Get finger states for prediction
+        finger_states = self.detector.get_finger_states(landmarks)
+        
+        # Extract hand region for HOG features
+        hand_image = None
+        try:
+            h_img, w_img = img.shape[:2]
+            x_coords = landmarks.xs
+            y_coords = landmarks.ys
+            x_min = max(0, int(x_coords.min() * w_img) - 40)
+            x_max = min(w_img, int(x_coords.max() * w_img) + 40)
+            y_min = max(0, int(y_coords.min() * h_img) - 40)
+            y_max = min(h_img, int(y_coords.max() * h_img) + 40)
+            
+            # Validate dimensions
+            if x_max > x_min and y_max > y_min and x_max <= w_img and y_max <= h_img:
+                hand_image = img[y_min:y_max, x_min:x_max]
+                # Verify image is not empty
+                if hand_image.size == 0:
+                    hand_image = None
+        except Exception as e:
+            pass  # If cropping fails, proceed without image features
+        
+        # Predict with landmarks, finger states, AND hand image
+        ml_prediction, ml_confidence = self.ml_trainer.predict(landmarks, finger_states, hand_image)
+        
+        # Apply rule-based corrections for V vs W confusion
+        if ml_prediction in ['V', 'W'] and finger_states:
+            finger_count = sum([
+                finger_states.get('thumb', False),
+                finger_states.get('index', False),
+                finger_states.get('middle', False),
+                finger_states.get('ring', False),
+                finger_states.get('pinky', False)
+            ])
+            
+            # V should have exactly 2 fingers (index + middle)
+            # W should have exactly 3 fingers (index + middle + ring)
+            if ml_prediction == 'W' and finger_count == 2:
+                # Likely V, not W
+                if finger_states.get('index') and finger_states.get('middle') and not finger_states.get('ring'):
+                    if self.verbose:
+                        print(f"🔧 Correcting W→V (only 2 fingers detected)")
+                    ml_prediction = 'V'
+                    ml_confidence *= 0.9  # Slightly reduce confidence
+            elif ml_prediction == 'V' and finger_count == 3:
+                # Likely W, not V
+                if finger_states.get('index') and finger_states.get('middle') and finger_states.get('ring'):
+                    if self.verbose:
+                        print(f"🔧 Correcting V→W (3 fingers detected)")
+                    ml_prediction = 'W'
+                    ml_confidence *= 0.9
+        
+        return finger_states, ml_prediction, ml_confidence
+    
+    def classify_frame(self, img, landmarks, current_time=None, hand_stable=None):
+        """
+        Classification stage: ML prediction plus hold-time letter insertion
+        
+        Args:
+            img: Frame returned by detect_frame (used to crop the hand for HOG)
+            landmarks: Landmarks returned by detect_frame
+            current_time: Clock used for hold time and cooldown (default: time.time())
+            hand_stable: Detector stability captured with this frame (default: read
+                         the detector now - only correct when stages run serially)
+        
+        Returns:
+            Dict describing this frame's result for the render stage
+        """
+        if current_time is None:
+            current_time = time.time()
+        if hand_stable is None:
+            hand_stable = self.detector.is_hand_stable
+        
+        # OPTIMIZED: one HandGeometry per frame, shared by every consumer below and by
+        # the render stage, so distances, angles and finger states are computed once
+        geometry = as_geometry(landmarks) if landmarks else None
+        
+        # Check if back of hand
+        is_back_of_hand = self.detector.is_back_of_hand(geometry) if geometry else False
+        
+        # Classify letter if hand detected
+        # Note: Stability check is now more lenient (15% threshold)
+        current_letter = ""
+        confidence = 0.0
+        ml_prediction = None
+        ml_confidence = 0.0
+        
+        if landmarks and not self.learning_mode:  # Skip in learning mode
+            # ONLY use ML prediction - no rule-based classifier
+            if self.ml_enabled and self.ml_trainer:
+                # OPTIMIZED: While the hand is held still, reuse the last finger states
+                # and prediction instead of re-running the crop, HOG and model
+                model = self.ml_trainer.model
+                evaluation = self.prediction_cache.lookup(geometry.points, model)
+                if evaluation is None:
+                    evaluation = self.evaluate_hand(img, geometry)
+                    self.prediction_cache.store(geometry.points, evaluation, model)
+                finger_states, ml_prediction, ml_confidence = evaluation
+                
+                if ml_confidence > self.ml_confidence_threshold:
+                    current_letter = ml_prediction
+                    confidence = ml_confidence
+                    if self.verbose:
+                        print(f"🤖 ML prediction: {ml_prediction} ({ml_confidence:.2%})")
+            # If no ML model trained, no letters will be detected
+            
+            self.last_confidence = confidence
+            
+            # Boost confidence if hand is stable
+            if confidence > 0 and hand_stable:
+                stability_bonus = 0.05
+                confidence = min(confidence + stability_bonus, 1.0)
+            
+            # Show detections with STRICT threshold
+            if current_letter and confidence > 0.65 and self.verbose:  # STRICT: Only show high confidence
+                stability_status = "stable" if hand_stable else "moving"
+                print(f"👁️  Detected: {current_letter} (confidence: {confidence:.2f}, hand: {stability_status})")
+            
+            # Add to gesture timeline - STRICT threshold
+            if current_letter and confidence > 0.60:  # STRICT: High confidence for timeline
+                if not self.gesture_timeline or self.gesture_timeline[-1][0] != current_letter:
+                    self.gesture_timeline.append((current_letter, confidence))
+                    self.total_gestures_detected += 1
+            elif confidence < 0.65:  # STRICT: Reject low confidence
+                # Low confidence - ignore
+                current_letter = ""
+                confidence = 0.0
+        
+        # PRACTICE MODE: Check if detected letter matches target (STRICT)
+        if self.practice_mode and current_letter and confidence > 0.75:  # STRICT: High confidence required
+            if self.check_practice_letter(current_letter):
+                current_letter = ""  # Reset after successful match
+        
+        # Handle letter detection with hold time (only in normal mode)
+        time_held = 0
+        show_progress = False
+        cooldown_remaining = 0
+        
+        # Check if we're still in cooldown period
+        time_since_last_letter = current_time - self.last_letter_added_time
+        in_cooldown = time_since_last_letter < self.letter_cooldown
+        
+        if current_letter and current_letter != "" and not self.practice_mode:
+            if in_cooldown:
+                # Still in cooldown - render stage shows the cooldown indicator
+                cooldown_remaining = self.letter_cooldown - time_since_last_letter
+                self.last_letter = ""  # Reset to prevent starting hold during cooldown
+            elif current_letter == self.last_letter:
+                # Same letter held (and not in cooldown)
+                time_held = current_time - self.letter_start_time
+                show_progress = True
+                
+                if time_held >= self.hold_time:
+                    # Add letter to text
+                    with self.text_lock:
+                        self.current_text += current_letter
+                        if self.multiplayer_enabled:
+                            self.add_player_letter(current_letter)
+                        self.letter_history.append(current_letter)
+                    self.letters_added += 1
+                    self.last_letter = ""
+                    self.letter_start_time = current_time
+                    self.last_letter_added_time = current_time  # Start cooldown
+                    self.play_sound('letter')
+                    
+                    # Check for word completion
+                    suggestions = self.get_word_suggestions()
+                    if suggestions:
+                        print(f"✅ Added: '{current_letter}' | Text: {self.current_text} | Suggestions: {', '.join(suggestions)}")
+                    else:
+                        print(f"✅ Added: '{current_letter}' | Text: {self.current_text}")
+            else:
+                # New letter detected (and not in cooldown)
+                self.last_letter = current_letter
+                self.letter_start_time = current_time
+        else:
+            # No valid letter detected
+            self.last_letter = ""
+        
+        # Update analytics
+        if current_letter and confidence > 0:
+            self.analytics['avg_confidence'].append(confidence)
+            if len(self.analytics['avg_confidence']) > 100:
+                self.analytics['avg_confidence'].pop(0)
+        
+        return {
+            'letter': current_letter,
+            'confidence': confidence,
+            'is_back_of_hand': is_back_of_hand,
+            'geometry': geometry,
+            'hand_stable': hand_stable,
+            'time_held': time_held,
+            'show_progress': show_progress,
+            'cooldown_remaining': cooldown_remaining
+        }
+    
+    def add_player_letter(self, letter):
+        """
+        Append a letter to the text of the player signing the active hand
+        
+        Args:
+            letter: Letter just inserted into current_text
+        """
+        player = self.player_tracks.get(self.active_track)
+        if player == 1:
+            self.player1_text += letter
+        elif player == 2:
+            self.player2_text += letter
+        if player:
+            print(f"👥 Player {player}: {self.player1_text if player == 1 else self.player2_text}")
+    
+    def render_frame(self, img, landmarks, result):
+        """
+        Render stage: draw every UI overlay for one frame
+        
+        Args:
+            img: Frame returned by detect_frame
+            landmarks: Landmarks returned by detect_frame
+            result: Dict returned by classify_frame
+        
+        Returns:
+            Image ready for display
+        """
+        current_letter = result['letter']
+        confidence = result['confidence']
+        is_back_of_hand = result['is_back_of_hand']
+        current_time = time.time()
+        
+        # ALWAYS show finger status panel when hand is detected
+        # (the frame's HandGeometry already holds the finger states when ML ran)
+        if landmarks:
+            img = self.detector.draw_finger_state_indicator(img, result.get('geometry') or landmarks, 10, 200)
+        
+        # ========== LEARNING MODE LOGIC (SIMPLIFIED) ==========
+        if self.learning_mode and landmarks:
+            # Show training UI
+            h_learn, w_learn = img.shape[:2]
+            
+            if self.current_training_letter:
+                # Currently training a specific letter
+                count = self.training_count.get(self.current_training_letter, 0)
+                
+                # Show training info
+                cv2.rectangle(img, (10, 10), (w_learn - 10, 180), (0, 100, 200), -1)
+                cv2.putText(img, f"TRAINING: {self.current_training_letter}", (w_learn//2 - 150, 50),
+                           cv2.FONT_HERSHEY_DUPLEX, 1.5, (255, 255, 255), 3, cv2.LINE_AA)
+                cv2.putText(img, f"Samples collected: {count}", (w_learn//2 - 150, 100),
+                           cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2, cv2.LINE_AA)
+                
+                # Show expected finger states for A, V, W
+                expected_hints = {
+                    'A': 'Expected: 0 fingers UP (closed fist)',
+                    'V': 'Expected: 2 fingers UP (Index + Middle)',
+                    'W': 'Expected: 3 fingers UP (Index + Middle + Ring)'
+                }
+                if self.current_training_letter in expected_hints:
+                    cv2.putText(img, expected_hints[self.current_training_letter], 
+                               (w_learn//2 - 300, 130),
+                               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2, cv2.LINE_AA)
+                
+                if result['hand_stable']:
+                    cv2.putText(img, "Press ENTER to capture this gesture!", (w_learn//2 - 250, 165),
+                               cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2, cv2.LINE_AA)
+                else:
+                    cv2.putText(img, "Hold STILL to capture...", (w_learn//2 - 200, 165),
+                               cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 165, 255), 2, cv2.LINE_AA)
+            else:
+                # No letter selected yet
+                cv2.rectangle(img, (10, 10), (w_learn - 10, 180), (100, 0, 100), -1)
+                cv2.putText(img, "LEARNING MODE ACTIVE", (w_learn//2 - 200, 50),
+                           cv2.FONT_HERSHEY_DUPLEX, 1.2, (0, 255, 255), 2, cv2.LINE_AA)
+                cv2.putText(img, "Press any letter key (A-Z) to start training", (w_learn//2 - 300, 100),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2, cv2.LINE_AA)
+                cv2.putText(img, "Then press ENTER to capture each sample", (w_learn//2 - 280, 150),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2, cv2.LINE_AA)
+        
+        # Hold-time feedback
+        h, w = img.shape[:2]
+        if result['cooldown_remaining'] > 0:
+            cv2.putText(img, f"Cooldown: {result['cooldown_remaining']:.1f}s",
+                       (w//2 - 100, h - 50),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, self.color_warning, 2, cv2.LINE_AA)
+        elif result['show_progress']:
+            # Draw circular progress indicator
+            img = self.draw_progress_indicator(img, result['time_held'], self.hold_time)
+        
+        # Draw enhanced UI overlay
+        img = self.draw_ui_overlay(img, current_letter, confidence, is_back_of_hand)
+        
+        # Draw gesture timeline
+        img = self.draw_gesture_timeline(img)
+        
+        # Draw word suggestions
+        img = self.draw_word_suggestions(img)
+        
+        # Show greeting animation if wave was recently detected
+        if current_time < self.greeting_end_time:
+            img = self.show_wave_greeting(img)
+        
+        # Show practice mode overlay if enabled
+        if self.practice_mode:
+            img = self.draw_practice_mode(img)
+        
+        # Show help overlay if enabled
+        if self.show_help:
+            img = self.draw_help_overlay(img)
+        
+        # Show stats overlay if enabled
+        if self.show_stats:
+            img = self.draw_stats_overlay(img)
+        
+        # Show recording indicator if recording
+        if self.recording:
+            cv2.circle(img, (30, 30), 10, (0, 0, 255), -1)
+            cv2.putText(img, "REC", (50, 40), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2, cv2.LINE_AA)
+            duration = int(time.time() - self.recording_start_time)
+            cv2.putText(img, f"{duration}s", (100, 40), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1, cv2.LINE_AA)
+        
+        # Show stability indicator
+        if landmarks:
+            stability_text = "STABLE" if result['hand_stable'] else "MOVING"
+            stability_color = (0, 255, 0) if result['hand_stable'] else (0, 165, 255)
+            cv2.putText(img, stability_text, (img.shape[1] - 150, 60), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, stability_color, 2, cv2.LINE_AA)
+        
+        # Calculate and display FPS
+        curr_time = time.time()
+        fps = 1 / (curr_time - self.prev_frame_time) if self.prev_frame_time != 0 else 0
+        self.prev_frame_time = curr_time
+        
+        cv2.putText(img, f"FPS: {int(fps)}", (img.shape[1] - 150, 30), 
+                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.color_warning, 2, cv2.LINE_AA)
+        
+        # Queue frame for the background recorder (img is a reused buffer, so it's copied)
+        if self.recording and self.recorder and not self.record_raw:
+            self.recorder.write(img)
+        
+        return img
+    
+    def handle_key(self, key, landmarks, cap, hand_stable=None):
+        """
+        Handle one keyboard event from the display window
+        
+        Args:
+            key: Key code from cv2.waitKey (255 = no key)
+            landmarks: Landmarks of the frame currently on screen
+            cap: Frame source (used to grab a clean frame for training photos)
+            hand_stable: Detector stability of the frame on screen (default: read the detector now)
+        
+        Returns:
+            False when the user asked to quit, True otherwise
+        """
+        if hand_stable is None:
+            hand_stable = self.detector.is_hand_stable
+        
+        # DEBUG: Show key code when in learning mode (if debug enabled)
+        if self.debug_mode and key != 255 and self.learning_mode:
+            print(f"🔍 Key pressed: {key} (char: '{chr(key) if 32 <= key <= 126 else '?'}')")
+        
+        if key == ord('q'):
+            print("\n" + "=" * 60)
+            print("👋 Exiting without saving...")
+            print(f"📝 Final text: {self.current_text}")
+            print("=" * 60)
+            return False
+        elif key == 27:  # ESC key
+            print("\n" + "=" * 60)
+            print("💾 Saving and exiting...")
+            filename = self.save_to_file()
+            if filename:
+                print(f"✅ Saved to: {filename}")
+            print(f"📝 Final text: {self.current_text}")
+            print("=" * 60)
+            return False
+        elif key == ord(' '):
+            with self.text_lock:
+                self.current_text += " "
+            print(f"➕ Added space | Text: {self.current_text}")
+        elif key == 8 or key == 127:  # Backspace or Delete
+            with self.text_lock:
+                deleted = self.current_text[-1] if self.current_text else None
+                self.current_text = self.current_text[:-1]
+            if deleted:
+                print(f"⬅️  Deleted: '{deleted}' | Text: {self.current_text}")
+        elif key == ord('c') or key == ord('C'):
+            with self.text_lock:
+                self.current_text = ""
+                self.player1_text = ""
+                self.player2_text = ""
+                self.letter_history.clear()
+            print("🗑️  Cleared all text")
+        elif key == ord('h') or key == ord('H'):
+            self.show_help = not self.show_help
+            print(f"📚 Help {'shown' if self.show_help else 'hidden'}")
+        elif key == ord('s') or key == ord('S'):
+            self.show_stats = not self.show_stats
+            print(f"📊 Statistics {'shown' if self.show_stats else 'hidden'}")
+        
+        # GAMIFICATION FEATURES DISABLED (keys 1-8)
+        # elif key in [ord('1'), ord('2'), ord('3')]:
+        #     # Accept word suggestion
+        #     suggestions = self.get_word_suggestions()
+        #     suggestion_idx = int(chr(key)) - 1
+        #     if suggestion_idx < len(suggestions):
+        #         words = self.current_text.split()
+        #         if words:
+        #             words[-1] = suggestions[suggestion_idx]
+        #             self.current_text = " ".join(words) + " "
+        #             print(f"✨ Accepted suggestion: {suggestions[suggestion_idx]}")
+        # elif key == ord('4'):
+        #     # Toggle practice mode
+        # elif key == ord('5'):
+        #     # Toggle recording
+        # elif key == ord('6'):
+        #     # Toggle voice output
+        # elif key == ord('7'):
+        #     # Add last word to custom dictionary
+        # elif key == ord('8'):
+        #     # Show gamification stats
+        
+        # Debug mode toggle (Press 'D')
+        elif key == ord('d') or key == ord('D'):
+            self.debug_mode = not self.debug_mode
+            if self.debug_mode:
+                print("\n🔍 DEBUG MODE ENABLED - Detailed logs will be shown")
+            else:
+                print("\n🔍 DEBUG MODE DISABLED - Clean output")
+        
+        # Direct letter typing mode (Press 'T') - TYPE LETTERS DIRECTLY
+        elif key == ord('t') or key == ord('T'):
+            if self.learning_mode:
+                self.direct_letter_mode = not self.direct_letter_mode
+                if self.direct_letter_mode:
+                    print("\n⌨️  DIRECT LETTER MODE ENABLED")
+                    print("💡 Now you can press A-Z keys directly to select letters!")
+                    print("💡 Press T again to go back to number keys")
+                else:
+                    print("\n⌨️  DIRECT LETTER MODE DISABLED")
+                    print("💡 Use number keys (3-9, 0) to select letters")
+            else:
+                print("\n⚠️  You must be in training mode first!")
+                print("💡 Press 1 to enter training mode")
+        
+        # Learning mode (Press '1') - ENTER TRAINING MODE
+        elif key == 49:  # Key '1'
+            self.learning_mode = not self.learning_mode
+            if not self.learning_mode:
+                self.current_training_letter = None
+                self.direct_letter_mode = False  # Reset when exiting
+                print("\n❌ Training mode deactivated")
+                print("💡 Press 1 again to re-enter training mode")
+            else:
+                print("\n" + "=" * 60)
+                print("🎓 TRAINING MODE ACTIVATED")
+                print("=" * 60)
+                print("📝 Instructions:")
+                print("  • Press T to enable DIRECT LETTER TYPING (A-Z keys)")
+                print("  • OR use NUMBER keys (3-9, 0) to select letters:")
+                print("    3=A/K/U  4=B/L/V  5=C/M/W  6=D/N/X  7=E/O/Y")
+                print("    8=F/P/Z  9=G/Q    0=H/R/I/S/J/T")
+                print("  • Make ASL sign and hold steady")
+                print("  • Press ENTER repeatedly to capture 15-20 samples")
+                print("  • Press 2 when done to TRAIN THE MODEL")
+                print("  • Press 1 to exit training mode")
+                print("\n💡 TIP: Photos auto-cropped to hand region only!")
+                print("=" * 60)
+        
+        # Train ML model (Press '2') - TRAIN MODEL
+        elif key == 50:  # Key '2'
+            print("\n🧠 TRAINING MODEL (with automatic outlier removal)...")
+            if self.load_ml_trainer():
+                result = self.ml_trainer.bulk_train_with_outlier_removal()
+                # Result is a tuple (accuracy, outliers_dict)
+                if result and result[0]:  # Check if accuracy is not None
+                    accuracy, outliers = result
+                    self.ml_enabled = True
+                    self.learning_mode = False  # Exit learning mode
+                    self.current_training_letter = None
+                    print(f"✅ Model trained! Accuracy: {accuracy:.2%}")
+                    print("🎉 ML model is now ACTIVE and ready to use!")
+                    print("💡 Make ASL gestures and the model will recognize them!")
+                else:
+                    print("❌ Training failed - need more samples")
+                    print("💡 TIP: Capture at least 10 samples for 2+ different letters")
+        
+        # Bulk train with outlier removal (Press 'B') - Check BEFORE letter key handling
+        elif key == ord('b') or key == ord('B'):
+            print("\n🚀 BULK TRAINING with outlier removal...")
+            if self.load_ml_trainer():
+                result = self.ml_trainer.bulk_train_with_outlier_removal()
+                # Result is a tuple (accuracy, outliers_dict)
+                if result and result[0]:  # Check if accuracy is not None
+                    accuracy, outliers = result
+                    self.ml_enabled = True
+                    self.learning_mode = False  # Exit learning mode
+                    self.current_training_letter = None
+                    print(f"✅ Model trained! Accuracy: {accuracy:.2%}")
+                    print("🎉 ML model is now ACTIVE and ready to use!")
+                    print("💡 Make ASL gestures and the model will recognize them!")
+                else:
+                    print("❌ Training failed - need more samples")
+                    print("💡 TIP: Capture at least 10 samples for 2+ different letters")
+        
+        # Handle A-Z key presses in DIRECT LETTER MODE
+        elif self.learning_mode and self.direct_letter_mode and (65 <= key <= 90 or 97 <= key <= 122):
+            letter = chr(key).upper()
+            self.current_training_letter = letter
+            count = self.training_count.get(letter, 0)
+            print(f"\n🎯 Selected letter: {letter} (Current samples: {count})")
+            print("💡 Make the gesture and press ENTER to capture")
+        
+        # Handle NUMBER key presses in learning mode (3-9, 0 to select letters)
+        elif self.learning_mode and not self.direct_letter_mode and (48 == key or (51 <= key <= 57)):  # Keys 0, 3-9
+            number = key - 48  # Convert to 0-9
+            
+            # Skip keys 1 and 2 (they're commands)
+            if number in [1, 2]:
+                return True
+            
+            # Get available letters for this number
+            available_letters = self.number_to_letters.get(number, [])
+            if not available_letters:
+                print(f"⚠️  No letters mapped to key {number}")
+                print("💡 Use keys 3-9 or 0 to select letters")
+                return True
+            
+            # Cycle through letters for this number
+            if number not in self.current_number_index:
+                self.current_number_index[number] = 0
+            else:
+                self.current_number_index[number] = (self.current_number_index[number] + 1) % len(available_letters)
+            
+            letter = available_letters[self.current_number_index[number]]
+            self.current_training_letter = letter
+            count = self.training_count.get(letter, 0)
+            
+            # Show all available letters for this number
+            letters_str = " → ".join(available_letters)
+            print(f"\n🎯 Key {number}: {letters_str}")
+            print(f"   Now training: {letter} (Current samples: {count})")
+            print(f"💡 Press {number} again to cycle, or press ENTER to capture")
+        
+        # Warning if number key pressed while NOT in learning mode
+        elif not self.learning_mode and (48 == key or (51 <= key <= 57)):
+            number = key - 48
+            if number not in [1, 2]:  # Don't warn for commands
+                print(f"\n⚠️  Key '{number}' pressed but NOT in training mode!")
+                print("💡 Press 1 to enter TRAINING MODE first")
+        
+        # Handle ENTER key to capture gesture in learning mode
+        elif self.learning_mode and key == 13 and self.current_training_letter:  # ENTER key
+            if landmarks and hand_stable:
+                # Load ML trainer if needed
+                if not self.ml_trainer_loaded:
+                    self.load_ml_trainer()
+                
+                if self.ml_trainer_loaded:
+                    # Get finger states
+                    finger_states = self.detector.get_finger_states(landmarks)
+                    
+                    # Add training sample WITH finger states
+                    success = self.ml_trainer.add_training_sample(
+                        landmarks, 
+                        self.current_training_letter,
+                        finger_states=finger_states
+                    )
+                    
+                    if success:
+                        if self.current_training_letter not in self.training_count:
+                            self.training_count[self.current_training_letter] = 0
+                        self.training_count[self.current_training_letter] += 1
+                        count = self.training_count[self.current_training_letter]
+                        
+                        # IMPROVED PHOTO CAPTURE - Only hand region, no overlays
+                        photo_saved = False
+                        photo_path = None
+                        
+                        # Always show photo capture attempt
+                        print(f"\n📸 Capturing photo for {self.current_training_letter}...")
+                        if self.debug_mode:
+                            print(f"🔍 DEBUG: Starting photo capture for {self.current_training_letter}")
+                        try:
+                            import os
+                            import datetime
+                            
+                            # Create training_photos directory if it doesn't exist
+                            photo_dir = "training_photos"
+                            if not os.path.exists(photo_dir):
+                                os.makedirs(photo_dir)
+                                if self.debug_mode:
+                                    print(f"📁 Created directory: {photo_dir}")
+                            
+                            # Create letter-specific subdirectory
+                            letter_dir = os.path.join(photo_dir, self.current_training_letter)
+                            if not os.path.exists(letter_dir):
+                                os.makedirs(letter_dir)
+                                if self.debug_mode:
+                                    print(f"📁 Created directory: {letter_dir}")
+                            
+                            if self.debug_mode:
+                                print(f"🔍 DEBUG: Directories created. Letter dir: {letter_dir}")
+                            
+                            # Generate timestamp filename
+                            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+                            
+                            if self.debug_mode:
+                                print(f"🔍 DEBUG: Capturing fresh frame from camera...")
+                            # Capture a FRESH frame without overlays
+                            ret_clean, img_clean = cap.read()
+                            if self.debug_mode:
+                                print(f"🔍 DEBUG: Frame capture result: {ret_clean}, shape: {img_clean.shape if ret_clean else 'None'}")
+                            
+                            if not ret_clean or img_clean is None:
+                                raise ValueError("Failed to capture clean frame from camera")
+                            
+                            # Flip the frame
+                            img_clean = cv2.flip(img_clean, 1)
+                            h_img, w_img = img_clean.shape[:2]
+                            if self.debug_mode:
+                                print(f"🔍 DEBUG: Frame flipped. Size: {w_img}x{h_img}")
+                            
+                            # Extract hand bounding box from landmarks
+                            x_coords = landmarks.xs
+                            y_coords = landmarks.ys
+                            
+                            x_min = max(0, int(x_coords.min() * w_img) - 40)
+                            x_max = min(w_img, int(x_coords.max() * w_img) + 40)
+                            y_min = max(0, int(y_coords.min() * h_img) - 40)
+                            y_max = min(h_img, int(y_coords.max() * h_img) + 40)
+                            
+                            if self.debug_mode:
+                                print(f"🔍 DEBUG: Crop region: x[{x_min}:{x_max}], y[{y_min}:{y_max}]")
+                            
+                            # Validate coordinates
+                            if x_max <= x_min or y_max <= y_min:
+                                raise ValueError(f"Invalid crop coordinates: x[{x_min}:{x_max}], y[{y_min}:{y_max}]")
+                            
+                            # Crop to hand region
+                            hand_only = img_clean[y_min:y_max, x_min:x_max].copy()
+                            if self.debug_mode:
+                                print(f"🔍 DEBUG: Cropped hand image shape: {hand_only.shape}")
+                            
+                            # Validate crop is not empty
+                            if hand_only.size == 0:
+                                raise ValueError("Cropped region is empty")
+                            
+                            # Save hand-only photo
+                            filename_hand = os.path.join(letter_dir, f"{self.current_training_letter}_{count:03d}_{timestamp}_hand.jpg")
+                            if self.debug_mode:
+                                print(f"🔍 DEBUG: Attempting to save to: {filename_hand}")
+                            
+                            success_write = cv2.imwrite(filename_hand, hand_only)
+                            if self.debug_mode:
+                                print(f"🔍 DEBUG: cv2.imwrite result: {success_write}")
+                            
+                            if success_write:
+                                photo_saved = True
+                                photo_path = filename_hand
+                                print(f"📸 ✅ Photo saved successfully: {filename_hand}")
+                            else:
+                                raise ValueError("cv2.imwrite returned False")
+                        
+                        except Exception as e:
+                            print(f"❌ Photo save failed with error: {e}")
+                            import traceback
+                            traceback.print_exc()
+                        
+                        # Save photo path to training sample
+                        if photo_saved and self.ml_trainer_loaded:
+                            # Update the last sample with photo path
+                            if len(self.ml_trainer.training_data) > 0:
+                                self.ml_trainer.training_data[-1]['photo_path'] = photo_path
+                                self.ml_trainer.save_training_data()
+                        
+                        if photo_saved:
+                            print(f"✅ Captured! {self.current_training_letter}: {count} samples (photo + finger states saved)")
+                        else:
+                            print(f"✅ Captured! {self.current_training_letter}: {count} samples (landmarks + finger states saved, photo failed)")
+                        
+                        self.play_sound('success')
+                        
+                        # Suggest when to train
+                        if count == 15:
+                            print("💡 TIP: You have 15 samples - good time to train! Press M or B")
+                    else:
+                        print("❌ Failed to save sample")
+            else:
+                if not landmarks:
+                    print("⚠️  No hand detected! Show your hand to the camera")
+                else:
+                    print("⚠️  Hand not stable! Hold still and try again")
+        
+        elif key == ord('n') or key == ord('N'):
+            # Show ML training statistics
+            if not self.ml_trainer_loaded:
+                if not self.load_ml_trainer():
+                    print("❌ Cannot show stats - ML trainer failed to load")
+                    return True
+            
+            print("\n" + "=" * 60)
+            print("📊 ML TRAINING STATISTICS")
+            print("=" * 60)
+            stats = self.ml_trainer.get_statistics()
+            if stats:
+                print("Samples per letter:")
+                for letter, count in sorted(stats.items()):
+                    bar = "█" * min(count, 50)
+                    print(f"   {letter}: {count:3d} {bar}")
+                print(f"\n📦 Total samples: {len(self.ml_trainer.training_data)}")
+                print(f"🤖 ML enabled: {self.ml_enabled}")
+                if self.ml_trainer.model:
+                    print("✅ Model trained and ready")
+                else:
+                    print("⚠️  Model not trained yet (press 'M' to train)")
+            else:
+                print("📦 No training data collected yet")
+                print("💡 Press 'T' to enter learning mode and capture gestures")
+            print("=" * 60)
+        
+        return True
+    
+    def run(self, pipelined=False):
+        """
+        Main loop for the ASL translator with OPTIMIZED performance
+        
+        Args:
+            pipelined: Run detect/classify/render on separate worker threads
+                       so consecutive frames overlap (multi-core machines)
+        """
         # Initialize webcam with OPTIMIZED settings for better FPS
-        cap = cv2.VideoCapture(0)
+        # Capture runs on its own thread so the loop never waits on camera I/O
+        cap = FrameGrabber(0)
         cap.set(3, 960)   # Width: Reduced from 1280 for better FPS
         cap.set(4, 540)   # Height: Reduced from 720 for better FPS
         cap.set(cv2.CAP_PROP_FPS, 60)  # Request 60 FPS
         cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Minimize buffer lag
+        cap.start()
         
         # Get actual resolution
         actual_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
@@ -844,654 +1671,27 @@ class ASLTranslator:
         print("  • FINGER STATUS panel during training")
         print("  • Automatic photo capture during training")
         print("  • Optimized 40-50 FPS performance")
+        if pipelined:
+            print("  • Pipelined mode: detect → classify → render on worker threads")
         print("=" * 60)
         
-        prev_time = 0
-        greeting_end_time = 0  # Track when to stop showing greeting
-        
-        while True:
-                success, img = cap.read()
-                if not success:
-                    print("❌ Failed to capture video")
-                    continue
-                
-                # Flip image horizontally for mirror effect
-                img = cv2.flip(img, 1)
-                
-                # Detect hands with enhanced visuals
-                img = self.detector.find_hands(img, draw=True)
-                landmarks = self.detector.find_position(img)
-                
-                # Check for wave gesture
-                wave_detected = False
-                current_time = time.time()
-                
-                # Check if back of hand
-                is_back_of_hand = self.detector.is_back_of_hand(landmarks) if landmarks else False
-                
-                # ALWAYS show finger status panel when hand is detected
-                if landmarks:
-                    img = self.detector.draw_finger_state_indicator(img, landmarks, 10, 200)
-                
-                # ========== LEARNING MODE LOGIC (SIMPLIFIED) ==========
-                if self.learning_mode and landmarks:
-                    # Show training UI
-                    h_learn, w_learn = img.shape[:2]
-                    
-                    if self.current_training_letter:
-                        # Currently training a specific letter
-                        count = self.training_count.get(self.current_training_letter, 0)
-                        
-                        # Show training info
-                        cv2.rectangle(img, (10, 10), (w_learn - 10, 180), (0, 100, 200), -1)
-                        cv2.putText(img, f"TRAINING: {self.current_training_letter}", (w_learn//2 - 150, 50),
-                                   cv2.FONT_HERSHEY_DUPLEX, 1.5, (255, 255, 255), 3, cv2.LINE_AA)
-                        cv2.putText(img, f"Samples collected: {count}", (w_learn//2 - 150, 100),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2, cv2.LINE_AA)
-                        
-                        # Show expected finger states for A, V, W
-                        expected_hints = {
-                            'A': 'Expected: 0 fingers UP (closed fist)',
-                            'V': 'Expected: 2 fingers UP (Index + Middle)',
-                            'W': 'Expected: 3 fingers UP (Index + Middle + Ring)'
-                        }
-                        if self.current_training_letter in expected_hints:
-                            cv2.putText(img, expected_hints[self.current_training_letter], 
-                                       (w_learn//2 - 300, 130),
-                                       cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 0), 2, cv2.LINE_AA)
-                        
-                        if self.detector.is_hand_stable:
-                            cv2.putText(img, "Press ENTER to capture this gesture!", (w_learn//2 - 250, 165),
-                                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 0), 2, cv2.LINE_AA)
-                        else:
-                            cv2.putText(img, "Hold STILL to capture...", (w_learn//2 - 200, 165),
-                                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 165, 255), 2, cv2.LINE_AA)
-                    else:
-                        # No letter selected yet
-                        cv2.rectangle(img, (10, 10), (w_learn - 10, 180), (100, 0, 100), -1)
-                        cv2.putText(img, "LEARNING MODE ACTIVE", (w_learn//2 - 200, 50),
-                                   cv2.FONT_HERSHEY_DUPLEX, 1.2, (0, 255, 255), 2, cv2.LINE_AA)
-                        cv2.putText(img, "Press any letter key (A-Z) to start training", (w_learn//2 - 300, 100),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2, cv2.LINE_AA)
-                        cv2.putText(img, "Then press ENTER to capture each sample", (w_learn//2 - 280, 150),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2, cv2.LINE_AA)
-                
-                # Classify letter if hand detected
-                # Note: Stability check is now more lenient (15% threshold)
-                current_letter = ""
-                confidence = 0.0
-                ml_prediction = None
-                ml_confidence = 0.0
-                
-                if landmarks and not self.learning_mode:  # Skip in learning mode
-                    # ONLY use ML prediction - no rule-based classifier
-                    if self.ml_enabled and self.ml_trainer:
-                        # Get finger states for prediction
-                        finger_states = self.detector.get_finger_states(landmarks)
-                        
-                        # Extract hand region for HOG features
-                        hand_image = None
-                        try:
-                            h_img, w_img = img.shape[:2]
-                            x_coords = [lm[1] for lm in landmarks]
-                            y_coords = [lm[2] for lm in landmarks]
-                            x_min = max(0, int(min(x_coords) * w_img) - 40)
-                            x_max = min(w_img, int(max(x_coords) * w_img) + 40)
-                            y_min = max(0, int(min(y_coords) * h_img) - 40)
-                            y_max = min(h_img, int(max(y_coords) * h_img) + 40)
-                            
-                            # Validate dimensions
-                            if x_max > x_min and y_max > y_min and x_max <= w_img and y_max <= h_img:
-                                hand_image = img[y_min:y_max, x_min:x_max]
-                                # Verify image is not empty
-                                if hand_image.size == 0:
-                                    hand_image = None
-                        except Exception as e:
-                            pass  # If cropping fails, proceed without image features
-                        
-                        # Predict with landmarks, finger states, AND hand image
-                        ml_prediction, ml_confidence = self.ml_trainer.predict(landmarks, finger_states, hand_image)
-                        
-                        # Apply rule-based corrections for V vs W confusion
-                        if ml_prediction in ['V', 'W'] and finger_states:
-                            finger_count = sum([
-                                finger_states.get('thumb', False),
-                                finger_states.get('index', False),
-                                finger_states.get('middle', False),
-                                finger_states.get('ring', False),
-                                finger_states.get('pinky', False)
-                            ])
-                            
-                            # V should have exactly 2 fingers (index + middle)
-                            # W should have exactly 3 fingers (index + middle + ring)
-                            if ml_prediction == 'W' and finger_count == 2:
-                                # Likely V, not W
-                                if finger_states.get('index') and finger_states.get('middle') and not finger_states.get('ring'):
-                                    print(f"🔧 Correcting W→V (only 2 fingers detected)")
-                                    ml_prediction = 'V'
-                                    ml_confidence *= 0.9  # Slightly reduce confidence
-                            elif ml_prediction == 'V' and finger_count == 3:
-                                # Likely W, not V
-                                if finger_states.get('index') and finger_states.get('middle') and finger_states.get('ring'):
-                                    print(f"🔧 Correcting V→W (3 fingers detected)")
-                                    ml_prediction = 'W'
-                                    ml_confidence *= 0.9
-                        
-                        if ml_confidence > self.ml_confidence_threshold:
-                            current_letter = ml_prediction
-                            confidence = ml_confidence
-                            print(f"🤖 ML prediction: {ml_prediction} ({ml_confidence:.2%})")
-                    # If no ML model trained, no letters will be detected
-                    
-                    self.last_confidence = confidence
-                    
-                    # Boost confidence if hand is stable
-                    if confidence > 0 and self.detector.is_hand_stable:
-                        stability_bonus = 0.05
-                        confidence = min(confidence + stability_bonus, 1.0)
-                    
-                    # Show detections with STRICT threshold
-                    if current_letter and confidence > 0.65:  # STRICT: Only show high confidence
-                        stability_status = "stable" if self.detector.is_hand_stable else "moving"
-                        print(f"👁️  Detected: {current_letter} (confidence: {confidence:.2f}, hand: {stability_status})")
-                    
-                    # Add to gesture timeline - STRICT threshold
-                    if current_letter and confidence > 0.60:  # STRICT: High confidence for timeline
-                        if not self.gesture_timeline or self.gesture_timeline[-1][0] != current_letter:
-                            self.gesture_timeline.append((current_letter, confidence))
-                            self.total_gestures_detected += 1
-                    elif confidence < 0.65:  # STRICT: Reject low confidence
-                        # Low confidence - ignore
-                        current_letter = ""
-                        confidence = 0.0
-                
-                # PRACTICE MODE: Check if detected letter matches target (STRICT)
-                if self.practice_mode and current_letter and confidence > 0.75:  # STRICT: High confidence required
-                    if self.check_practice_letter(current_letter):
-                        current_letter = ""  # Reset after successful match
-                
-                # Handle letter detection with hold time (only in normal mode)
-                current_time = time.time()
-                time_held = 0
-                
-                # Get image dimensions for cooldown display
-                h, w = img.shape[:2]
-                
-                # Check if we're still in cooldown period
-                time_since_last_letter = current_time - self.last_letter_added_time
-                in_cooldown = time_since_last_letter < self.letter_cooldown
-                
-                if current_letter and current_letter != "" and not self.practice_mode:
-                    if in_cooldown:
-                        # Still in cooldown - show cooldown indicator
-                        cooldown_remaining = self.letter_cooldown - time_since_last_letter
-                        cv2.putText(img, f"Cooldown: {cooldown_remaining:.1f}s", 
-                                   (w//2 - 100, h - 50),
-                                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, self.color_warning, 2, cv2.LINE_AA)
-                        self.last_letter = ""  # Reset to prevent starting hold during cooldown
-                    elif current_letter == self.last_letter:
-                        # Same letter held (and not in cooldown)
-                        time_held = current_time - self.letter_start_time
-                        
-                        # Draw circular progress indicator
-                        img = self.draw_progress_indicator(img, time_held, self.hold_time)
-                        
-                        if time_held >= self.hold_time:
-                            # Add letter to text
-                            self.current_text += current_letter
-                            self.letter_history.append(current_letter)
-                            self.letters_added += 1
-                            self.last_letter = ""
-                            self.letter_start_time = current_time
-                            self.last_letter_added_time = current_time  # Start cooldown
-                            self.play_sound('letter')
-                            
-                            # Check for word completion
-                            suggestions = self.get_word_suggestions()
-                            if suggestions:
-                                print(f"✅ Added: '{current_letter}' | Text: {self.current_text} | Suggestions: {', '.join(suggestions)}")
-                            else:
-                                print(f"✅ Added: '{current_letter}' | Text: {self.current_text}")
-                    else:
-                        # New letter detected (and not in cooldown)
-                        self.last_letter = current_letter
-                        self.letter_start_time = current_time
-                else:
-                    # No valid letter detected
-                    self.last_letter = ""
-                
-                # Draw enhanced UI overlay
-                img = self.draw_ui_overlay(img, current_letter, confidence, is_back_of_hand)
-                
-                # Draw gesture timeline
-                img = self.draw_gesture_timeline(img)
-                
-                # Draw word suggestions
-                img = self.draw_word_suggestions(img)
-                
-                # Show greeting animation if wave was recently detected
-                if current_time < greeting_end_time:
-                    img = self.show_wave_greeting(img)
-                
-                # Show practice mode overlay if enabled
-                if self.practice_mode:
-                    img = self.draw_practice_mode(img)
-                
-                # Show help overlay if enabled
-                if self.show_help:
-                    img = self.draw_help_overlay(img)
-                
-                # Show stats overlay if enabled
-                if self.show_stats:
-                    img = self.draw_stats_overlay(img)
-                
-                # Show recording indicator if recording
-                if self.recording:
-                    cv2.circle(img, (30, 30), 10, (0, 0, 255), -1)
-                    cv2.putText(img, "REC", (50, 40), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2, cv2.LINE_AA)
-                    duration = int(time.time() - self.recording_start_time)
-                    cv2.putText(img, f"{duration}s", (100, 40), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1, cv2.LINE_AA)
-                
-                # Show stability indicator
-                if landmarks:
-                    stability_text = "STABLE" if self.detector.is_hand_stable else "MOVING"
-                    stability_color = (0, 255, 0) if self.detector.is_hand_stable else (0, 165, 255)
-                    cv2.putText(img, stability_text, (img.shape[1] - 150, 60), 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.5, stability_color, 2, cv2.LINE_AA)
-                
-                # Calculate and display FPS
-                curr_time = time.time()
-                fps = 1 / (curr_time - prev_time) if prev_time != 0 else 0
-                prev_time = curr_time
-                
-                cv2.putText(img, f"FPS: {int(fps)}", (img.shape[1] - 150, 30), 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, self.color_warning, 2, cv2.LINE_AA)
-                
-                # Write frame to video if recording
-                if self.recording and self.video_writer:
-                    self.video_writer.write(img)
-                
-                # Update analytics
-                if current_letter and confidence > 0:
-                    self.analytics['avg_confidence'].append(confidence)
-                    if len(self.analytics['avg_confidence']) > 100:
-                        self.analytics['avg_confidence'].pop(0)
-                
-                # Show the image
-                cv2.imshow("ASL Translator - Enhanced v2.0 🚀", img)
-                
-                # Handle keyboard input
-                key = cv2.waitKey(1) & 0xFF
-                
-                # DEBUG: Show key code when in learning mode (if debug enabled)
-                if self.debug_mode and key != 255 and self.learning_mode:
-                    print(f"🔍 Key pressed: {key} (char: '{chr(key) if 32 <= key <= 126 else '?'}')")
-                
-                if key == ord('q'):
-                    print("\n" + "=" * 60)
-                    print("👋 Exiting without saving...")
-                    print(f"📝 Final text: {self.current_text}")
-                    print("=" * 60)
-                    break
-                elif key == 27:  # ESC key
-                    print("\n" + "=" * 60)
-                    print("💾 Saving and exiting...")
-                    filename = self.save_to_file()
-                    if filename:
-                        print(f"✅ Saved to: {filename}")
-                    print(f"📝 Final text: {self.current_text}")
-                    print("=" * 60)
-                    break
-                elif key == ord(' '):
-                    self.current_text += " "
-                    print(f"➕ Added space | Text: {self.current_text}")
-                elif key == 8 or key == 127:  # Backspace or Delete
-                    if self.current_text:
-                        deleted = self.current_text[-1]
-                        self.current_text = self.current_text[:-1]
-                        print(f"⬅️  Deleted: '{deleted}' | Text: {self.current_text}")
-                elif key == ord('c') or key == ord('C'):
-                    self.current_text = ""
-                    self.letter_history.clear()
-                    print("🗑️  Cleared all text")
-                elif key == ord('h') or key == ord('H'):
-                    self.show_help = not self.show_help
-                    print(f"📚 Help {'shown' if self.show_help else 'hidden'}")
-                elif key == ord('s') or key == ord('S'):
-                    self.show_stats = not self.show_stats
-                    print(f"📊 Statistics {'shown' if self.show_stats else 'hidden'}")
-                
-                # GAMIFICATION FEATURES DISABLED (keys 1-8)
-                # elif key in [ord('1'), ord('2'), ord('3')]:
-                #     # Accept word suggestion
-                #     suggestions = self.get_word_suggestions()
-                #     suggestion_idx = int(chr(key)) - 1
-                #     if suggestion_idx < len(suggestions):
-                #         words = self.current_text.split()
-                #         if words:
-                #             words[-1] = suggestions[suggestion_idx]
-                #             self.current_text = " ".join(words) + " "
-                #             print(f"✨ Accepted suggestion: {suggestions[suggestion_idx]}")
-                # elif key == ord('4'):
-                #     # Toggle practice mode
-                # elif key == ord('5'):
-                #     # Toggle recording
-                # elif key == ord('6'):
-                #     # Toggle voice output
-                # elif key == ord('7'):
-                #     # Add last word to custom dictionary
-                # elif key == ord('8'):
-                #     # Show gamification stats
-                
-                # Debug mode toggle (Press 'D')
-                elif key == ord('d') or key == ord('D'):
-                    self.debug_mode = not self.debug_mode
-                    if self.debug_mode:
-                        print("\n🔍 DEBUG MODE ENABLED - Detailed logs will be shown")
-                    else:
-                        print("\n🔍 DEBUG MODE DISABLED - Clean output")
-                
-                # Direct letter typing mode (Press 'T') - TYPE LETTERS DIRECTLY
-                elif key == ord('t') or key == ord('T'):
-                    if self.learning_mode:
-                        self.direct_letter_mode = not self.direct_letter_mode
-                        if self.direct_letter_mode:
-                            print("\n⌨️  DIRECT LETTER MODE ENABLED")
-                            print("💡 Now you can press A-Z keys directly to select letters!")
-                            print("💡 Press T again to go back to number keys")
-                        else:
-                            print("\n⌨️  DIRECT LETTER MODE DISABLED")
-                            print("💡 Use number keys (3-9, 0) to select letters")
-                    else:
-                        print("\n⚠️  You must be in training mode first!")
-                        print("💡 Press 1 to enter training mode")
-                
-                # Learning mode (Press '1') - ENTER TRAINING MODE
-                elif key == 49:  # Key '1'
-                    self.learning_mode = not self.learning_mode
-                    if not self.learning_mode:
-                        self.current_training_letter = None
-                        self.direct_letter_mode = False  # Reset when exiting
-                        print("\n❌ Training mode deactivated")
-                        print("💡 Press 1 again to re-enter training mode")
-                    else:
-                        print("\n" + "=" * 60)
-                        print("🎓 TRAINING MODE ACTIVATED")
-                        print("=" * 60)
-                        print("📝 Instructions:")
-                        print("  • Press T to enable DIRECT LETTER TYPING (A-Z keys)")
-                        print("  • OR use NUMBER keys (3-9, 0) to select letters:")
-                        print("    3=A/K/U  4=B/L/V  5=C/M/W  6=D/N/X  7=E/O/Y")
-                        print("    8=F/P/Z  9=G/Q    0=H/R/I/S/J/T")
-                        print("  • Make ASL sign and hold steady")
-                        print("  • Press ENTER repeatedly to capture 15-20 samples")
-                        print("  • Press 2 when done to TRAIN THE MODEL")
-                        print("  • Press 1 to exit training mode")
-                        print("\n💡 TIP: Photos auto-cropped to hand region only!")
-                        print("=" * 60)
-                
-                # Train ML model (Press '2') - TRAIN MODEL
-                elif key == 50:  # Key '2'
-                    print("\n🧠 TRAINING MODEL (with automatic outlier removal)...")
-                    if self.load_ml_trainer():
-                        result = self.ml_trainer.bulk_train_with_outlier_removal()
-                        # Result is a tuple (accuracy, outliers_dict)
-                        if result and result[0]:  # Check if accuracy is not None
-                            accuracy, outliers = result
-                            self.ml_enabled = True
-                            self.learning_mode = False  # Exit learning mode
-                            self.current_training_letter = None
-                            print(f"✅ Model trained! Accuracy: {accuracy:.2%}")
-                            print("🎉 ML model is now ACTIVE and ready to use!")
-                            print("💡 Make ASL gestures and the model will recognize them!")
-                        else:
-                            print("❌ Training failed - need more samples")
-                            print("💡 TIP: Capture at least 10 samples for 2+ different letters")
-                
-                # Bulk train with outlier removal (Press 'B') - Check BEFORE letter key handling
-                elif key == ord('b') or key == ord('B'):
-                    print("\n🚀 BULK TRAINING with outlier removal...")
-                    if self.load_ml_trainer():
-                        result = self.ml_trainer.bulk_train_with_outlier_removal()
-                        # Result is a tuple (accuracy, outliers_dict)
-                        if result and result[0]:  # Check if accuracy is not None
-                            accuracy, outliers = result
-                            self.ml_enabled = True
-                            self.learning_mode = False  # Exit learning mode
-                            self.current_training_letter = None
-                            print(f"✅ Model trained! Accuracy: {accuracy:.2%}")
-                            print("🎉 ML model is now ACTIVE and ready to use!")
-                            print("💡 Make ASL gestures and the model will recognize them!")
-                        else:
-                            print("❌ Training failed - need more samples")
-                            print("💡 TIP: Capture at least 10 samples for 2+ different letters")
-                
-                # Handle A-Z key presses in DIRECT LETTER MODE
-                elif self.learning_mode and self.direct_letter_mode and (65 <= key <= 90 or 97 <= key <= 122):
-                    letter = chr(key).upper()
-                    self.current_training_letter = letter
-                    count = self.training_count.get(letter, 0)
-                    print(f"\n🎯 Selected letter: {letter} (Current samples: {count})")
-                    print("💡 Make the gesture and press ENTER to capture")
-                
-                # Handle NUMBER key presses in learning mode (3-9, 0 to select letters)
-                elif self.learning_mode and not self.direct_letter_mode and (48 == key or (51 <= key <= 57)):  # Keys 0, 3-9
-                    number = key - 48  # Convert to 0-9
-                    
-                    # Skip keys 1 and 2 (they're commands)
-                    if number in [1, 2]:
-                        continue
-                    
-                    # Get available letters for this number
-                    available_letters = self.number_to_letters.get(number, [])
-                    if not available_letters:
-                        print(f"⚠️  No letters mapped to key {number}")
-                        print("💡 Use keys 3-9 or 0 to select letters")
-                        continue
-                    
-                    # Cycle through letters for this number
-                    if number not in self.current_number_index:
-                        self.current_number_index[number] = 0
-                    else:
-                        self.current_number_index[number] = (self.current_number_index[number] + 1) % len(available_letters)
-                    
-                    letter = available_letters[self.current_number_index[number]]
-                    self.current_training_letter = letter
-                    count = self.training_count.get(letter, 0)
-                    
-                    # Show all available letters for this number
-                    letters_str = " → ".join(available_letters)
-                    print(f"\n🎯 Key {number}: {letters_str}")
-                    print(f"   Now training: {letter} (Current samples: {count})")
-                    print(f"💡 Press {number} again to cycle, or press ENTER to capture")
-                
-                # Warning if number key pressed while NOT in learning mode
-                elif not self.learning_mode and (48 == key or (51 <= key <= 57)):
-                    number = key - 48
-                    if number not in [1, 2]:  # Don't warn for commands
-                        print(f"\n⚠️  Key '{number}' pressed but NOT in training mode!")
-                        print("💡 Press 1 to enter TRAINING MODE first")
-                
-                # Handle ENTER key to capture gesture in learning mode
-                elif self.learning_mode and key == 13 and self.current_training_letter:  # ENTER key
-                    if landmarks and self.detector.is_hand_stable:
-                        # Load ML trainer if needed
-                        if not self.ml_trainer_loaded:
-                            self.load_ml_trainer()
-                        
-                        if self.ml_trainer_loaded:
-                            # Get finger states
-                            finger_states = self.detector.get_finger_states(landmarks)
-                            
-                            # Add training sample WITH finger states
-                            success = self.ml_trainer.add_training_sample(
-                                landmarks, 
-                                self.current_training_letter,
-                                finger_states=finger_states
-                            )
-                            
-                            if success:
-                                if self.current_training_letter not in self.training_count:
-                                    self.training_count[self.current_training_letter] = 0
-                                self.training_count[self.current_training_letter] += 1
-                                count = self.training_count[self.current_training_letter]
-                                
-                                # IMPROVED PHOTO CAPTURE - Only hand region, no overlays
-                                photo_saved = False
-                                photo_path = None
-                                
-                                # Always show photo capture attempt
-                                print(f"\n📸 Capturing photo for {self.current_training_letter}...")
-                                if self.debug_mode:
-                                    print(f"🔍 DEBUG: Starting photo capture for {self.current_training_letter}")
-                                try:
-                                    import os
-                                    import datetime
-                                    
-                                    # Create training_photos directory if it doesn't exist
-                                    photo_dir = "training_photos"
-                                    if not os.path.exists(photo_dir):
-                                        os.makedirs(photo_dir)
-                                        if self.debug_mode:
-                                            print(f"📁 Created directory: {photo_dir}")
-                                    
-                                    # Create letter-specific subdirectory
-                                    letter_dir = os.path.join(photo_dir, self.current_training_letter)
-                                    if not os.path.exists(letter_dir):
-                                        os.makedirs(letter_dir)
-                                        if self.debug_mode:
-                                            print(f"📁 Created directory: {letter_dir}")
-                                    
-                                    if self.debug_mode:
-                                        print(f"🔍 DEBUG: Directories created. Letter dir: {letter_dir}")
-                                    
-                                    # Generate timestamp filename
-                                    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-                                    
-                                    if self.debug_mode:
-                                        print(f"🔍 DEBUG: Capturing fresh frame from camera...")
-                                    # Capture a FRESH frame without overlays
-                                    ret_clean, img_clean = cap.read()
-                                    if self.debug_mode:
-                                        print(f"🔍 DEBUG: Frame capture result: {ret_clean}, shape: {img_clean.shape if ret_clean else 'None'}")
-                                    
-                                    if not ret_clean or img_clean is None:
-                                        raise ValueError("Failed to capture clean frame from camera")
-                                    
-                                    # Flip the frame
-                                    img_clean = cv2.flip(img_clean, 1)
-                                    h_img, w_img = img_clean.shape[:2]
-                                    if self.debug_mode:
-                                        print(f"🔍 DEBUG: Frame flipped. Size: {w_img}x{h_img}")
-                                    
-                                    # Extract hand bounding box from landmarks
-                                    x_coords = [lm[1] for lm in landmarks]
-                                    y_coords = [lm[2] for lm in landmarks]
-                                    
-                                    x_min = max(0, int(min(x_coords) * w_img) - 40)
-                                    x_max = min(w_img, int(max(x_coords) * w_img) + 40)
-                                    y_min = max(0, int(min(y_coords) * h_img) - 40)
-                                    y_max = min(h_img, int(max(y_coords) * h_img) + 40)
-                                    
-                                    if self.debug_mode:
-                                        print(f"🔍 DEBUG: Crop region: x[{x_min}:{x_max}], y[{y_min}:{y_max}]")
-                                    
-                                    # Validate coordinates
-                                    if x_max <= x_min or y_max <= y_min:
-                                        raise ValueError(f"Invalid crop coordinates: x[{x_min}:{x_max}], y[{y_min}:{y_max}]")
-                                    
-                                    # Crop to hand region
-                                    hand_only = img_clean[y_min:y_max, x_min:x_max].copy()
-                                    if self.debug_mode:
-                                        print(f"🔍 DEBUG: Cropped hand image shape: {hand_only.shape}")
-                                    
-                                    # Validate crop is not empty
-                                    if hand_only.size == 0:
-                                        raise ValueError("Cropped region is empty")
-                                    
-                                    # Save hand-only photo
-                                    filename_hand = os.path.join(letter_dir, f"{self.current_training_letter}_{count:03d}_{timestamp}_hand.jpg")
-                                    if self.debug_mode:
-                                        print(f"🔍 DEBUG: Attempting to save to: {filename_hand}")
-                                    
-                                    success_write = cv2.imwrite(filename_hand, hand_only)
-                                    if self.debug_mode:
-                                        print(f"🔍 DEBUG: cv2.imwrite result: {success_write}")
-                                    
-                                    if success_write:
-                                        photo_saved = True
-                                        photo_path = filename_hand
-                                        print(f"📸 ✅ Photo saved successfully: {filename_hand}")
-                                    else:
-                                        raise ValueError("cv2.imwrite returned False")
-                                    
-                                except Exception as e:
-                                    print(f"❌ Photo save failed with error: {e}")
-                                    import traceback
-                                    traceback.print_exc()
-                                
-                                # Save photo path to training sample
-                                if photo_saved and self.ml_trainer_loaded:
-                                    # Update the last sample with photo path
-                                    if len(self.ml_trainer.training_data) > 0:
-                                        self.ml_trainer.training_data[-1]['photo_path'] = photo_path
-                                        self.ml_trainer.save_training_data()
-                                
-                                if photo_saved:
-                                    print(f"✅ Captured! {self.current_training_letter}: {count} samples (photo + finger states saved)")
-                                else:
-                                    print(f"✅ Captured! {self.current_training_letter}: {count} samples (landmarks + finger states saved, photo failed)")
-                                
-                                self.play_sound('success')
-                                
-                                # Suggest when to train
-                                if count == 15:
-                                    print("💡 TIP: You have 15 samples - good time to train! Press M or B")
-                            else:
-                                print("❌ Failed to save sample")
-                    else:
-                        if not landmarks:
-                            print("⚠️  No hand detected! Show your hand to the camera")
-                        else:
-                            print("⚠️  Hand not stable! Hold still and try again")
-                
-                elif key == ord('n') or key == ord('N'):
-                    # Show ML training statistics
-                    if not self.ml_trainer_loaded:
-                        if not self.load_ml_trainer():
-                            print("❌ Cannot show stats - ML trainer failed to load")
-                            continue
-                    
-                    print("\n" + "=" * 60)
-                    print("📊 ML TRAINING STATISTICS")
-                    print("=" * 60)
-                    stats = self.ml_trainer.get_statistics()
-                    if stats:
-                        print("Samples per letter:")
-                        for letter, count in sorted(stats.items()):
-                            bar = "█" * min(count, 50)
-                            print(f"   {letter}: {count:3d} {bar}")
-                        print(f"\n📦 Total samples: {len(self.ml_trainer.training_data)}")
-                        print(f"🤖 ML enabled: {self.ml_enabled}")
-                        if self.ml_trainer.model:
-                            print("✅ Model trained and ready")
-                        else:
-                            print("⚠️  Model not trained yet (press 'M' to train)")
-                    else:
-                        print("📦 No training data collected yet")
-                        print("💡 Press 'T' to enter learning mode and capture gestures")
-                    print("=" * 60)
+        pipeline = None
+        if pipelined:
+            pipeline = self._run_pipelined(cap)
+        else:
+            self._run_serial(cap)
         
         # Cleanup
         try:
             if self.recording:
                 self.stop_recording()
             
+            capture_stats = cap.get_stats()
             cap.release()
+            self.detector.close()
             cv2.destroyAllWindows()
         except Exception as e:
+            capture_stats = None
             print(f"⚠️  Cleanup warning: {e}")
         
         # Final statistics
@@ -1502,12 +1702,125 @@ class ASLTranslator:
         print(f"Session Letters: {self.letters_added}")
         print(f"Duration: {self.get_session_duration()}")
         print(f"Letters/Min: {self.get_letters_per_minute():.1f}")
+        if capture_stats:
+            print(f"Frames: {capture_stats['captured']} captured, "
+                  f"{capture_stats['consumed']} processed, {capture_stats['dropped']} dropped (stale)")
+        inference_stats = self.detector.get_inference_stats()
+        print(f"Inference: {inference_stats['processed']} MediaPipe runs ({inference_stats['roi']} on hand crops), "
+              f"{inference_stats['extrapolated']} extrapolated ({inference_stats['skip_ratio']:.0%} skipped), "
+              f"final inference scale {inference_stats['scale']:.2f}, "
+              f"{inference_stats['bytes_per_frame']:.0f} bytes allocated/frame")
+        cache_stats = self.prediction_cache.get_stats()
+        print(f"Classification: {cache_stats['misses']} full evaluations, {cache_stats['hits']} reused "
+              f"({cache_stats['hit_rate']:.0%} hit rate)")
+        if pipeline:
+            for name, stats in pipeline.get_stage_stats().items():
+                print(f"Stage {name}: {stats['frames']} frames, {stats['avg_ms']:.1f} ms/frame avg")
         print("=" * 60)
         
         if self.current_text:
             print(f"📋 Translated text: {self.current_text}")
         else:
             print("📋 No text was translated in this session.")
+    
+    def _run_serial(self, cap):
+        """Run every stage on the main thread, one frame at a time"""
+        while True:
+            success, img = cap.read()
+            if not success:
+                print("❌ Failed to capture video")
+                continue
+            
+            img, landmarks = self.detect_frame(img)
+            result = self.classify_frame(img, landmarks)
+            img = self.render_frame(img, landmarks, result)
+            
+            # Show the image
+            cv2.imshow(self.window_name, img)
+            
+            # Handle keyboard input
+            key = cv2.waitKey(1) & 0xFF
+            if not self.handle_key(key, landmarks, cap):
+                break
+    
+    def _run_pipelined(self, cap):
+        """
+        Run detect, classify and render on worker threads
+        
+        A feeder thread pushes camera frames into the pipeline while the main
+        thread displays finished frames and handles keys (HighGUI must stay on
+        the main thread). Frames come out in capture order.
+        
+        The detect worker is already on a later frame while earlier ones are
+        classified and rendered, so any detector state the later stages need
+        (hand stability) is captured into the payload right after detection;
+        downstream stages never read the detector directly.
+        
+        Returns:
+            The stopped FramePipeline (for final statistics)
+        """
+        def detect_stage(img):
+            img, landmarks = self.detect_frame(img)
+            return img, landmarks, self.detector.is_hand_stable
+        
+        def classify_stage(item):
+            img, landmarks, hand_stable = item
+            return img, landmarks, self.classify_frame(img, landmarks, hand_stable=hand_stable)
+        
+        def render_stage(item):
+            img, landmarks, result = item
+            return self.render_frame(img, landmarks, result), landmarks, result['hand_stable']
+        
+        stages = [
+            ('detect', detect_stage),
+            ('classify', classify_stage),
+            ('render', render_stage)
+        ]
+        
+        # Detected frames live in pooled buffers - keep enough that none is reused
+        # while still queued, in a stage, or on screen
+        self.detector.preprocessor.set_pool_size(len(stages) * (self.pipeline_queue_size + 1) + 1)
+        
+        pipeline = FramePipeline(stages, queue_size=self.pipeline_queue_size).start()
+        
+        feeding = threading.Event()
+        feeding.set()
+        
+        def feed():
+            while feeding.is_set():
+                success, img = cap.read()
+                if success:
+                    pipeline.submit(img)
+        
+        feeder = threading.Thread(target=feed, name="Pipeline-capture", daemon=True)
+        feeder.start()
+        
+        try:
+            while True:
+                success, output = pipeline.get(timeout=1.0)
+                if not success or output is None:
+                    continue
+                img, landmarks, hand_stable = output
+                
+                # Per-stage queue depth (frames waiting in front of each stage)
+                depths = pipeline.get_queue_depths()
+                depth_text = " | ".join(f"{name} {depth}" for name, depth in depths.items())
+                cv2.putText(img, f"Queues: {depth_text}", (20, img.shape[0] - 10),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.45, self.color_text, 1, cv2.LINE_AA)
+                
+                # Show the image
+                cv2.imshow(self.window_name, img)
+                
+                # Handle keyboard input
+                key = cv2.waitKey(1) & 0xFF
+                if not self.handle_key(key, landmarks, cap, hand_stable):
+                    break
+        finally:
+            feeding.clear()
+            pipeline.stop()
+            feeder.join(timeout=1.0)
+        
+        return pipeline
 
 
 def main():
@@ -0,0 +1,151 @@
+"""
+Batch Video Transcriber
+Transcribes a directory of videos across a multiprocessing pool
+Each worker process builds one VideoTranscriber (and HandDetector) and reuses it
+"""
+import json
+import multiprocessing
+import os
+import time
+
+from video_transcriber import VideoTranscriber
+
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv', '.m4v')
+
+# One transcriber per worker process (MediaPipe graphs are expensive to build)
+_worker_transcriber = None
+
+
+def _init_worker(data_file, model_file, mirror, cache_dir=None, adaptive_skip=False, roi_mode=False,
+                 smoothing='moving_average'):
+    """Pool initializer: build this process's transcriber once"""
+    global _worker_transcriber
+    _worker_transcriber = VideoTranscriber(data_file=data_file, model_file=model_file, mirror=mirror,
+                                           cache_dir=cache_dir, adaptive_skip=adaptive_skip, roi_mode=roi_mode,
+                                           smoothing=smoothing)
+
+
+def _transcribe_job(job):
+    """Transcribe one video inside a worker process"""
+    source, output_dir, fps = job
+    start = time.perf_counter()
+    result = {
+        'source': source,
+        'worker': os.getpid(),
+        'frames': 0,
+        'seconds': 0.0,
+        'transcript': "",
+        'error': None
+    }
+
+    try:
+        summary = _worker_transcriber.transcribe(source, output_dir=output_dir, fps=fps)
+        result['frames'] = summary['frames']
+        result['transcript'] = summary['transcript']
+    except Exception as e:
+        result['error'] = str(e)
+
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def find_videos(input_dir):
+    """List video files in a directory (sorted, non-recursive)"""
+    return [
+        os.path.join(input_dir, name)
+        for name in sorted(os.listdir(input_dir))
+        if name.lower().endswith(VIDEO_EXTENSIONS)
+    ]
+
+
+def build_throughput_report(results, wall_seconds):
+    """
+    Aggregate per-video results into a throughput report
+
+    Args:
+        results: List of dicts returned by the worker jobs
+        wall_seconds: Wall-clock time for the whole batch
+
+    Returns:
+        Dict with per-worker and overall frames/sec
+    """
+    workers = {}
+    for result in results:
+        stats = workers.setdefault(result['worker'], {'videos': 0, 'frames': 0, 'seconds': 0.0})
+        stats['videos'] += 1
+        stats['frames'] += result['frames']
+        stats['seconds'] += result['seconds']
+
+    for stats in workers.values():
+        stats['fps'] = stats['frames'] / stats['seconds'] if stats['seconds'] > 0 else 0.0
+
+    total_frames = sum(r['frames'] for r in results)
+    return {
+        'videos': len(results),
+        'failed': sum(1 for r in results if r['error']),
+        'frames': total_frames,
+        'wall_seconds': wall_seconds,
+        'overall_fps': total_frames / wall_seconds if wall_seconds > 0 else 0.0,
+        'workers': {str(pid): stats for pid, stats in sorted(workers.items())},
+        'results': sorted(results, key=lambda r: r['source'])
+    }
+
+
+def transcribe_directory(input_dir, output_dir, workers=None, fps=None,
+                         data_file="training_data.json", model_file="asl_model.pkl", mirror=False,
+                         cache_dir=None, adaptive_skip=False, roi_mode=False, smoothing='moving_average'):
+    """
+    Transcribe every video in a directory using a process pool
+
+    Writes per-video result files plus throughput_report.json into output_dir.
+
+    Args:
+        input_dir: Directory containing the videos
+        output_dir: Directory for results
+        workers: Number of worker processes (default: all CPU cores)
+        fps: Override the frame rate used for hold-time timestamps
+        data_file: Training data JSON used by MLTrainer
+        model_file: Trained model pickle used by MLTrainer
+        mirror: Flip frames horizontally (raw camera footage only)
+        cache_dir: Landmark cache directory shared by all workers (None = no cache)
+        adaptive_skip: Extrapolate landmarks on stable frames (default: full inference on every frame)
+        roi_mode: Run MediaPipe on hand crops (default: full frames)
+        smoothing: Landmark smoother ('moving_average', 'one_euro' or 'kalman')
+
+    Returns:
+        Throughput report dict
+    """
+    videos = find_videos(input_dir)
+    if not videos:
+        print(f"⚠️  No videos found in {input_dir}")
+        return build_throughput_report([], 0.0)
+
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(videos))
+    os.makedirs(output_dir, exist_ok=True)
+
+    print(f"🚀 Transcribing {len(videos)} videos with {workers} worker processes...")
+    jobs = [(video, output_dir, fps) for video in videos]
+    results = []
+    start = time.perf_counter()
+
+    with multiprocessing.Pool(processes=workers, initializer=_init_worker,
+                              initargs=(data_file, model_file, mirror, cache_dir, adaptive_skip, roi_mode,
+                                        smoothing)) as pool:
+        for result in pool.imap_unordered(_transcribe_job, jobs):
+            results.append(result)
+            name = os.path.basename(result['source'])
+            if result['error']:
+                print(f"❌ [{len(results)}/{len(videos)}] {name}: {result['error']}")
+            else:
+                video_fps = result['frames'] / result['seconds'] if result['seconds'] > 0 else 0.0
+                print(f"✅ [{len(results)}/{len(videos)}] {name}: {result['frames']} frames "
+                      f"({video_fps:.1f} fps, worker {result['worker']})")
+
+    report = build_throughput_report(results, time.perf_counter() - start)
+
+    report_path = os.path.join(output_dir, "throughput_report.json")
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    return report
@@ -0,0 +1,318 @@
+"""
+Detector Backends Module
+Interchangeable sources of per-frame hand landmarks for HandDetector
+Solutions API (synchronous), Tasks HandLandmarker (asynchronous LIVE_STREAM)
+and replay of stored landmarks
+"""
+import threading
+import time
+from types import SimpleNamespace
+
+import mediapipe as mp
+import numpy as np
+from mediapipe.framework.formats import landmark_pb2
+
+HANDEDNESS_LABELS = ('Left', 'Right')  # Codes 0 and 1 in packed arrays (-1 = unknown)
+NUM_LANDMARKS = 21
+
+
+def make_result(hands=(), labels=(), scores=None):
+    """
+    Build a solutions-style result (the shape HandDetector reads from every backend)
+
+    Args:
+        hands: Sequence of (21, 3) array-likes of normalized x, y, z
+        labels: Handedness label per hand ('Left'/'Right', or None)
+        scores: Handedness score per hand (default: 1.0)
+
+    Returns:
+        Object with multi_hand_landmarks / multi_handedness (both None without hands)
+    """
+    if len(hands) == 0:
+        return SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None)
+
+    scores = scores if scores is not None else [1.0] * len(hands)
+    multi_hand_landmarks = []
+    multi_handedness = []
+    for hand, label, score in zip(hands, labels, scores):
+        hand_landmarks = landmark_pb2.NormalizedLandmarkList()
+        for x, y, z in np.asarray(hand, dtype=np.float64):
+            hand_landmarks.landmark.add(x=x, y=y, z=z)
+        multi_hand_landmarks.append(hand_landmarks)
+        category = SimpleNamespace(label=label, score=score)
+        multi_handedness.append(SimpleNamespace(classification=[category]))
+    return SimpleNamespace(multi_hand_landmarks=multi_hand_landmarks,
+                           multi_handedness=multi_handedness)
+
+
+def pack_result(result, max_hands=1):
+    """
+    Convert a solutions-style result to fixed-size arrays (for storing or replay)
+
+    Args:
+        result: Object with multi_hand_landmarks / multi_handedness
+        max_hands: Hand slots in the output (extra hands are dropped)
+
+    Returns:
+        (landmarks, handedness, scores): (max_hands, 21, 3) float32 normalized
+        x, y, z (NaN rows for missing hands), (max_hands,) int8 label codes and
+        (max_hands,) float32 handedness/detection scores (0 for missing hands)
+    """
+    landmarks = np.full((max_hands, NUM_LANDMARKS, 3), np.nan, dtype=np.float32)
+    handedness = np.full(max_hands, -1, dtype=np.int8)
+    scores = np.zeros(max_hands, dtype=np.float32)
+
+    hands = (result.multi_hand_landmarks or [])[:max_hands]
+    for slot, hand in enumerate(hands):
+        landmarks[slot] = [(lm.x, lm.y, lm.z) for lm in hand.landmark]
+        if result.multi_handedness and slot < len(result.multi_handedness):
+            category = result.multi_handedness[slot].classification[0]
+            if category.label in HANDEDNESS_LABELS:
+                handedness[slot] = HANDEDNESS_LABELS.index(category.label)
+            scores[slot] = category.score
+    return landmarks, handedness, scores
+
+
+class DetectorBackend:
+    """
+    Interface shared by all backends
+
+    process() takes an RGB frame and returns a solutions-style result whose
+    landmarks are normalized to that frame. Asynchronous backends may return
+    a result that belongs to an earlier frame; they set last_result_fresh to
+    False when the same result is handed out again.
+    """
+
+    supports_roi = False  # Can run on arbitrary crops (HandDetector roi_mode)
+    last_result_fresh = True
+
+    def process(self, rgb):
+        """
+        Get hand landmarks for a frame
+
+        Args:
+            rgb: (H, W, 3) uint8 RGB image
+
+        Returns:
+            Object with multi_hand_landmarks / multi_handedness
+        """
+        raise NotImplementedError
+
+    def reset(self):
+        """Start over for a new video (default: nothing to forget)"""
+
+    def close(self):
+        """Release the underlying graph (default: nothing to release)"""
+
+
+class SolutionsBackend(DetectorBackend):
+    """MediaPipe solutions Hands graph, run synchronously on every frame"""
+
+    supports_roi = True
+
+    def __init__(self, max_hands=1, detection_con=0.7, track_con=0.7, static_image_mode=False,
+                 model_complexity=0):
+        """
+        Args:
+            max_hands: Maximum number of hands to detect
+            detection_con: Minimum detection confidence
+            track_con: Minimum tracking confidence
+            static_image_mode: Detect on every frame instead of tracking
+            model_complexity: 0=Lite (faster), 1=Full (slower but more accurate)
+        """
+        self.hands = mp.solutions.hands.Hands(
+            static_image_mode=static_image_mode,
+            max_num_hands=max_hands,
+            min_detection_confidence=detection_con,
+            min_tracking_confidence=track_con,
+            model_complexity=model_complexity
+        )
+
+    def process(self, rgb):
+        return self.hands.process(rgb)
+
+    def close(self):
+        self.hands.close()
+
+
+class LiveStreamBackend(DetectorBackend):
+    """
+    MediaPipe Tasks HandLandmarker in LIVE_STREAM mode
+
+    process() only submits the frame (detect_async) and returns the newest
+    result delivered so far by the result callback, so the capture loop
+    never waits for inference. MediaPipe drops submitted frames while the
+    graph is still busy, which keeps latency bounded on slow CPUs.
+    """
+
+    def __init__(self, model_path='models/hand_landmarker.task', max_hands=1, detection_con=0.7,
+                 track_con=0.7, presence_con=0.5):
+        """
+        Args:
+            model_path: Path to the hand_landmarker.task model bundle
+            max_hands: Maximum number of hands to detect
+            detection_con: Minimum detection confidence
+            track_con: Minimum tracking confidence
+            presence_con: Minimum hand presence confidence
+        """
+        from mediapipe.tasks.python import BaseOptions, vision
+
+        self._lock = threading.Lock()
+        self._latest = make_result()
+        self._latest_timestamp = -1
+        self._delivered_timestamp = -1
+        self._last_submitted = -1
+        self.frames_submitted = 0
+        self.results_received = 0
+
+        options = vision.HandLandmarkerOptions(
+            base_options=BaseOptions(model_asset_path=model_path),
+            running_mode=vision.RunningMode.LIVE_STREAM,
+            num_hands=max_hands,
+            min_hand_detection_confidence=detection_con,
+            min_hand_presence_confidence=presence_con,
+            min_tracking_confidence=track_con,
+            result_callback=self._on_result
+        )
+        self.landmarker = vision.HandLandmarker.create_from_options(options)
+
+    @staticmethod
+    def convert_result(result):
+        """
+        Convert a Tasks HandLandmarkerResult to a solutions-style result
+
+        Args:
+            result: HandLandmarkerResult (hand_landmarks, handedness)
+
+        Returns:
+            Object with multi_hand_landmarks / multi_handedness
+        """
+        hands = [[(lm.x, lm.y, lm.z) for lm in hand] for hand in result.hand_landmarks]
+        labels = [categories[0].category_name if categories else None
+                  for categories in result.handedness]
+        scores = [categories[0].score if categories else 0.0 for categories in result.handedness]
+        return make_result(hands, labels, scores)
+
+    def _on_result(self, result, image, timestamp_ms):
+        """Result callback (runs on MediaPipe's thread)"""
+        converted = self.convert_result(result)
+        with self._lock:
+            if timestamp_ms > self._latest_timestamp:
+                self._latest = converted
+                self._latest_timestamp = timestamp_ms
+            self.results_received += 1
+
+    def process(self, rgb):
+        # Timestamps must strictly increase, even for frames submitted within the same millisecond
+        timestamp = max(int(time.monotonic() * 1000), self._last_submitted + 1)
+        self._last_submitted = timestamp
+        image = mp.Image(image_format=mp.ImageFormat.SRGB, data=np.ascontiguousarray(rgb))
+        self.landmarker.detect_async(image, timestamp)  # mp.Image holds its own copy of the pixels
+        self.frames_submitted += 1
+
+        with self._lock:
+            result = self._latest
+            result_timestamp = self._latest_timestamp
+        self.last_result_fresh = result_timestamp != self._delivered_timestamp
+        self._delivered_timestamp = result_timestamp
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._latest = make_result()
+            self._latest_timestamp = -1
+        self._delivered_timestamp = -1
+
+    def close(self):
+        self.landmarker.close()
+
+
+class ReplayBackend(DetectorBackend):
+    """
+    Serve stored landmarks one frame per process() call (no inference)
+
+    Data is the packed form from pack_result stacked over frames, so it can
+    be a plain array or a read-only np.memmap of a cached recording.
+    """
+
+    supports_roi = False
+
+    def __init__(self, landmarks, handedness=None, scores=None):
+        """
+        Args:
+            landmarks: (F, H, 21, 3) normalized x, y, z per frame and hand slot
+                       (NaN rows = no hand in that slot)
+            handedness: Optional (F, H) label codes (0 = Left, 1 = Right, -1 = unknown)
+            scores: Optional (F, H) handedness/detection scores (default: 1.0)
+        """
+        self.landmarks = landmarks
+        self.handedness = handedness
+        self.scores = scores
+        self.frame_index = 0
+
+    def __len__(self):
+        return len(self.landmarks)
+
+    def seek(self, frame_index):
+        """Make the next process() call return the given frame"""
+        self.frame_index = frame_index
+
+    def result_at(self, frame_index):
+        """
+        Result for one stored frame (empty past the end of the recording)
+
+        Args:
+            frame_index: Frame number in the recording
+
+        Returns:
+            Object with multi_hand_landmarks / multi_handedness
+        """
+        if not 0 <= frame_index < len(self.landmarks):
+            return make_result()
+
+        frame = np.asarray(self.landmarks[frame_index])
+        present = ~np.isnan(frame[:, 0, 0])
+        codes = (self.handedness[frame_index] if self.handedness is not None
+                 else np.full(len(frame), -1))
+        labels = [HANDEDNESS_LABELS[code] if code >= 0 else None for code in codes[present]]
+        scores = self.scores[frame_index][present].tolist() if self.scores is not None else None
+        return make_result(frame[present], labels, scores)
+
+    def process(self, rgb):
+        result = self.result_at(self.frame_index)
+        self.frame_index += 1
+        return result
+
+    def reset(self):
+        self.frame_index = 0
+
+
+BACKENDS = ('solutions', 'live_stream', 'replay')
+
+
+def create_backend(backend='solutions', max_hands=1, detection_con=0.7, track_con=0.7,
+                   static_image_mode=False, **kwargs):
+    """
+    Build a backend by name (or pass an existing DetectorBackend through)
+
+    Args:
+        backend: 'solutions', 'live_stream', 'replay' or a DetectorBackend instance
+        max_hands: Maximum number of hands to detect (inference backends)
+        detection_con: Minimum detection confidence (inference backends)
+        track_con: Minimum tracking confidence (inference backends)
+        static_image_mode: Solutions backend only
+        **kwargs: Backend-specific arguments (e.g. model_path, or landmarks for replay)
+
+    Returns:
+        DetectorBackend
+    """
+    if isinstance(backend, DetectorBackend):
+        return backend
+    if backend == 'solutions':
+        return SolutionsBackend(max_hands, detection_con, track_con, static_image_mode, **kwargs)
+    if backend == 'live_stream':
+        return LiveStreamBackend(max_hands=max_hands, detection_con=detection_con,
+                                 track_con=track_con, **kwargs)
+    if backend == 'replay':
+        return ReplayBackend(**kwargs)
+    raise ValueError(f"Unknown backend '{backend}' (use one of {list(BACKENDS)})")
@@ -3,8 +3,248 @@ Advanced Feature Extraction for ASL Recognition
 Based on research papers and ML best practices
 """
 import numpy as np
-import math
 from typing import List, Tuple, Dict
+from landmarks import Landmarks, as_landmarks
+
+
+FINGER_NAMES = ['thumb', 'index', 'middle', 'ring', 'pinky']
+FINGER_GROUPS = np.array([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12],
+                          [13, 14, 15, 16], [17, 18, 19, 20]])
+TIP_INDICES = FINGER_GROUPS[:, -1]
+WRIST = 0
+PALM_CENTER = 21  # Virtual point appended to the 21 landmarks: midpoint of wrist and middle MCP
+
+# Column order of the flat feature vector, grouped like the extract_*_features dicts
+FEATURE_GROUPS = {
+    'distances': ([f'{name}_wrist_dist' for name in FINGER_NAMES]
+                  + [f'spread_{i}' for i in range(4)]
+                  + [f'{name}_length' for name in FINGER_NAMES]),
+    'angles': ([f'{name}_{joint}_angle' for name in FINGER_NAMES for joint in ('joint', 'tip')]
+               + [f'interfinger_angle_{i}' for i in range(4)]
+               + ['hand_orientation']),
+    'ratios': ['aspect_ratio', 'compactness'] + [f'extension_ratio_{i}' for i in range(5)],
+    'statistics': ['x_mean', 'x_std', 'x_min', 'x_max', 'y_mean', 'y_std', 'y_min', 'y_max',
+                   'x_skewness', 'y_skewness', 'coordinate_variance'],
+    'topology': ['tip_spread', 'palm_openness', 'palm_openness_std', 'finger_alignment'],
+    'fingers': [f'{name}_{feature}' for name in FINGER_NAMES
+                for feature in ('curvature', 'direction', 'straightness')]
+}
+FEATURE_NAMES = [name for names in FEATURE_GROUPS.values() for name in names]
+FEATURE_COLUMNS = {name: column for column, name in enumerate(FEATURE_NAMES)}
+NUM_FEATURES = len(FEATURE_NAMES)
+
+# Every distance the features need, as (from, to) point pairs, measured in one gather:
+#   0-4: wrist->tip, 5-8: adjacent tips, 9-23: finger segments (3 per finger),
+#   24-28: finger base->tip, 29: palm width (index MCP->pinky MCP),
+#   30: wrist->middle MCP, 31-35: palm centre->tip
+_DIST_FROM = np.concatenate([[WRIST] * 5, TIP_INDICES[:-1], FINGER_GROUPS[:, :-1].ravel(),
+                             FINGER_GROUPS[:, 0], [5, WRIST], [PALM_CENTER] * 5])
+_DIST_TO = np.concatenate([TIP_INDICES, TIP_INDICES[1:], FINGER_GROUPS[:, 1:].ravel(),
+                           FINGER_GROUPS[:, -1], [17, 9], TIP_INDICES])
+_NUM_LANDMARK_DISTS = 31  # Pairs before the palm-centre ones (readable from a landmark distance matrix)
+
+# Every angle as (end, vertex, end) point triples:
+#   0-9: joint and tip angle per finger (interleaved), 10-13: adjacent tips at the wrist,
+#   14-17: adjacent tips at the palm centre
+_ANGLE_A = np.concatenate([FINGER_GROUPS[:, :2].ravel(), TIP_INDICES[:-1], TIP_INDICES[:-1]])
+_ANGLE_VERTEX = np.concatenate([FINGER_GROUPS[:, 1:3].ravel(), [WRIST] * 4, [PALM_CENTER] * 4])
+_ANGLE_B = np.concatenate([FINGER_GROUPS[:, 2:4].ravel(), TIP_INDICES[1:], TIP_INDICES[1:]])
+
+
+def _safe_divide(numerator, denominator):
+    """numerator / denominator, 0 where the denominator is 0"""
+    return np.divide(numerator, denominator, out=np.zeros(np.broadcast(numerator, denominator).shape),
+                     where=denominator != 0)
+
+
+def _layout_angles(xs, ys, a, vertex, b):
+    """Angles in degrees at vertex (0 for zero-length rays) from landmark-major coordinate rows"""
+    v1x = xs[a] - xs[vertex]
+    v1y = ys[a] - ys[vertex]
+    v2x = xs[b] - xs[vertex]
+    v2y = ys[b] - ys[vertex]
+    dots = v1x * v2x + v1y * v2y
+    mags = np.sqrt(v1x ** 2 + v1y ** 2) * np.sqrt(v2x ** 2 + v2y ** 2)
+    angles = np.degrees(np.arccos(np.clip(_safe_divide(dots, mags), -1.0, 1.0)))
+    return np.where(mags == 0, 0.0, angles)
+
+
+def compute_feature_vector(points, dtype=np.float32, distances=None, joint_angles=None):
+    """
+    Compute every hand-shape feature from landmark coordinates in one pass
+
+    All distances and angles are measured with a single gather each
+    (precomputed index arrays), so the cost is a few dozen array
+    operations regardless of how many features there are - or how many
+    hands: a stack of N hands goes through the same operations.
+
+    Internally the coordinates are laid out landmark-major, (22, 2, N),
+    so every gather copies whole contiguous rows of N values instead of
+    picking scattered elements (which dominated the batch cost).
+
+    Args:
+        points: (21, 2) or (N, 21, 2) array-like of x, y pixel coordinates
+        dtype: Output dtype (computation is always float64)
+        distances: Optional precomputed (..., 21, 21) pairwise distance matrix
+                   (e.g. HandGeometry.distances); landmark distances are read
+                   from it instead of being measured again
+        joint_angles: Optional precomputed (..., 5, 3) joint-angle table
+                      (HandGeometry.joint_angles); its 'joint' and 'tip'
+                      columns are the per-finger angle features
+
+    Returns:
+        (NUM_FEATURES,) or (N, NUM_FEATURES) array in FEATURE_NAMES column order
+    """
+    points = np.asarray(points, dtype=np.float64)[..., :21, :]
+    batch_shape = points.shape[:-2]
+
+    # (22, 2, *batch): the 21 landmarks plus the virtual palm centre
+    layout = np.empty((22, 2) + batch_shape)
+    layout[:21] = np.moveaxis(points, (-2, -1), (0, 1))
+    layout[PALM_CENTER] = (layout[WRIST] + layout[9]) / 2
+    xs = layout[:, 0]
+    ys = layout[:, 1]
+
+    if distances is None:
+        dx = xs[_DIST_TO] - xs[_DIST_FROM]
+        dy = ys[_DIST_TO] - ys[_DIST_FROM]
+        dists = np.sqrt(dx ** 2 + dy ** 2)
+    else:
+        # Only the palm-centre distances involve the virtual point
+        dx = xs[_DIST_TO[_NUM_LANDMARK_DISTS:]] - xs[_DIST_FROM[_NUM_LANDMARK_DISTS:]]
+        dy = ys[_DIST_TO[_NUM_LANDMARK_DISTS:]] - ys[_DIST_FROM[_NUM_LANDMARK_DISTS:]]
+        landmark_dists = np.asarray(distances, dtype=np.float64)[..., _DIST_FROM[:_NUM_LANDMARK_DISTS],
+                                                                 _DIST_TO[:_NUM_LANDMARK_DISTS]]
+        dists = np.concatenate([np.moveaxis(landmark_dists, -1, 0), np.sqrt(dx ** 2 + dy ** 2)])
+
+    if joint_angles is None:
+        angles = _layout_angles(xs, ys, _ANGLE_A, _ANGLE_VERTEX, _ANGLE_B)
+    else:
+        finger_angles = np.asarray(joint_angles, dtype=np.float64)[..., :2].reshape(batch_shape + (10,))
+        angles = np.concatenate([np.moveaxis(finger_angles, -1, 0),
+                                 _layout_angles(xs, ys, _ANGLE_A[10:], _ANGLE_VERTEX[10:], _ANGLE_B[10:])])
+
+    palm_width = dists[29:30]  # Normalizer for the distance group (0 -> features 0)
+    segments = dists[9:24].reshape((5, 3) + batch_shape)
+    segment_sums = segments[:, 0] + segments[:, 1] + segments[:, 2]
+    direct = dists[24:29]
+    straightness = _safe_divide(direct, segment_sums)
+    curvature = np.where(segment_sums == 0, 0.0, 1 - straightness)
+
+    orientation = np.mod(np.degrees(np.arctan2(ys[9] - ys[WRIST], xs[9] - xs[WRIST])) + 360, 360)
+
+    # x and y statistics side by side: (*batch, 2, 21), reduced along contiguous rows
+    coords = np.ascontiguousarray(np.swapaxes(points, -1, -2))
+    means = coords.mean(axis=-1)
+    variances = coords.var(axis=-1)
+    stds = np.sqrt(variances)  # Same bits as np.std
+    mins = coords.min(axis=-1)
+    maxs = coords.max(axis=-1)
+    standardized = _safe_divide(coords - means[..., None], stds[..., None])
+    skewness = np.mean(standardized * standardized * standardized, axis=-1)  # ** 3 calls pow() per element
+    statistics = np.stack([means, stds, mins, maxs], axis=-1).reshape(batch_shape + (8,))
+    width = maxs[..., 0] - mins[..., 0]
+    height = maxs[..., 1] - mins[..., 1]
+    perimeter = 2 * (width + height)  # Squared by multiplying: scalar ** 2 can round differently
+
+    tip_xs = xs[TIP_INDICES]
+    tip_ys = ys[TIP_INDICES]
+    tip_spread = (tip_xs.max(axis=0) - tip_xs.min(axis=0)) * (tip_ys.max(axis=0) - tip_ys.min(axis=0))
+    palm_distances = dists[31:36]
+    deviations = np.abs(180 - angles[14:18])
+    alignment = (deviations[0] + deviations[1] + deviations[2] + deviations[3]) / 4
+
+    directions = np.arctan2(ys[TIP_INDICES] - ys[FINGER_GROUPS[:, 0]],
+                            xs[TIP_INDICES] - xs[FINGER_GROUPS[:, 0]])
+
+    # Every block is (columns, *batch)
+    columns = [
+        # distances
+        _safe_divide(dists[0:5], palm_width),
+        _safe_divide(dists[5:9], palm_width),
+        _safe_divide(segment_sums, palm_width),
+        # angles
+        angles[0:10],
+        angles[10:14],
+        orientation[None],
+        # ratios
+        (width / (height + 0.001))[None],
+        (width * height / (perimeter * perimeter + 0.001))[None],
+        dists[0:5] / (dists[30:31] + 0.001),
+        # statistics
+        np.moveaxis(statistics, -1, 0),
+        np.moveaxis(skewness, -1, 0),
+        (variances[..., 0] + variances[..., 1])[None],
+        # topology
+        np.stack([tip_spread, palm_distances.mean(axis=0), palm_distances.std(axis=0), alignment]),
+        # fingers (curvature, direction, straightness per finger)
+        np.stack([curvature, directions, straightness], axis=1).reshape((15,) + batch_shape)
+    ]
+    features = np.concatenate(columns, axis=0)
+    return np.ascontiguousarray(np.moveaxis(features, 0, -1), dtype=dtype)
+
+
+def normalize_points(points, method='minmax'):
+    """
+    Normalize landmark coordinates of one hand or a whole stack at once
+
+    Methods:
+    - 'minmax': Scale each axis to [0, 1] (an axis with no extent is only shifted)
+    - 'palm': Relative to the wrist, in palm widths (index MCP to pinky MCP);
+      hands with zero palm width are returned unchanged
+    Any other method returns the coordinates unchanged.
+
+    Args:
+        points: (..., 21, 2) array-like of x, y coordinates (never modified)
+        method: 'minmax' or 'palm'
+
+    Returns:
+        New (..., 21, 2) float64 array
+    """
+    points = np.array(points, dtype=np.float64)
+
+    if method == 'minmax':
+        mins = points.min(axis=-2, keepdims=True)
+        ranges = points.max(axis=-2, keepdims=True) - mins
+        ranges[ranges == 0] = 1
+        return (points - mins) / ranges
+
+    if method == 'palm':
+        palm = points[..., 5, :] - points[..., 17, :]
+        palm_width = np.sqrt(palm[..., 0] ** 2 + palm[..., 1] ** 2)[..., None, None]
+        return np.where(palm_width == 0, points,
+                        (points - points[..., WRIST:WRIST + 1, :]) / np.where(palm_width == 0, 1, palm_width))
+
+    return points
+
+
+def remove_outlier_points(points, history, threshold=0.2, window=5):
+    """
+    Replace coordinates that jump away from their recent median (median filter)
+
+    A coordinate is replaced by the median of its last `window` history
+    values when it deviates from that median by more than threshold times
+    the history's extent on that axis. Works on one frame or a batch of
+    frames, each with its own history.
+
+    Args:
+        points: (..., 21, 2) array-like of the current frame(s) (never modified)
+        history: (..., H, 21, 2) array-like of previous frames, oldest first
+        threshold: Maximum allowed deviation as a fraction of the history extent
+        window: Number of most recent history frames used
+
+    Returns:
+        New (..., 21, 2) float64 array (an unchanged copy when H < 3)
+    """
+    points = np.array(points, dtype=np.float64)
+    history = np.asarray(history, dtype=np.float64)
+    if history.shape[-3] < 3:
+        return points
+
+    recent = history[..., -window:, :, :]
+    medians = np.median(recent, axis=-3)
+    extents = recent.max(axis=-3) - recent.min(axis=-3)
+    return np.where(np.abs(points - medians) > threshold * extents, medians, points)
 
 
 class AdvancedFeatureExtractor:
@@ -14,6 +254,10 @@ class AdvancedFeatureExtractor:
     - Sign Language Recognition using CNNs (IEEE)
     - MediaPipe Hand Gesture Recognition (Google Research)
     - Real-time ASL Recognition Systems (ACM)
+    
+    OPTIMIZED: every feature is computed at once into a flat vector
+    (compute_feature_vector); the per-group dicts are views of that vector
+    keyed through FEATURE_COLUMNS.
     """
     
     def __init__(self):
@@ -31,6 +275,44 @@ class AdvancedFeatureExtractor:
             self.ring_indices,
             self.pinky_indices
         ]
+        self.feature_names = FEATURE_NAMES
+        self.feature_columns = FEATURE_COLUMNS
+    
+    def extract_feature_vector(self, landmarks, dtype=np.float32):
+        """
+        Extract the flat feature vector (stable column order, see FEATURE_NAMES)
+        
+        Args:
+            landmarks: Landmarks, legacy list of [id, x, y] or (21, 2) points
+            dtype: Output dtype (default float32)
+            
+        Returns:
+            (NUM_FEATURES,) array, or None if there are fewer than 21 landmarks
+        """
+        points = self._points(landmarks)
+        if points is None:
+            return None
+        return compute_feature_vector(points, dtype)
+    
+    def extract_feature_matrix(self, points, dtype=np.float32):
+        """
+        Extract feature vectors for a whole stack of hands at once (training, offline evaluation)
+        
+        Row i equals extract_feature_vector(points[i]) bit for bit; the whole
+        stack goes through the same few dozen array operations, so 100k
+        hands take a fraction of a second.
+        
+        Args:
+            points: (N, 21, 2) array-like of x, y coordinates
+            dtype: Output dtype (default float32)
+        
+        Returns:
+            (N, NUM_FEATURES) array in FEATURE_NAMES column order
+        """
+        points = np.asarray(points, dtype=np.float64)
+        if points.ndim != 3 or points.shape[1] < 21 or points.shape[2] != 2:
+            raise ValueError(f"Expected an (N, 21, 2) landmark stack, got shape {points.shape}")
+        return compute_feature_vector(points, dtype)
     
     def extract_all_features(self, landmarks: List) -> Dict:
         """
@@ -40,364 +322,99 @@ class AdvancedFeatureExtractor:
         - geometric_features: distances, angles, ratios
         - statistical_features: mean, variance, entropy
         - topological_features: hand shape descriptors
+        
+        Built from the flat feature vector (computed in float64 so the
+        values match the original per-pair calculations).
         """
-        if len(landmarks) < 21:
+        vector = self.extract_feature_vector(landmarks, dtype=np.float64)
+        if vector is None:
             return {}
+        return self.vector_to_dict(vector)
+    
+    @staticmethod
+    def vector_to_dict(vector) -> Dict:
+        """
+        Group a flat feature vector back into {'distances': {...}, 'angles': {...}, ...}
         
-        features = {}
-        
-        # 1. Geometric Features
-        features['distances'] = self.extract_distance_features(landmarks)
-        features['angles'] = self.extract_angle_features(landmarks)
-        features['ratios'] = self.extract_ratio_features(landmarks)
-        
-        # 2. Statistical Features
-        features['statistics'] = self.extract_statistical_features(landmarks)
-        
-        # 3. Topological Features
-        features['topology'] = self.extract_topological_features(landmarks)
-        
-        # 4. Finger-specific Features
-        features['fingers'] = self.extract_finger_features(landmarks)
-        
-        return features
+        Args:
+            vector: (NUM_FEATURES,) array from extract_feature_vector
+            
+        Returns:
+            Nested dict of feature group -> feature name -> float
+        """
+        values = vector.tolist()
+        return {group: {name: values[FEATURE_COLUMNS[name]] for name in names}
+                for group, names in FEATURE_GROUPS.items()}
+    
+    def _group(self, landmarks, group):
+        """One group's dict from the flat vector (empty for incomplete hands)"""
+        features = self.extract_all_features(landmarks)
+        return features.get(group, {})
     
     def extract_distance_features(self, landmarks: List) -> Dict:
         """
         Extract distance-based features
-        - Inter-finger distances
-        - Finger-to-palm distances
+        - Fingertip-to-wrist distances
+        - Adjacent fingertip distances
+        - Finger lengths
         - Normalized by palm width
         """
-        wrist = landmarks[0]
-        palm_width = self._calculate_distance(landmarks[5][1:], landmarks[17][1:])
-        
-        features = {}
-        
-        # 1. Fingertip-to-wrist distances (normalized)
-        for i, (name, tip_idx) in enumerate([
-            ('thumb', 4), ('index', 8), ('middle', 12), ('ring', 16), ('pinky', 20)
-        ]):
-            dist = self._calculate_distance(landmarks[tip_idx][1:], wrist[1:])
-            features[f'{name}_wrist_dist'] = dist / palm_width
-        
-        # 2. Adjacent fingertip distances (normalized)
-        tip_indices = [4, 8, 12, 16, 20]
-        for i in range(len(tip_indices) - 1):
-            dist = self._calculate_distance(
-                landmarks[tip_indices[i]][1:],
-                landmarks[tip_indices[i+1]][1:]
-            )
-            features[f'spread_{i}'] = dist / palm_width
-        
-        # 3. Finger length ratios (for hand shape)
-        for i, (name, finger_indices) in enumerate([
-            ('thumb', self.thumb_indices),
-            ('index', self.index_indices),
-            ('middle', self.middle_indices),
-            ('ring', self.ring_indices),
-            ('pinky', self.pinky_indices)
-        ]):
-            length = sum(
-                self._calculate_distance(
-                    landmarks[finger_indices[j]][1:],
-                    landmarks[finger_indices[j+1]][1:]
-                )
-                for j in range(len(finger_indices) - 1)
-            )
-            features[f'{name}_length'] = length / palm_width
-        
-        return features
+        return self._group(landmarks, 'distances')
     
     def extract_angle_features(self, landmarks: List) -> Dict:
         """
         Extract angle-based features
         - Joint angles for each finger
         - Inter-finger angles
-        - Palm plane angles
+        - Hand orientation angle
         """
-        features = {}
-        
-        # 1. Finger joint angles
-        finger_names = ['thumb', 'index', 'middle', 'ring', 'pinky']
-        for name, indices in zip(finger_names, self.finger_groups):
-            if len(indices) >= 3:
-                # Calculate angle at middle joint
-                angle = self._calculate_angle(
-                    landmarks[indices[0]][1:],
-                    landmarks[indices[1]][1:],
-                    landmarks[indices[2]][1:]
-                )
-                features[f'{name}_joint_angle'] = angle
-                
-                # Calculate angle at tip joint (if exists)
-                if len(indices) >= 4:
-                    angle_tip = self._calculate_angle(
-                        landmarks[indices[1]][1:],
-                        landmarks[indices[2]][1:],
-                        landmarks[indices[3]][1:]
-                    )
-                    features[f'{name}_tip_angle'] = angle_tip
-        
-        # 2. Inter-finger angles (spread)
-        tip_indices = [4, 8, 12, 16, 20]
-        wrist = landmarks[0]
-        for i in range(len(tip_indices) - 1):
-            angle = self._calculate_angle(
-                landmarks[tip_indices[i]][1:],
-                wrist[1:],
-                landmarks[tip_indices[i+1]][1:]
-            )
-            features[f'interfinger_angle_{i}'] = angle
-        
-        # 3. Hand orientation angle
-        features['hand_orientation'] = self._calculate_hand_orientation(landmarks)
-        
-        return features
+        return self._group(landmarks, 'angles')
     
     def extract_ratio_features(self, landmarks: List) -> Dict:
         """
         Extract ratio-based features
-        - Aspect ratios
-        - Symmetry measures
-        - Convexity measures
+        - Bounding box aspect ratio
+        - Compactness
+        - Finger extension ratios
         """
-        features = {}
-        
-        # 1. Bounding box aspect ratio
-        x_coords = [lm[1] for lm in landmarks]
-        y_coords = [lm[2] for lm in landmarks]
-        width = max(x_coords) - min(x_coords)
-        height = max(y_coords) - min(y_coords)
-        features['aspect_ratio'] = width / (height + 0.001)
-        
-        # 2. Hand compactness (area / perimeter^2)
-        area = width * height
-        perimeter = 2 * (width + height)
-        features['compactness'] = area / (perimeter ** 2 + 0.001)
-        
-        # 3. Finger extension ratios
-        wrist = landmarks[0]
-        palm_center = landmarks[9]  # Middle finger MCP
-        palm_dist = self._calculate_distance(wrist[1:], palm_center[1:])
-        
-        tip_indices = [4, 8, 12, 16, 20]
-        for i, tip_idx in enumerate(tip_indices):
-            tip_dist = self._calculate_distance(wrist[1:], landmarks[tip_idx][1:])
-            features[f'extension_ratio_{i}'] = tip_dist / (palm_dist + 0.001)
-        
-        return features
+        return self._group(landmarks, 'ratios')
     
     def extract_statistical_features(self, landmarks: List) -> Dict:
         """
         Extract statistical features
-        - Mean, variance, skewness
-        - Distribution characteristics
+        - Mean, std, min, max, skewness of each axis
+        - Coordinate variance
         """
-        features = {}
-        
-        # Extract coordinates
-        x_coords = np.array([lm[1] for lm in landmarks])
-        y_coords = np.array([lm[2] for lm in landmarks])
-        
-        # 1. Position statistics
-        features['x_mean'] = np.mean(x_coords)
-        features['x_std'] = np.std(x_coords)
-        features['x_min'] = np.min(x_coords)
-        features['x_max'] = np.max(x_coords)
-        
-        features['y_mean'] = np.mean(y_coords)
-        features['y_std'] = np.std(y_coords)
-        features['y_min'] = np.min(y_coords)
-        features['y_max'] = np.max(y_coords)
-        
-        # 2. Distribution moments
-        features['x_skewness'] = self._calculate_skewness(x_coords)
-        features['y_skewness'] = self._calculate_skewness(y_coords)
-        
-        # 3. Spread metrics
-        features['coordinate_variance'] = np.var(x_coords) + np.var(y_coords)
-        
-        return features
+        return self._group(landmarks, 'statistics')
     
     def extract_topological_features(self, landmarks: List) -> Dict:
         """
         Extract topological features
-        - Hand shape descriptors
-        - Convex hull properties
-        - Finger arrangement patterns
+        - Fingertip spread area
+        - Palm openness (distance from palm centre to the tips)
+        - Finger alignment
         """
-        features = {}
-        
-        # 1. Fingertip configuration
-        tip_indices = [4, 8, 12, 16, 20]
-        tips = [landmarks[i] for i in tip_indices]
-        
-        # Calculate convex hull area (simplified)
-        features['tip_spread'] = self._calculate_spread_area(tips)
-        
-        # 2. Palm openness (distance from center to edges)
-        wrist = landmarks[0]
-        middle_mcp = landmarks[9]
-        palm_center = [(wrist[1] + middle_mcp[1]) / 2, (wrist[2] + middle_mcp[2]) / 2]
-        
-        distances = []
-        for tip_idx in tip_indices:
-            dist = self._calculate_distance(palm_center, landmarks[tip_idx][1:])
-            distances.append(dist)
-        
-        features['palm_openness'] = np.mean(distances)
-        features['palm_openness_std'] = np.std(distances)
-        
-        # 3. Finger alignment (are fingers parallel or spread?)
-        alignment_score = 0
-        for i in range(len(tip_indices) - 1):
-            # Calculate angle between adjacent fingers relative to palm
-            angle = self._calculate_angle(
-                landmarks[tip_indices[i]][1:],
-                palm_center,
-                landmarks[tip_indices[i+1]][1:]
-            )
-            alignment_score += abs(180 - angle)  # Deviation from straight
-        
-        features['finger_alignment'] = alignment_score / (len(tip_indices) - 1)
-        
-        return features
+        return self._group(landmarks, 'topology')
     
     def extract_finger_features(self, landmarks: List) -> Dict:
         """
         Extract per-finger features
         - Curvature
-        - Extension
         - Direction
+        - Straightness
         """
-        features = {}
-        
-        finger_names = ['thumb', 'index', 'middle', 'ring', 'pinky']
-        
-        for name, indices in zip(finger_names, self.finger_groups):
-            # 1. Finger curvature
-            curvature = self._calculate_finger_curvature(landmarks, indices)
-            features[f'{name}_curvature'] = curvature
-            
-            # 2. Finger direction vector
-            if len(indices) >= 2:
-                base = landmarks[indices[0]]
-                tip = landmarks[indices[-1]]
-                dx = tip[1] - base[1]
-                dy = tip[2] - base[2]
-                angle = math.atan2(dy, dx)
-                features[f'{name}_direction'] = angle
-            
-            # 3. Finger straightness score
-            straightness = self._calculate_straightness(landmarks, indices)
-            features[f'{name}_straightness'] = straightness
-        
-        return features
-    
-    # Helper methods
-    
-    def _calculate_distance(self, p1, p2):
-        """Euclidean distance"""
-        return math.sqrt((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2)
-    
-    def _calculate_angle(self, p1, p2, p3):
-        """Angle at p2 formed by p1-p2-p3 in degrees"""
-        v1 = np.array([p1[0] - p2[0], p1[1] - p2[1]])
-        v2 = np.array([p3[0] - p2[0], p3[1] - p2[1]])
-        
-        dot_product = np.dot(v1, v2)
-        mag1 = np.linalg.norm(v1)
-        mag2 = np.linalg.norm(v2)
-        
-        if mag1 * mag2 == 0:
-            return 0
-        
-        cos_angle = dot_product / (mag1 * mag2)
-        cos_angle = np.clip(cos_angle, -1.0, 1.0)
-        angle = np.arccos(cos_angle)
-        
-        return math.degrees(angle)
-    
-    def _calculate_hand_orientation(self, landmarks):
-        """Calculate hand rotation angle"""
-        wrist = landmarks[0]
-        middle_mcp = landmarks[9]
-        
-        dx = middle_mcp[1] - wrist[1]
-        dy = middle_mcp[2] - wrist[2]
-        
-        angle = math.degrees(math.atan2(dy, dx))
-        return (angle + 360) % 360
-    
-    def _calculate_skewness(self, data):
-        """Calculate skewness of distribution"""
-        mean = np.mean(data)
-        std = np.std(data)
-        if std == 0:
-            return 0
-        return np.mean(((data - mean) / std) ** 3)
+        return self._group(landmarks, 'fingers')
     
-    def _calculate_spread_area(self, points):
-        """Calculate approximate area covered by points"""
-        x_coords = [p[1] for p in points]
-        y_coords = [p[2] for p in points]
-        
-        width = max(x_coords) - min(x_coords)
-        height = max(y_coords) - min(y_coords)
-        
-        return width * height
-    
-    def _calculate_finger_curvature(self, landmarks, indices):
-        """Calculate finger curvature (0=straight, 1=bent)"""
-        if len(indices) < 2:
-            return 0
-        
-        # Direct distance
-        direct = self._calculate_distance(
-            landmarks[indices[0]][1:],
-            landmarks[indices[-1]][1:]
-        )
-        
-        # Sum of segments
-        segment_sum = sum(
-            self._calculate_distance(
-                landmarks[indices[i]][1:],
-                landmarks[indices[i+1]][1:]
-            )
-            for i in range(len(indices) - 1)
-        )
-        
-        # Straightness ratio (invert for curvature)
-        if segment_sum == 0:
-            return 0
-        straightness = direct / segment_sum
-        return 1 - straightness
-    
-    def _calculate_straightness(self, landmarks, indices):
-        """Calculate how straight a finger is (0=bent, 1=straight)"""
-        if len(indices) < 2:
-            return 0
-        
-        # Direct distance
-        direct = self._calculate_distance(
-            landmarks[indices[0]][1:],
-            landmarks[indices[-1]][1:]
-        )
-        
-        # Sum of segments
-        segment_sum = sum(
-            self._calculate_distance(
-                landmarks[indices[i]][1:],
-                landmarks[indices[i+1]][1:]
-            )
-            for i in range(len(indices) - 1)
-        )
-        
-        if segment_sum == 0:
-            return 0
-        
-        return direct / segment_sum
+    @staticmethod
+    def _points(landmarks):
+        """(21, 2) coordinates from Landmarks, a legacy list or a points array (None if incomplete)"""
+        if isinstance(landmarks, np.ndarray) and landmarks.ndim == 2 and landmarks.shape[1] == 2:
+            points = landmarks
+        else:
+            points = as_landmarks(landmarks).points
+        if len(points) < 21:
+            return None
+        return points[:21]
 
 
 class DataPreprocessor:
@@ -408,60 +425,62 @@ class DataPreprocessor:
     - Noise reduction
     """
     
+    @staticmethod
+    def _frame_points(landmarks):
+        """(21, 2) coordinates of Landmarks, a list of [id, x, y] or an (N, 2) array"""
+        if isinstance(landmarks, np.ndarray) and landmarks.shape[-1] == 2:
+            return landmarks
+        return as_landmarks(landmarks).points
+    
+    @staticmethod
+    def _like(landmarks, points):
+        """Wrap new coordinates in the input's type (Landmarks, (N, 2) array or [id, x, y] lists)"""
+        if isinstance(landmarks, np.ndarray) and landmarks.shape[-1] == 2:
+            return points
+        result = as_landmarks(landmarks).copy()
+        result.points[:] = points
+        return result if isinstance(landmarks, Landmarks) else result.tolist()
+    
     @staticmethod
     def normalize_landmarks(landmarks: List, method='minmax') -> List:
         """
-        Normalize landmark coordinates
+        Normalize landmark coordinates (a new object is returned, the input is never modified)
         
         Methods:
         - 'minmax': Scale to [0, 1] range
         - 'zscore': Zero mean, unit variance
         - 'palm': Normalize by palm size (scale-invariant)
-        """
-        if len(landmarks) < 21:
-            return landmarks
         
-        normalized = [lm.copy() for lm in landmarks]
+        OPTIMIZED: Vectorized via normalize_points; also takes an (N, 21, 2)
+        array to normalize a whole batch at once.
         
-        if method == 'minmax':
-            x_coords = [lm[1] for lm in landmarks]
-            y_coords = [lm[2] for lm in landmarks]
-            
-            x_min, x_max = min(x_coords), max(x_coords)
-            y_min, y_max = min(y_coords), max(y_coords)
-            
-            x_range = x_max - x_min if x_max != x_min else 1
-            y_range = y_max - y_min if y_max != y_min else 1
-            
-            for i in range(len(normalized)):
-                normalized[i][1] = (landmarks[i][1] - x_min) / x_range
-                normalized[i][2] = (landmarks[i][2] - y_min) / y_range
+        Returns:
+            Same type as the input (Landmarks, list of [id, x, y] or array)
+        """
+        if isinstance(landmarks, np.ndarray) and landmarks.ndim == 3:
+            return normalize_points(landmarks, method)
         
-        elif method == 'palm':
-            wrist = landmarks[0]
-            palm_width = math.sqrt(
-                (landmarks[5][1] - landmarks[17][1])**2 +
-                (landmarks[5][2] - landmarks[17][2])**2
-            )
-            
-            if palm_width == 0:
-                return normalized
-            
-            for i in range(len(normalized)):
-                normalized[i][1] = (landmarks[i][1] - wrist[1]) / palm_width
-                normalized[i][2] = (landmarks[i][2] - wrist[2]) / palm_width
+        if len(landmarks) < 21:
+            return landmarks
         
-        return normalized
+        points = DataPreprocessor._frame_points(landmarks)
+        return DataPreprocessor._like(landmarks, normalize_points(points, method))
     
     @staticmethod
     def apply_kalman_filter(current: List, history: List, alpha=0.7) -> List:
         """
         Apply Kalman-like filtering for smoothing
         alpha: Weight for current observation (0-1)
+        Returns Landmarks when given Landmarks, otherwise a list of [id, x, y]
         """
         if len(history) == 0:
             return current
         
+        if isinstance(current, Landmarks):
+            filtered = current.copy()
+            filtered.points[:] = alpha * current.points + (1 - alpha) * as_landmarks(history[-1]).points
+            return filtered
+        
         filtered = []
         prev = history[-1]
         
@@ -478,31 +497,31 @@ class DataPreprocessor:
     @staticmethod
     def remove_outliers(landmarks: List, history: List, threshold=0.2) -> List:
         """
-        Remove outlier landmarks using median filtering
-        threshold: Maximum allowed deviation from median
+        Replace outlier coordinates of the current frame with their recent median
+        
+        Each x/y of `landmarks` is compared with the median of the same
+        coordinate over the last 5 history frames; if it deviates by more than
+        threshold times that coordinate's extent, the median is used instead.
+        Needs at least 3 history frames (otherwise the input is returned).
+        
+        OPTIMIZED: Vectorized via remove_outlier_points; the input landmarks
+        are never modified. History may be a list of frames or an (H, 21, 2)
+        array. Also takes an (N, 21, 2) batch with an (N, H, 21, 2) history
+        (one per frame) or an (H, 21, 2) history shared by every frame.
+        
+        Returns:
+            Same type as the input (Landmarks, list of [id, x, y] or array)
         """
+        if isinstance(landmarks, np.ndarray) and landmarks.ndim == 3:
+            return remove_outlier_points(landmarks, history, threshold)
+        
         if len(history) < 3:
             return landmarks
         
-        cleaned = landmarks.copy()
-        
-        for i in range(len(landmarks)):
-            # Get history for this landmark
-            hist_x = [h[i][1] for h in history[-5:]]
-            hist_y = [h[i][2] for h in history[-5:]]
-            
-            # Calculate median
-            median_x = np.median(hist_x)
-            median_y = np.median(hist_y)
-            
-            # Calculate deviation
-            dev_x = abs(landmarks[i][1] - median_x)
-            dev_y = abs(landmarks[i][2] - median_y)
-            
-            # If outlier, replace with median
-            if dev_x > threshold * (max(hist_x) - min(hist_x)):
-                cleaned[i][1] = median_x
-            if dev_y > threshold * (max(hist_y) - min(hist_y)):
-                cleaned[i][2] = median_y
+        if isinstance(history, np.ndarray) and history.shape[-1] == 2:
+            recent = history[-5:]
+        else:
+            recent = np.stack([DataPreprocessor._frame_points(frame) for frame in history[-5:]])
         
-        return cleaned
+        points = DataPreprocessor._frame_points(landmarks)
+        return DataPreprocessor._like(landmarks, remove_outlier_points(points, recent, threshold))
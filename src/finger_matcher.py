@@ -6,6 +6,7 @@ Combines finger states, landmark positions, and photo similarity
 import numpy as np
 import cv2
 from typing import Dict, List, Tuple, Optional
+from hand_geometry import as_geometry
 
 class FingerMatcher:
     """
@@ -26,14 +27,16 @@ class FingerMatcher:
         Args:
             letter: The ASL letter
             finger_states: Dict with thumb, index, middle, ring, pinky states
-            landmarks: Hand landmark positions
+            landmarks: Hand landmark positions (Landmarks, HandGeometry or list of [id, x, y])
             photo_path: Path to training photo (optional)
         """
+        geometry = as_geometry(landmarks)
+        
         if letter not in self.patterns:
             self.patterns[letter] = []
         
         # Calculate geometric features
-        geometric_features = self._extract_geometric_features(landmarks)
+        geometric_features = self._extract_geometric_features(geometry)
         
         # Load photo if available
         photo_features = None
@@ -45,32 +48,28 @@ class FingerMatcher:
             'finger_count': sum(1 for v in finger_states.values() if v),
             'geometric_features': geometric_features,
             'photo_features': photo_features,
-            'landmarks': landmarks.copy()
+            'landmarks': geometry.landmarks.copy()
         }
         
         self.patterns[letter].append(pattern)
     
     def _extract_geometric_features(self, landmarks) -> Dict:
-        """Extract geometric features from landmarks"""
+        """Extract geometric features from landmarks (or a HandGeometry's distance matrix)"""
         try:
-            # Get key points
-            wrist = np.array([landmarks[0][1], landmarks[0][2]])
-            thumb_tip = np.array([landmarks[4][1], landmarks[4][2]])
-            index_tip = np.array([landmarks[8][1], landmarks[8][2]])
-            middle_tip = np.array([landmarks[12][1], landmarks[12][2]])
-            ring_tip = np.array([landmarks[16][1], landmarks[16][2]])
-            pinky_tip = np.array([landmarks[20][1], landmarks[20][2]])
+            # Landmark indices: 0 wrist, 4 thumb tip, 8 index tip, 12 middle tip,
+            # 16 ring tip, 20 pinky tip
+            distances = as_geometry(landmarks).distances
             
             # Calculate distances
             features = {
-                'index_middle_dist': np.linalg.norm(index_tip - middle_tip),
-                'middle_ring_dist': np.linalg.norm(middle_tip - ring_tip),
-                'ring_pinky_dist': np.linalg.norm(ring_tip - pinky_tip),
-                'thumb_index_dist': np.linalg.norm(thumb_tip - index_tip),
-                'hand_span': np.linalg.norm(index_tip - pinky_tip),
-                'palm_to_index': np.linalg.norm(wrist - index_tip),
-                'palm_to_middle': np.linalg.norm(wrist - middle_tip),
-                'palm_to_ring': np.linalg.norm(wrist - ring_tip),
+                'index_middle_dist': distances[8, 12],
+                'middle_ring_dist': distances[12, 16],
+                'ring_pinky_dist': distances[16, 20],
+                'thumb_index_dist': distances[4, 8],
+                'hand_span': distances[8, 20],
+                'palm_to_index': distances[0, 8],
+                'palm_to_middle': distances[0, 12],
+                'palm_to_ring': distances[0, 16],
             }
             
             return features
@@ -114,7 +113,7 @@ class FingerMatcher:
             return None, 0.0, {}
         
         current_finger_count = sum(1 for v in finger_states.values() if v)
-        current_geometric = self._extract_geometric_features(landmarks)
+        current_geometric = self._extract_geometric_features(landmarks)  # Pass a HandGeometry to share its distances
         current_photo_features = None
         
         if current_image is not None:
@@ -0,0 +1,108 @@
+"""
+Finger States Module
+Vectorized UP/DOWN classification for all five fingers at once
+Works on a single hand (21, 2) or a stack of frames (N, 21, 2)
+"""
+import numpy as np
+
+FINGER_NAMES = ['thumb', 'index', 'middle', 'ring', 'pinky']
+
+# Per finger (thumb to pinky): tip, mid-joint and base (knuckle) landmark indices
+TIP_INDICES = [4, 8, 12, 16, 20]
+MID_INDICES = [3, 6, 10, 14, 18]
+BASE_INDICES = [2, 5, 9, 13, 17]
+
+WRIST = 0
+PALM_CENTER = 9  # Middle finger base
+
+# Thresholds (same values as the original per-finger loop)
+FINGER_MAX_JOINT_ANGLE = 160     # Degrees - finger counts as straight below this
+FINGER_MIN_EXTENSION = 1.15      # Tip-to-wrist / base-to-wrist distance ratio
+THUMB_MIN_PALM_RATIO = 1.15      # Tip-to-palm / base-to-palm distance ratio
+THUMB_MIN_WRIST_ANGLE = 25       # Degrees between wrist->tip and wrist->palm
+THUMB_MIN_REACH = 0.85           # Tip-to-wrist vs index-base-to-wrist
+THUMB_MAX_JOINT_ANGLE = 150      # Degrees
+THUMB_MIN_VOTES = 3              # Of the 4 thumb conditions
+
+
+# Every vector the decision needs, as (from, to) landmark pairs, so one
+# gather + subtract builds them all. The first 6 pairs are the "u" sides of
+# the measured angles and the next 6 their "v" sides:
+#   0-4 / 6-10: base->mid and mid->tip for each finger (mid-joint angle)
+#   5 / 11:     wrist->thumb tip and wrist->palm centre (thumb direction)
+# The rest are only used for their lengths:
+#   12-16: wrist->tip, 17-21: wrist->base, 22-23: palm centre->thumb tip/base
+_VECTOR_FROM = np.array(BASE_INDICES + [WRIST] + MID_INDICES + [WRIST]
+                        + [WRIST] * 5 + [WRIST] * 5 + [PALM_CENTER] * 2)
+_VECTOR_TO = np.array(MID_INDICES + [TIP_INDICES[0]] + TIP_INDICES + [PALM_CENTER]
+                      + TIP_INDICES + BASE_INDICES + [TIP_INDICES[0], BASE_INDICES[0]])
+
+# Angle reported for a zero-length vector pair: fingers count as straight,
+# the thumb joint as folded and the thumb direction as aligned with the palm
+_ZERO_LENGTH_ANGLES = np.array([180, 0, 0, 0, 0, 0], dtype=np.float64)
+
+
+def compute_finger_states(points, distances=None):
+    """
+    Decide which fingers are extended (UP) for one or many hands
+
+    Index to pinky are UP when the mid joint is fairly straight and the tip
+    is clearly farther from the wrist than the knuckle. The thumb moves
+    differently, so it is UP when at least 3 of 4 tests pass: tip far from
+    the palm centre, pointing away from the palm, reaching past the index
+    knuckle, and a straight joint.
+
+    Args:
+        points: (21, 2) or (N, 21, 2) array-like of x, y pixel coordinates
+        distances: Optional precomputed (..., 21, 21) pairwise distance matrix
+                   (e.g. HandGeometry.distances) to read the vector lengths from
+
+    Returns:
+        (5,) or (N, 5) bool array, thumb to pinky (True = UP)
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if distances is None:
+        vectors = points[..., _VECTOR_TO, :] - points[..., _VECTOR_FROM, :]
+        lengths = np.sqrt(np.sum(vectors * vectors, axis=-1))
+    else:
+        # Only the 12 angle sides are needed as vectors; every length is a matrix entry
+        vectors = points[..., _VECTOR_TO[:12], :] - points[..., _VECTOR_FROM[:12], :]
+        lengths = np.asarray(distances, dtype=np.float64)[..., _VECTOR_FROM, _VECTOR_TO]
+
+    # Six angles at once: the five mid joints plus the thumb's direction
+    dots = np.sum(vectors[..., :6, :] * vectors[..., 6:12, :], axis=-1)
+    norms = lengths[..., :6] * lengths[..., 6:12]
+    nonzero = norms > 0
+    cos_angle = np.divide(dots, norms, out=np.zeros_like(dots), where=nonzero)
+    angles = np.arccos(np.clip(cos_angle, -1.0, 1.0)) * 180 / np.pi
+    angles = np.where(nonzero, angles, _ZERO_LENGTH_ANGLES)
+
+    tip_to_wrist = lengths[..., 12:17]
+    base_to_wrist = lengths[..., 17:22]
+    extension_ratio = tip_to_wrist / (base_to_wrist + 0.001)
+
+    # Index to pinky: straight mid joint and tip well beyond the knuckle
+    states = (angles[..., :5] < FINGER_MAX_JOINT_ANGLE) & (extension_ratio > FINGER_MIN_EXTENSION)
+
+    # Thumb: 3-of-4 vote
+    palm_ratio = lengths[..., 22] / (lengths[..., 23] + 0.001)
+    votes = ((palm_ratio > THUMB_MIN_PALM_RATIO).astype(np.int64)
+             + (angles[..., 5] > THUMB_MIN_WRIST_ANGLE)
+             + (tip_to_wrist[..., 0] > base_to_wrist[..., 1] * THUMB_MIN_REACH)
+             + (angles[..., 0] < THUMB_MAX_JOINT_ANGLE))
+    states[..., 0] = votes >= THUMB_MIN_VOTES
+
+    return states
+
+
+def finger_states_to_dict(states):
+    """
+    Convert one hand's (5,) state array to {'thumb': bool, ..., 'pinky': bool}
+
+    Args:
+        states: (5,) bool array from compute_finger_states
+
+    Returns:
+        Dict of finger name -> True (UP) / False (DOWN)
+    """
+    return {name: bool(state) for name, state in zip(FINGER_NAMES, states)}
@@ -0,0 +1,129 @@
+"""
+Frame Grabber Module
+Threaded camera capture that always serves the newest frame
+Keeps camera I/O off the main loop so detection never waits on the webcam
+"""
+import cv2
+import threading
+import time
+from collections import deque
+
+
+class FrameGrabber:
+    """
+    Dedicated capture thread that owns a cv2.VideoCapture
+
+    Only the most recent frames are kept in a small ring buffer. When the
+    consumer falls behind, stale frames are dropped instead of queued, so
+    read() always returns the freshest frame available.
+    """
+
+    def __init__(self, source=0, buffer_size=2):
+        """
+        Initialize the frame grabber (camera is opened, thread is not started)
+
+        Args:
+            source: Camera index or video path passed to cv2.VideoCapture
+            buffer_size: Number of frames kept in the ring buffer (drop-stale policy)
+        """
+        self.cap = cv2.VideoCapture(source)
+        self.buffer = deque(maxlen=max(1, buffer_size))
+
+        # Counters (read these for diagnostics)
+        self.frames_captured = 0   # Frames read from the camera
+        self.frames_dropped = 0    # Frames overwritten before being consumed
+        self.frames_consumed = 0   # Frames handed to the main loop
+
+        self._sequence = 0         # Sequence number of the newest frame
+        self._last_consumed = 0    # Sequence number of the last frame handed out
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+
+    def set(self, prop_id, value):
+        """Forward a property to the underlying capture (call before start())"""
+        return self.cap.set(prop_id, value)
+
+    def get(self, prop_id):
+        """Read a property from the underlying capture"""
+        return self.cap.get(prop_id)
+
+    def isOpened(self):
+        """Whether the underlying capture is open"""
+        return self.cap.isOpened()
+
+    def start(self):
+        """Start the capture thread"""
+        if self._running:
+            return self
+        self._running = True
+        self._thread = threading.Thread(target=self._capture_loop, name="FrameGrabber", daemon=True)
+        self._thread.start()
+        return self
+
+    def _capture_loop(self):
+        """Continuously read frames and keep only the newest ones"""
+        while self._running:
+            success, frame = self.cap.read()
+            if not success:
+                # Avoid spinning when the camera hiccups
+                time.sleep(0.005)
+                continue
+
+            with self._condition:
+                # Buffer is full and the oldest frame was never consumed -> dropped
+                if len(self.buffer) == self.buffer.maxlen and self.buffer[0][0] > self._last_consumed:
+                    self.frames_dropped += 1
+                self._sequence += 1
+                self.frames_captured += 1
+                self.buffer.append((self._sequence, frame))
+                self._condition.notify_all()
+
+    def read(self, timeout=1.0):
+        """
+        Get the freshest frame
+
+        Returns immediately when a frame newer than the last one consumed is
+        buffered; otherwise waits up to `timeout` seconds for the next one.
+
+        Args:
+            timeout: Maximum seconds to wait for a new frame
+
+        Returns:
+            (success, frame) like cv2.VideoCapture.read()
+        """
+        with self._condition:
+            if not self._has_new_frame():
+                self._condition.wait_for(self._has_new_frame, timeout=timeout)
+            if not self._has_new_frame():
+                return False, None
+
+            sequence, frame = self.buffer[-1]
+            # Everything older than the newest buffered frame is now stale
+            for older_sequence, _ in self.buffer:
+                if self._last_consumed < older_sequence < sequence:
+                    self.frames_dropped += 1
+            self._last_consumed = sequence
+            self.frames_consumed += 1
+            return True, frame
+
+    def _has_new_frame(self):
+        """Whether a frame newer than the last consumed one is buffered"""
+        return bool(self.buffer) and self.buffer[-1][0] > self._last_consumed
+
+    def get_stats(self):
+        """Get capture counters as a dict"""
+        with self._condition:
+            return {
+                'captured': self.frames_captured,
+                'dropped': self.frames_dropped,
+                'consumed': self.frames_consumed
+            }
+
+    def release(self):
+        """Stop the capture thread and release the camera"""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self.cap.release()
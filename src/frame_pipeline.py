@@ -0,0 +1,181 @@
+"""
+Frame Pipeline Module
+Runs per-frame stages (detect -> classify -> render) on separate worker threads
+Bounded queues between stages keep latency in check while frames overlap
+"""
+import queue
+import threading
+import time
+
+
+class PipelineStage:
+    """One worker thread that applies a function to every frame it receives"""
+
+    def __init__(self, name, func, input_queue, output_queue, stop_event):
+        """
+        Initialize a pipeline stage
+
+        Args:
+            name: Stage name (used in queue depth reports)
+            func: Callable applied to each payload; its return value is passed on
+            input_queue: Bounded queue this stage reads (sequence, payload) items from
+            output_queue: Bounded queue results are written to
+            stop_event: Shared event that shuts the worker down
+        """
+        self.name = name
+        self.func = func
+        self.input_queue = input_queue
+        self.output_queue = output_queue
+        self.stop_event = stop_event
+
+        # Statistics
+        self.frames_processed = 0
+        self.errors = 0
+        self.busy_time = 0.0
+
+        self.thread = threading.Thread(target=self._worker, name=f"Pipeline-{name}", daemon=True)
+
+    def _worker(self):
+        """Pull frames, process them and push results downstream (FIFO)"""
+        while not self.stop_event.is_set():
+            try:
+                sequence, payload = self.input_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            # A None payload marks a frame that failed upstream - pass it through
+            # so downstream stages keep the sequence numbers contiguous
+            if payload is not None:
+                start = time.perf_counter()
+                try:
+                    payload = self.func(payload)
+                except Exception as e:
+                    self.errors += 1
+                    print(f"⚠️  Pipeline stage '{self.name}' failed on frame {sequence}: {e}")
+                    payload = None
+                self.busy_time += time.perf_counter() - start
+                self.frames_processed += 1
+
+            _put_until_stopped(self.output_queue, (sequence, payload), self.stop_event)
+
+    def get_average_ms(self):
+        """Average processing time per frame in milliseconds"""
+        if self.frames_processed == 0:
+            return 0.0
+        return self.busy_time / self.frames_processed * 1000
+
+
+class FramePipeline:
+    """
+    Multi-stage frame executor
+
+    Each stage has its own worker thread and a bounded input queue, so frame
+    N+1 can be in detection while frame N is being classified or rendered.
+    Throughput approaches the slowest stage instead of the sum of all stages.
+    Results come out in submission order: every stage is a single worker
+    reading a FIFO queue, so frames can never overtake each other.
+    """
+
+    def __init__(self, stages, queue_size=2):
+        """
+        Initialize the pipeline (threads are not started)
+
+        Args:
+            stages: List of (name, func) tuples, in execution order
+            queue_size: Maximum frames waiting in front of each stage
+        """
+        self.stop_event = threading.Event()
+        self.stages = []
+
+        input_queue = queue.Queue(maxsize=queue_size)
+        self.input_queue = input_queue
+        for name, func in stages:
+            output_queue = queue.Queue(maxsize=queue_size)
+            self.stages.append(PipelineStage(name, func, input_queue, output_queue, self.stop_event))
+            input_queue = output_queue
+        self.output_queue = input_queue
+
+        self._next_submit = 0     # Sequence number for the next submitted frame (used in error reports)
+
+    def start(self):
+        """Start all stage workers"""
+        for stage in self.stages:
+            stage.thread.start()
+        return self
+
+    def submit(self, payload, timeout=None):
+        """
+        Feed a frame into the first stage
+
+        Blocks while the first queue is full (backpressure).
+
+        Args:
+            payload: Input for the first stage
+            timeout: Maximum seconds to wait for queue space (None = until stopped)
+
+        Returns:
+            True if the frame was queued, False on timeout or shutdown
+        """
+        item = (self._next_submit, payload)
+        if not _put_until_stopped(self.input_queue, item, self.stop_event, timeout):
+            return False
+        self._next_submit += 1
+        return True
+
+    def get(self, timeout=None):
+        """
+        Get the next finished frame, in submission order
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            (success, payload) - success is False on timeout; payload is None
+            when a stage failed on that frame
+        """
+        try:
+            _, payload = self.output_queue.get(timeout=timeout)
+        except queue.Empty:
+            return False, None
+        return True, payload
+
+    def get_queue_depths(self):
+        """Frames currently waiting in front of each stage (plus finished output)"""
+        depths = {stage.name: stage.input_queue.qsize() for stage in self.stages}
+        depths['output'] = self.output_queue.qsize()
+        return depths
+
+    def get_stage_stats(self):
+        """Per-stage processed frame counts and average processing times"""
+        return {
+            stage.name: {
+                'frames': stage.frames_processed,
+                'errors': stage.errors,
+                'avg_ms': stage.get_average_ms()
+            }
+            for stage in self.stages
+        }
+
+    def stop(self):
+        """Stop all workers and discard frames still in flight"""
+        self.stop_event.set()
+        for stage in self.stages:
+            if stage.thread.is_alive():
+                stage.thread.join(timeout=1.0)
+
+
+def _put_until_stopped(target_queue, item, stop_event, timeout=None):
+    """Put into a bounded queue, giving up when the pipeline stops or on timeout"""
+    deadline = None if timeout is None else time.perf_counter() + timeout
+    while not stop_event.is_set():
+        wait = 0.1
+        if deadline is not None:
+            wait = min(wait, deadline - time.perf_counter())
+            if wait <= 0:
+                return False
+        try:
+            target_queue.put(item, timeout=wait)
+            return True
+        except queue.Full:
+            continue
+    return False
@@ -0,0 +1,157 @@
+"""
+Frame Preprocessor Module
+Allocation-free mirror / brightness / color conversion for the detector
+Every output lands in a preallocated buffer (OpenCV dst arguments) and
+allocations are counted so steady-state behaviour can be verified
+"""
+import cv2
+import numpy as np
+from collections import deque
+
+
+class FramePreprocessor:
+    """
+    Reusable buffers for the per-frame preprocessing chain
+
+    Display frames (mirrored + brightened) rotate through a small pool so a
+    frame can still be in use downstream (e.g. in the pipelined executor)
+    while later frames are being prepared. Scratch buffers (RGB input for
+    MediaPipe, resized images, overlay blends) are consumed immediately and
+    are shared; they grow to the largest size requested and hand out views.
+    """
+
+    def __init__(self, alpha=1.15, beta=15, pool_size=1):
+        """
+        Initialize the preprocessor (buffers are allocated lazily on first use)
+
+        Args:
+            alpha: Brightness gain (same meaning as cv2.convertScaleAbs)
+            beta: Brightness offset (same meaning as cv2.convertScaleAbs)
+            pool_size: Number of display frames that may be alive at once
+        """
+        # Brightness boost as a lookup table - built with convertScaleAbs itself
+        # so the result is bit-identical to the old per-frame call
+        self.lut = cv2.convertScaleAbs(np.arange(256, dtype=np.uint8).reshape(1, 256), alpha=alpha, beta=beta)
+
+        self.pool_size = max(1, pool_size)
+        self._pool = [None] * self.pool_size
+        self._next_slot = 0
+        self._scratch = {}
+
+        # Allocation accounting
+        self.frames = 0
+        self.bytes_allocated = 0
+        self.frame_bytes = 0
+        self.bytes_history = deque(maxlen=100)
+
+    def set_pool_size(self, pool_size):
+        """
+        Resize the display-frame pool (e.g. to cover every frame in flight in a pipeline)
+
+        Args:
+            pool_size: Number of display frames that may be alive at once
+        """
+        self.pool_size = max(1, pool_size)
+        self._pool = (self._pool + [None] * self.pool_size)[:self.pool_size]
+        self._next_slot %= self.pool_size
+
+    def begin_frame(self):
+        """Start allocation accounting for a new frame"""
+        if self.frames > 0:
+            self.bytes_history.append(self.frame_bytes)
+        self.frames += 1
+        self.frame_bytes = 0
+
+    def prepare(self, img, mirror=False, enhance=True):
+        """
+        Mirror and brighten a camera frame into the next pooled display buffer
+
+        Args:
+            img: Raw camera frame (BGR)
+            mirror: Flip horizontally
+            enhance: Apply the brightness LUT
+
+        Returns:
+            Display frame (img itself when neither step is requested)
+        """
+        if not mirror and not enhance:
+            return img
+
+        slot = self._next_slot
+        self._next_slot = (slot + 1) % self.pool_size
+        buf = self._pool[slot]
+        if buf is None or buf.shape != img.shape:
+            buf = np.empty_like(img)
+            self._pool[slot] = buf
+            self._count(buf.nbytes)
+
+        src = img
+        if mirror:
+            self._check(cv2.flip(img, 1, dst=buf), buf)
+            src = buf
+        if enhance:
+            self._check(cv2.LUT(src, self.lut, dst=buf), buf)
+
+        return buf
+
+    def to_rgb(self, img):
+        """
+        Convert a BGR image (frame, crop or resized image) to RGB in a scratch buffer
+
+        Returns:
+            RGB view valid until the next to_rgb call
+        """
+        buf = self.scratch('rgb', img.shape[0], img.shape[1])
+        self._check(cv2.cvtColor(img, cv2.COLOR_BGR2RGB, dst=buf), buf)
+        return buf
+
+    def resize(self, img, width, height):
+        """
+        Resize a BGR image into a scratch buffer (INTER_AREA, for downscaling)
+
+        Returns:
+            Resized view valid until the next resize call
+        """
+        buf = self.scratch('resize', height, width)
+        self._check(cv2.resize(img, (width, height), dst=buf, interpolation=cv2.INTER_AREA), buf)
+        return buf
+
+    def scratch(self, name, height, width, channels=3):
+        """
+        Get a (height, width, channels) uint8 view of a named scratch buffer
+
+        The buffer only grows, so varying sizes (e.g. ROI crops) stop allocating
+        once the largest size has been seen.
+        """
+        buf = self._scratch.get(name)
+        if buf is None or buf.shape[0] < height or buf.shape[1] < width or buf.shape[2] != channels:
+            old_h, old_w = (buf.shape[0], buf.shape[1]) if buf is not None else (0, 0)
+            buf = np.empty((max(height, old_h), max(width, old_w), channels), dtype=np.uint8)
+            self._scratch[name] = buf
+            self._count(buf.nbytes)
+        return buf[:height, :width]
+
+    def _check(self, out, buf):
+        """Count an allocation if OpenCV ignored our dst buffer"""
+        if out.__array_interface__['data'][0] != buf.__array_interface__['data'][0]:
+            self._count(out.nbytes)
+
+    def _count(self, nbytes):
+        self.bytes_allocated += nbytes
+        self.frame_bytes += nbytes
+
+    def get_stats(self):
+        """
+        Get allocation statistics
+
+        Returns:
+            Dict with frames, total bytes allocated, bytes in the last frame and
+            the average over the last 100 completed frames
+        """
+        history = self.bytes_history
+        return {
+            'frames': self.frames,
+            'bytes_allocated': self.bytes_allocated,
+            'last_frame_bytes': self.frame_bytes,
+            'recent_bytes_per_frame': sum(history) / len(history) if history else 0.0
+        }
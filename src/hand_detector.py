@@ -3,15 +3,31 @@ Hand Detector Module
 Detects and tracks hand landmarks using MediaPipe
 Enhanced with advanced smoothing, stability detection, and outlier rejection
 """
+import copy
 import cv2
 import mediapipe as mp
 import numpy as np
 import time
-from collections import deque
+from types import SimpleNamespace
+from mediapipe.framework.formats import landmark_pb2
+from inference_scaler import InferenceScaleController
+from frame_preprocessor import FramePreprocessor
+from overlay import blend_rect, stamp_dots
+from landmark_filters import create_smoother
+from landmarks import Landmarks
+from hand_geometry import as_geometry
+from hand_tracks import HandTrack, match_tracks
+from detector_backends import SolutionsBackend, create_backend
 
 
 class HandDetector:
-    def __init__(self, mode=False, max_hands=1, detection_con=0.7, track_con=0.7):
+    # find_hands drawing levels: nothing / skeleton only / full visual style
+    DRAW_LEVELS = ('off', 'minimal', 'full')
+    
+    def __init__(self, mode=False, max_hands=1, detection_con=0.7, track_con=0.7,
+                 adaptive_skip=False, skip_interval=3, roi_mode=False, roi_redetect_interval=30,
+                 latency_target_ms=None, smoothing='moving_average', smoothing_params=None,
+                 draw_level='full', track_timeout=15, backend='solutions', backend_params=None):
         """
         Initialize the hand detector with BALANCED accuracy settings
         
@@ -20,134 +36,547 @@ class HandDetector:
             max_hands: Maximum number of hands to detect
             detection_con: Minimum detection confidence (balanced at 0.7)
             track_con: Minimum tracking confidence (balanced at 0.7)
+            adaptive_skip: Run MediaPipe only every Nth frame while the hand is stable
+            skip_interval: N for adaptive_skip (1 inference + N-1 extrapolated frames)
+            roi_mode: Run MediaPipe on a crop around the previous hand box instead of the full frame
+            roi_redetect_interval: Frames between forced full-frame detections in roi_mode
+            latency_target_ms: Per-frame inference budget; when set, the image fed to
+                               MediaPipe is downscaled to meet it (display frame untouched)
+            smoothing: Landmark smoother - 'moving_average' (7-frame weighted average),
+                       'one_euro', 'kalman', or a LandmarkSmoother instance
+            smoothing_params: Optional dict of constructor arguments for the smoother
+            draw_level: What find_hands(draw=True) draws - 'off', 'minimal'
+                        (skeleton only, near-free) or 'full' (highlight, extra dots, labels)
+            track_timeout: Frames a hand may go undetected before its track
+                           (smoothing, stability and wave history) is dropped
+            backend: Landmark source - 'solutions' (synchronous MediaPipe Hands),
+                     'live_stream' (asynchronous Tasks HandLandmarker), 'replay'
+                     (stored landmarks) or a DetectorBackend instance
+            backend_params: Optional dict of backend arguments (e.g. model_path, landmarks)
         """
+        if draw_level not in self.DRAW_LEVELS:
+            raise ValueError(f"Unknown draw level '{draw_level}' (use one of {self.DRAW_LEVELS})")
+        
         self.mode = mode
         self.max_hands = max_hands
         self.detection_con = detection_con
         self.track_con = track_con
         
-        # Initialize MediaPipe hands with OPTIMIZED settings for speed
+        # Initialize the landmark backend (Lite MediaPipe Hands graph by default)
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=self.mode,
-            max_num_hands=self.max_hands,
-            min_detection_confidence=self.detection_con,
-            min_tracking_confidence=self.track_con,
-            model_complexity=0  # 0=Lite (faster), 1=Full (slower but more accurate)
-        )
+        self.hands = create_backend(backend, self.max_hands, self.detection_con, self.track_con,
+                                    self.mode, **(backend_params or {}))
         self.mp_draw = mp.solutions.drawing_utils
-        
-        # ENHANCED: Kalman-style smoothing buffer for landmark positions
-        self.landmark_buffer = deque(maxlen=7)  # Increased from 5 to 7
-        self.smoothed_landmarks = None
+        self.draw_level = draw_level
+        
+        # Connection endpoints and the 5 intermediate dot positions along each (full level)
+        self.connections = np.array(sorted(self.mp_hands.HAND_CONNECTIONS))
+        self.dot_steps = np.arange(1, 6) / 6.0  # 0.167, 0.333, 0.5, 0.667, 0.833
+        
+        # Preallocated buffers for mirror/brightness/RGB conversion (no per-frame allocation)
+        self.preprocessor = FramePreprocessor(alpha=1.15, beta=15)
+        
+        # NEW: Per-hand tracks - each physical hand gets its own smoothing buffer,
+        # smoother, motion, stability and wave history (see hand_tracks.HandTrack)
+        self.smoothing = create_smoother(smoothing, **(smoothing_params or {}))
+        self.tracks = {}  # track_id -> HandTrack
+        self.hand_tracks = []  # HandTrack of each hand in self.results (by hand_no)
+        self.hand_points = []  # (21, 2) pixel coordinates of each hand in self.results
+        self.primary_track = None  # Track of hand 0 (kept while it is briefly lost)
+        self.next_track_id = 0
+        self.track_timeout = track_timeout
+        self.track_max_distance = 2.0  # Wrist jump (in hand sizes) still treated as the same hand
+        self.handedness_penalty = 0.5  # Extra association cost when handedness disagrees
         
         # NEW: Outlier detection
         self.outlier_threshold = 0.15  # 15% deviation threshold
+        self.max_outlier_streak = None  # Consecutive outliers that restart the track (None = never)
         
         # NEW: Hand stability tracking
-        self.stability_buffer = deque(maxlen=10)
-        self.is_hand_stable = True  # Start as True to allow initial detection
         self.stability_threshold = 0.15  # 15% movement threshold (very lenient)
         self.require_stability = False  # Can be toggled
         
         # Wave detection
-        self.hand_x_history = deque(maxlen=15)  # Track hand X position
         self.wave_threshold = 50  # Minimum movement for wave
         self.wave_cooldown = 3.0  # Seconds between wave detections
         self.last_wave_time = 0
         
-    def find_hands(self, img, draw=True, enhance_visual=True):
+        # Adaptive inference rate: skip MediaPipe on stable frames and extrapolate
+        self.adaptive_skip = adaptive_skip
+        self.skip_interval = max(1, skip_interval)
+        self.frame_count = 0
+        self.last_detection = None  # Last real MediaPipe result with a hand
+        self.frames_since_process = 0
+        self.results_extrapolated = False
+        self.frames_processed = 0
+        self.frames_extrapolated = 0
+        
+        # Region-of-interest tracking: second graph that only ever sees hand crops
+        # (kept separate so the full-frame graph's tracking state stays consistent;
+        # only for backends that run on whatever image they are given)
+        self.roi_mode = roi_mode and self.hands.supports_roi
+        self.roi_redetect_interval = roi_redetect_interval
+        self.roi_padding = 0.35  # Fraction of the hand box size added on each side
+        self.roi_min_size = 160  # Pixels - MediaPipe needs some context around the hand
+        self.roi_box = None  # (x_min, y_min, x_max, y_max) in frame pixels
+        self.frames_since_full = 0
+        self.frames_roi = 0
+        self.roi_hands = None
+        if self.roi_mode:
+            self.roi_hands = SolutionsBackend(self.max_hands, self.detection_con, self.track_con, self.mode)
+        
+        # Latency-driven inference resolution (None = always full resolution)
+        self.scale_controller = None
+        if latency_target_ms:
+            self.scale_controller = InferenceScaleController(target_ms=latency_target_ms)
+    
+    def reset(self):
+        """Clear all temporal state (tracks with their smoothing, stability and wave history) before a new video"""
+        self.tracks = {}
+        self.hand_tracks = []
+        self.hand_points = []
+        self.primary_track = None
+        self.next_track_id = 0
+        self.hands.reset()
+        self.last_wave_time = 0
+        self.frame_count = 0
+        self.last_detection = None
+        self.frames_since_process = 0
+        self.results_extrapolated = False
+        self.roi_box = None
+        self.frames_since_full = 0
+        if self.scale_controller:
+            self.scale_controller.reset()
+    
+    def output_settings(self):
+        """
+        Every setting that changes the landmarks this detector produces
+        
+        Used to key stored results (see LandmarkCache.key_for), so call it
+        before swapping in another backend or toggling modes for one run.
+        
+        Returns:
+            Dict of setting name -> plain value (str, number, bool or None)
+        """
+        settings = {
+            'mode': self.mode,
+            'max_hands': self.max_hands,
+            'detection_con': self.detection_con,
+            'track_con': self.track_con,
+            'backend': type(self.hands).__name__,
+            'adaptive_skip': self.adaptive_skip,
+            'skip_interval': self.skip_interval,
+            'roi_mode': self.roi_mode,
+            'roi_redetect_interval': self.roi_redetect_interval,
+            'roi_padding': self.roi_padding,
+            'roi_min_size': self.roi_min_size,
+            'latency_target_ms': self.scale_controller.target_ms if self.scale_controller else None,
+            'outlier_threshold': self.outlier_threshold,
+            'max_outlier_streak': self.max_outlier_streak,
+            'smoothing': type(self.smoothing).__name__
+        }
+        for name, value in self.smoothing.settings().items():
+            settings[f'smoothing_{name}'] = value
+        return settings
+        
+    def find_hands(self, img, draw=True, enhance_visual=True, mirror=False):
         """
         Find hands in the image with optimized visual quality
         
+        The returned image lives in a reused preprocessor buffer, so it is only
+        valid until the detector's pool wraps around (see FramePreprocessor).
+        
         Args:
             img: Input image (BGR format)
-            draw: Whether to draw landmarks on the image
+            draw: True (use self.draw_level), False, or a level from DRAW_LEVELS
             enhance_visual: Whether to enhance brightness/contrast for better visibility
+            mirror: Flip the image horizontally first (webcam mirror effect)
             
         Returns:
             Image with landmarks drawn (if draw=True)
         """
-        # OPTIMIZED: Lighter enhancement for better FPS
-        if enhance_visual:
-            # Quick brightness boost only (faster than filter2D)
-            img = cv2.convertScaleAbs(img, alpha=1.15, beta=15)
-        
-        # Convert to RGB for MediaPipe
-        img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        self.results = self.hands.process(img_rgb)
+        # OPTIMIZED: Flip + brightness boost (precomputed LUT) into a preallocated buffer
+        self.preprocessor.begin_frame()
+        img = self.preprocessor.prepare(img, mirror=mirror, enhance=enhance_visual)
+        
+        self.frame_count += 1
+        extrapolated = self._extrapolate_results(img) if self.adaptive_skip else None
+        
+        if extrapolated is not None:
+            # Stable hand: reuse the recent trajectory instead of running the graph
+            self.results = extrapolated
+            self.results_extrapolated = True
+            self.frames_since_process += 1
+            self.frames_extrapolated += 1
+        else:
+            start = time.perf_counter()
+            self.results = self._process_frame(img)
+            if self.scale_controller:
+                self.scale_controller.update((time.perf_counter() - start) * 1000)
+            self.frames_since_process = 0
+            self.frames_processed += 1
+            # Asynchronous backends hand out the previous result again until a new one
+            # arrives - treat a repeat like an extrapolated frame (not new evidence)
+            self.results_extrapolated = not getattr(self.hands, 'last_result_fresh', True)
+            if not self.results_extrapolated:
+                self.last_detection = self.results if self.results.multi_hand_landmarks else None
+        
+        # Pixel coordinates of every hand, then match each hand to its track
+        self._update_tracks(img)
         
         # Draw landmarks if hands detected
-        if self.results.multi_hand_landmarks and draw:
-            h, w, c = img.shape
-            for hand_landmarks in self.results.multi_hand_landmarks:
-                # Calculate hand bounding box for highlighting
-                x_coords = [lm.x for lm in hand_landmarks.landmark]
-                y_coords = [lm.y for lm in hand_landmarks.landmark]
-                
-                x_min, x_max = int(min(x_coords) * w), int(max(x_coords) * w)
-                y_min, y_max = int(min(y_coords) * h), int(max(y_coords) * h)
-                
-                # Add padding to bounding box
-                padding = 40
-                x_min = max(0, x_min - padding)
-                y_min = max(0, y_min - padding)
-                x_max = min(w, x_max + padding)
-                y_max = min(h, y_max + padding)
-                
-                # Draw semi-transparent highlight around hand region
-                overlay = img.copy()
-                cv2.rectangle(overlay, (x_min, y_min), (x_max, y_max), (0, 255, 0), 3)
-                cv2.addWeighted(overlay, 0.3, img, 0.7, 0, img)
-                
-                # Draw subtle filled rectangle as background for better dot visibility
-                overlay2 = img.copy()
-                cv2.rectangle(overlay2, (x_min, y_min), (x_max, y_max), (255, 255, 255), -1)
-                cv2.addWeighted(overlay2, 0.05, img, 0.95, 0, img)
-                
-                # Draw the base landmarks and connections with BRIGHTER colors
-                self.mp_draw.draw_landmarks(
-                    img, 
-                    hand_landmarks, 
-                    self.mp_hands.HAND_CONNECTIONS,
-                    self.mp_draw.DrawingSpec(color=(0, 255, 0), thickness=3, circle_radius=5),  # Larger green landmarks
-                    self.mp_draw.DrawingSpec(color=(0, 255, 255), thickness=3, circle_radius=2)  # Thicker cyan connections
-                )
-                
-                # ADD MORE DOTS: Draw intermediate dots along each connection
-                for connection in self.mp_hands.HAND_CONNECTIONS:
-                    start_idx = connection[0]
-                    end_idx = connection[1]
-                    
-                    start_landmark = hand_landmarks.landmark[start_idx]
-                    end_landmark = hand_landmarks.landmark[end_idx]
-                    
-                    start_x, start_y = int(start_landmark.x * w), int(start_landmark.y * h)
-                    end_x, end_y = int(end_landmark.x * w), int(end_landmark.y * h)
-                    
-                    # Draw 5 intermediate dots along each connection line (100 extra dots total!)
-                    for i in range(1, 6):
-                        t = i / 6.0  # Position along the line (0.167, 0.333, 0.5, 0.667, 0.833)
-                        mid_x = int(start_x + (end_x - start_x) * t)
-                        mid_y = int(start_y + (end_y - start_y) * t)
-                        cv2.circle(img, (mid_x, mid_y), 3, (255, 255, 0), -1)  # Brighter YELLOW dots, slightly larger
-                
-                # Label key fingertips for easy identification
-                finger_names = ['Thumb', 'Index', 'Middle', 'Ring', 'Pinky']
-                finger_tips = [4, 8, 12, 16, 20]
-                
-                for name, tip_idx in zip(finger_names, finger_tips):
-                    tip = hand_landmarks.landmark[tip_idx]
-                    tip_x, tip_y = int(tip.x * w), int(tip.y * h)
-                    
-                    # Draw finger label above fingertip
-                    cv2.putText(img, name, (tip_x - 30, tip_y - 15),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 2, cv2.LINE_AA)
-                    cv2.putText(img, name, (tip_x - 30, tip_y - 15),
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 0, 255), 1, cv2.LINE_AA)
+        level = self.draw_level if draw is True else (draw or 'off')
+        if self.results.multi_hand_landmarks and level != 'off':
+            for hand_landmarks, points in zip(self.results.multi_hand_landmarks, self.hand_points):
+                if level == 'minimal':
+                    self._draw_minimal(img, points)
+                else:
+                    self._draw_full(img, hand_landmarks, points)
         
         return img
     
+    def _update_tracks(self, img):
+        """
+        Associate this frame's hands with tracks (once per frame, for all hands)
+        
+        Each hand goes to the track whose last wrist position is nearest
+        (handedness breaks near-ties, see hand_tracks.match_tracks); hands
+        with no track close enough start a new one while there are fewer
+        than max_hands tracks, otherwise they take the nearest free track
+        (a jump is then handled by outlier rejection). Tracks not seen for
+        track_timeout frames are dropped, and tracks missing this frame
+        lose their wave history.
+        
+        Args:
+            img: Current frame (only its size is used)
+        """
+        h, w = img.shape[:2]
+        hands = self.results.multi_hand_landmarks or []
+        self.hand_points = [self._pixel_points(hand, w, h) for hand in hands]
+        labels = [self.get_hand_label(hand_no) for hand_no in range(len(hands))]
+        
+        for track_id in [tid for tid, track in self.tracks.items()
+                         if self.frame_count - track.last_seen > self.track_timeout]:
+            del self.tracks[track_id]
+        
+        candidates = list(self.tracks.values())
+        wrists = np.array([points[0] for points in self.hand_points]).reshape(-1, 2)
+        matches = match_tracks(candidates, wrists, labels,
+                               self.track_max_distance, self.handedness_penalty)
+        
+        # No room for another track: pair the leftovers regardless of distance
+        unmatched = [d for d, match in enumerate(matches) if match < 0]
+        free = [t for t in range(len(candidates)) if t not in matches]
+        if unmatched and free and len(candidates) >= self.max_hands:
+            leftovers = match_tracks([candidates[t] for t in free], wrists[unmatched],
+                                     [labels[d] for d in unmatched], np.inf, self.handedness_penalty)
+            for d, match in zip(unmatched, leftovers):
+                if match >= 0:
+                    matches[d] = free[match]
+        
+        self.hand_tracks = []
+        for points, label, match in zip(self.hand_points, labels, matches):
+            track = candidates[match] if match >= 0 else self._new_track(label)
+            track.observe(points, self.frame_count, label)
+            self.hand_tracks.append(track)
+        
+        for track in candidates:
+            if track.last_seen != self.frame_count:
+                track.clear_wave()
+        
+        if self.hand_tracks:
+            self.primary_track = self.hand_tracks[0]
+        elif self.primary_track is not None and self.primary_track.track_id not in self.tracks:
+            self.primary_track = None
+    
+    def _new_track(self, label=None):
+        """Start a track with a fresh ID and its own smoother"""
+        track = HandTrack(self.next_track_id, copy.deepcopy(self.smoothing), label)
+        self.tracks[track.track_id] = track
+        self.next_track_id += 1
+        return track
+    
+    @property
+    def is_hand_stable(self):
+        """Stability of the primary hand (hand 0, or the last one seen); True with no track"""
+        return self.primary_track.is_stable if self.primary_track is not None else True
+    
+    def get_track_id(self, hand_no=0):
+        """
+        Get the stable track ID of a hand in the current frame
+        
+        Args:
+            hand_no: Which hand (MediaPipe order, which can change between frames)
+            
+        Returns:
+            int track ID, or None if there is no such hand
+        """
+        if hand_no < len(self.hand_tracks):
+            return self.hand_tracks[hand_no].track_id
+        return None
+    
+    def find_all_positions(self, img, smooth=True):
+        """
+        Landmarks of every hand in the current frame, keyed by track ID
+        
+        Args:
+            img: Input image
+            smooth: Apply temporal smoothing (each hand with its own history)
+            
+        Returns:
+            Dict of track_id -> Landmarks, in MediaPipe hand order
+        """
+        return {track.track_id: self.find_position(img, hand_no, smooth)
+                for hand_no, track in enumerate(self.hand_tracks)}
+    
+    @staticmethod
+    def _pixel_points(hand_landmarks, w, h):
+        """(21, 2) int pixel coordinates of a MediaPipe hand (truncated like int())"""
+        normalized = np.array([(lm.x, lm.y) for lm in hand_landmarks.landmark])
+        return (normalized * (w, h)).astype(np.int64)
+    
+    def _draw_minimal(self, img, points):
+        """
+        Skeleton only: every connection in one polylines call plus one dot stamp
+        
+        Args:
+            img: Image to draw on (modified in place)
+            points: (21, 2) int pixel coordinates
+        """
+        segments = points[self.connections].astype(np.int32)
+        cv2.polylines(img, segments, False, (255, 255, 0), 2)  # Same cyan as the full skeleton
+        stamp_dots(img, points, 3, (0, 255, 0))
+    
+    def _draw_full(self, img, hand_landmarks, points):
+        """
+        Full visual style: hand highlight, MediaPipe skeleton, 100 extra dots and fingertip labels
+        
+        Args:
+            img: Image to draw on (modified in place)
+            hand_landmarks: MediaPipe NormalizedLandmarkList (for draw_landmarks)
+            points: (21, 2) int pixel coordinates of the same hand
+        """
+        h, w = img.shape[:2]
+        
+        # Calculate hand bounding box for highlighting (with padding)
+        padding = 40
+        x_min = max(0, int(points[:, 0].min()) - padding)
+        y_min = max(0, int(points[:, 1].min()) - padding)
+        x_max = min(w, int(points[:, 0].max()) + padding)
+        y_max = min(h, int(points[:, 1].max()) + padding)
+        
+        # Draw semi-transparent highlight around hand region
+        blend_rect(img, (x_min, y_min), (x_max, y_max), (0, 255, 0), 0.3, thickness=3)
+        
+        # Draw subtle filled rectangle as background for better dot visibility
+        blend_rect(img, (x_min, y_min), (x_max, y_max), (255, 255, 255), 0.05)
+        
+        # Draw the base landmarks and connections with BRIGHTER colors
+        self.mp_draw.draw_landmarks(
+            img, 
+            hand_landmarks, 
+            self.mp_hands.HAND_CONNECTIONS,
+            self.mp_draw.DrawingSpec(color=(0, 255, 0), thickness=3, circle_radius=5),  # Larger green landmarks
+            self.mp_draw.DrawingSpec(color=(0, 255, 255), thickness=3, circle_radius=2)  # Thicker cyan connections
+        )
+        
+        # ADD MORE DOTS: 5 intermediate dots along each connection (100 extra dots total!),
+        # all positions interpolated at once and stamped in one write
+        starts = points[self.connections[:, 0]][:, None, :]
+        ends = points[self.connections[:, 1]][:, None, :]
+        dots = (starts + (ends - starts) * self.dot_steps[None, :, None]).astype(np.int64)
+        stamp_dots(img, dots.reshape(-1, 2), 3, (255, 255, 0))  # Brighter YELLOW dots, slightly larger
+        
+        # Label key fingertips for easy identification
+        finger_names = ['Thumb', 'Index', 'Middle', 'Ring', 'Pinky']
+        finger_tips = [4, 8, 12, 16, 20]
+        
+        for name, tip_idx in zip(finger_names, finger_tips):
+            tip_x, tip_y = int(points[tip_idx, 0]), int(points[tip_idx, 1])
+            
+            # Draw finger label above fingertip
+            cv2.putText(img, name, (tip_x - 30, tip_y - 15),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 2, cv2.LINE_AA)
+            cv2.putText(img, name, (tip_x - 30, tip_y - 15),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 0, 255), 1, cv2.LINE_AA)
+    
+    def _process_frame(self, img):
+        """
+        Run MediaPipe on the frame, or only on the previous hand box in roi_mode
+        
+        Falls back to a full-frame detection when the hand is lost inside the
+        crop and every roi_redetect_interval frames (to pick up new hands).
+        
+        Args:
+            img: Frame to run inference on (BGR)
+            
+        Returns:
+            MediaPipe result with landmarks normalized to the full frame
+        """
+        h, w = img.shape[:2]
+        
+        if self.roi_mode and self.roi_box is not None and self.frames_since_full < self.roi_redetect_interval:
+            x_min, y_min, x_max, y_max = self.roi_box
+            crop_rgb = self.preprocessor.to_rgb(self._scale_for_inference(img[y_min:y_max, x_min:x_max]))
+            results = self.roi_hands.process(crop_rgb)
+            
+            if results.multi_hand_landmarks:
+                # Remap crop-normalized coordinates to full-frame-normalized ones
+                crop_w, crop_h = x_max - x_min, y_max - y_min
+                for hand_landmarks in results.multi_hand_landmarks:
+                    for lm in hand_landmarks.landmark:
+                        lm.x = (x_min + lm.x * crop_w) / w
+                        lm.y = (y_min + lm.y * crop_h) / h
+                        lm.z = lm.z * crop_w / w
+                
+                self.frames_since_full += 1
+                self.frames_roi += 1
+                self.roi_box = self._compute_roi_box(results, w, h)
+                return results
+            # Hand lost inside the crop - re-detect on the full frame right away
+        
+        # Convert to RGB for MediaPipe
+        img_rgb = self.preprocessor.to_rgb(self._scale_for_inference(img))
+        results = self.hands.process(img_rgb)
+        self.frames_since_full = 0
+        self.roi_box = self._compute_roi_box(results, w, h) if self.roi_mode else None
+        return results
+    
+    def _scale_for_inference(self, img):
+        """
+        Downscale an image to the controller's current inference scale
+        
+        MediaPipe returns normalized coordinates, so landmarks found on the
+        smaller image map straight back onto the full-size display frame.
+        
+        Args:
+            img: BGR image (full frame or ROI crop)
+            
+        Returns:
+            Resized image, or img itself at scale 1.0
+        """
+        if self.scale_controller is None or self.scale_controller.scale >= 1.0:
+            return img
+        
+        scale = self.scale_controller.scale
+        h, w = img.shape[:2]
+        return self.preprocessor.resize(img, max(1, int(w * scale)), max(1, int(h * scale)))
+    
+    def _compute_roi_box(self, results, w, h):
+        """
+        Padded square box around every detected hand, clipped to the frame
+        
+        Args:
+            results: MediaPipe result (full-frame normalized coordinates)
+            w, h: Frame size in pixels
+            
+        Returns:
+            (x_min, y_min, x_max, y_max) or None when no hand was found
+        """
+        if not results.multi_hand_landmarks:
+            return None
+        
+        x_coords = [lm.x for hand in results.multi_hand_landmarks for lm in hand.landmark]
+        y_coords = [lm.y for hand in results.multi_hand_landmarks for lm in hand.landmark]
+        x_min, x_max = min(x_coords) * w, max(x_coords) * w
+        y_min, y_max = min(y_coords) * h, max(y_coords) * h
+        
+        size = max(x_max - x_min, y_max - y_min)
+        size = max(size * (1 + 2 * self.roi_padding), self.roi_min_size)
+        center_x, center_y = (x_min + x_max) / 2, (y_min + y_max) / 2
+        
+        box = (
+            max(0, int(center_x - size / 2)),
+            max(0, int(center_y - size / 2)),
+            min(w, int(center_x + size / 2)),
+            min(h, int(center_y + size / 2))
+        )
+        if box[2] - box[0] < 2 or box[3] - box[1] < 2:
+            return None
+        return box
+    
+    def _extrapolate_results(self, img):
+        """
+        Build a MediaPipe-like result for this frame without running inference
+        
+        Only used while a single hand is stable: the last two entries of its
+        track's landmark_buffer give a per-frame velocity that is projected
+        forward to the current frame.
+        
+        Args:
+            img: Current frame (only its size is used)
+            
+        Returns:
+            Result object with multi_hand_landmarks/multi_handedness, or None
+            when this frame must go through MediaPipe
+        """
+        if self.frames_since_process >= self.skip_interval - 1:
+            return None
+        if self.last_detection is None or len(self.last_detection.multi_hand_landmarks) != 1:
+            return None
+        if len(self.hand_tracks) != 1:
+            return None
+        track = self.hand_tracks[0]
+        if not track.is_stable or not track.stability_window.is_full():
+            return None
+        if len(track.landmark_buffer) < 2:
+            return None
+        
+        # Both entries must come from the current run of detections (not from
+        # before a dropout or an outlier-rejected detection)
+        last_frame_no = track.landmark_buffer.frame_id(-1)
+        prev_frame_no = track.landmark_buffer.frame_id(-2)
+        if last_frame_no != self.frame_count - 1 - self.frames_since_process:
+            return None
+        if last_frame_no - prev_frame_no > self.skip_interval:
+            return None
+        
+        # The last accepted frame's displacement is exactly last - prev
+        if track.motion_frame != last_frame_no or track.motion is None:
+            return None
+        gap = last_frame_no - prev_frame_no
+        
+        # Fall back to inference as soon as the hand starts moving
+        if track.motion / gap >= self.stability_threshold:
+            return None
+        
+        last = track.landmark_buffer[-1]
+        velocity = track.displacement / gap
+        predicted = last + velocity * (self.frame_count - last_frame_no)
+        
+        h, w = img.shape[:2]
+        source = self.last_detection.multi_hand_landmarks[0].landmark
+        hand = landmark_pb2.NormalizedLandmarkList()
+        for (px, py), lm in zip(predicted, source):
+            # +0.5 so find_position's int() truncation lands back on the same pixel
+            hand.landmark.add(x=(int(px) + 0.5) / w, y=(int(py) + 0.5) / h, z=lm.z)
+        
+        return SimpleNamespace(multi_hand_landmarks=[hand],
+                               multi_handedness=self.last_detection.multi_handedness)
+    
+    def close(self):
+        """Release the backend graphs (the detector can't be used afterwards)"""
+        self.hands.close()
+        if self.roi_hands is not None:
+            self.roi_hands.close()
+    
+    def get_inference_stats(self):
+        """
+        Get adaptive inference counters
+        
+        Returns:
+            Dict with processed/extrapolated/ROI-cropped frame counts and the skipped fraction
+        """
+        total = self.frames_processed + self.frames_extrapolated
+        return {
+            'processed': self.frames_processed,
+            'extrapolated': self.frames_extrapolated,
+            'roi': self.frames_roi,
+            'scale': self.scale_controller.scale if self.scale_controller else 1.0,
+            'bytes_per_frame': self.preprocessor.get_stats()['recent_bytes_per_frame'],
+            'skip_ratio': self.frames_extrapolated / total if total > 0 else 0.0
+        }
+    
     def get_hand_label(self, hand_no=0):
         """
         Get whether the hand is left or right
@@ -168,7 +597,7 @@ class HandDetector:
         Determine if viewing the back of the hand based on landmark positions
         
         Args:
-            landmarks: List of landmarks [[id, x, y], ...]
+            landmarks: Landmarks (or list of [id, x, y])
             
         Returns:
             True if back of hand, False if palm
@@ -196,26 +625,30 @@ class HandDetector:
         # This works when hand is relatively upright
         return abs(thumb_offset) < hand_width * 0.3
     
-    def detect_wave(self, landmarks):
+    def detect_wave(self, landmarks, hand_no=0):
         """
         Detect waving motion by tracking horizontal hand movement
         
+        Each call adds the wrist x of `landmarks` to the hand's running
+        direction-change and movement totals over the last 15 positions.
+        
         Args:
-            landmarks: List of landmarks [[id, x, y], ...]
+            landmarks: Landmarks (or list of [id, x, y]) of the current frame
+            hand_no: Which hand the landmarks belong to
             
         Returns:
             True if wave detected, False otherwise
         """
-        if len(landmarks) < 21:
-            self.hand_x_history.clear()
+        track = self.hand_tracks[hand_no] if hand_no < len(self.hand_tracks) else None
+        if len(landmarks) < 21 or track is None:
+            if track is not None:
+                track.clear_wave()
             return False
         
-        # Use wrist position for tracking
-        wrist_x = landmarks[0][1]
-        self.hand_x_history.append(wrist_x)
+        track.update_wave(landmarks[0][1])
         
-        # Need enough history to detect wave
-        if len(self.hand_x_history) < 10:
+        # Need enough history to detect wave (10 positions = 8 counted steps)
+        if len(track.wave_movement) < 8:
             return False
         
         # Check cooldown
@@ -223,36 +656,17 @@ class HandDetector:
         if current_time - self.last_wave_time < self.wave_cooldown:
             return False
         
-        # Analyze movement pattern - looking for left-right oscillation
-        positions = list(self.hand_x_history)
-        
-        # Count direction changes (wave should have multiple)
-        direction_changes = 0
-        total_movement = 0
-        
-        for i in range(1, len(positions) - 1):
-            # Check if direction changed
-            prev_diff = positions[i] - positions[i-1]
-            curr_diff = positions[i+1] - positions[i]
-            
-            if prev_diff * curr_diff < 0:  # Sign change = direction change
-                direction_changes += 1
-            
-            total_movement += abs(curr_diff)
-        
         # Wave detected if:
         # 1. Multiple direction changes (at least 2 for a wave)
         # 2. Significant total movement
-        # 3. Hand is extended (fingers visible)
-        
         is_waving = (
-            direction_changes >= 2 and 
-            total_movement > self.wave_threshold
+            track.wave_reversals.sum >= 2 and 
+            track.wave_movement.sum > self.wave_threshold
         )
         
         if is_waving:
             self.last_wave_time = current_time
-            self.hand_x_history.clear()  # Clear for next detection
+            track.clear_wave()  # Clear for next detection
         
         return is_waving
     
@@ -260,140 +674,126 @@ class HandDetector:
         """
         Find the position of hand landmarks with optional smoothing
         
+        Smoothing, outlier rejection and stability use the hand's own track,
+        so with several hands each keeps its own history. The smoothed result
+        is computed once per frame; repeated calls return the same landmarks.
+        
         Args:
             img: Input image
             hand_no: Which hand to get landmarks from (default: 0)
             smooth: Apply temporal smoothing
             
         Returns:
-            List of landmarks with [id, x, y] format
+            Landmarks ([id, x, y] rows in pixels; empty if no hand)
         """
-        landmark_list = []
-        
-        if self.results.multi_hand_landmarks:
-            if hand_no < len(self.results.multi_hand_landmarks):
-                hand = self.results.multi_hand_landmarks[hand_no]
-                
-                for id, lm in enumerate(hand.landmark):
-                    h, w, c = img.shape
-                    # Convert normalized coordinates to pixel coordinates
-                    cx, cy = int(lm.x * w), int(lm.y * h)
-                    landmark_list.append([id, cx, cy])
-                
-                # Apply ENHANCED smoothing with outlier rejection
-                if smooth and len(landmark_list) == 21:
-                    # Check for outliers before adding to buffer
-                    if len(self.landmark_buffer) > 0:
-                        if not self._is_outlier(landmark_list):
-                            self.landmark_buffer.append(landmark_list)
-                    else:
-                        self.landmark_buffer.append(landmark_list)
-                    
-                    # Enhanced weighted averaging (more recent frames have more weight)
-                    if len(self.landmark_buffer) >= 3:
-                        smoothed = []
-                        buffer_size = len(self.landmark_buffer)
-                        
-                        for i in range(21):
-                            # Weighted average: recent frames weighted higher
-                            weighted_x = 0
-                            weighted_y = 0
-                            total_weight = 0
-                            
-                            for j, frame in enumerate(self.landmark_buffer):
-                                weight = (j + 1) / buffer_size  # Linear weighting
-                                weighted_x += frame[i][1] * weight
-                                weighted_y += frame[i][2] * weight
-                                total_weight += weight
-                            
-                            avg_x = int(weighted_x / total_weight)
-                            avg_y = int(weighted_y / total_weight)
-                            smoothed.append([i, avg_x, avg_y])
-                        
-                        landmark_list = smoothed
-                        
-                        # Update stability tracking
-                        self._update_stability(landmark_list)
-        
-        return landmark_list
+        if hand_no >= len(self.hand_tracks):
+            return Landmarks()
+        
+        track = self.hand_tracks[hand_no]
+        points = self.hand_points[hand_no]
+        if not smooth:
+            return Landmarks.from_points(points)
+        if track.output_frame == self.frame_count:
+            return track.output.copy()
+        
+        landmarks = self._smooth_track(track, points)
+        track.output_frame = self.frame_count
+        track.output = landmarks
+        return landmarks.copy()
     
-    def _is_outlier(self, current_landmarks):
+    def _smooth_track(self, track, points):
         """
-        Check if current landmarks are outliers compared to recent history
+        Update one track with this frame's raw points and return its smoothed landmarks
         
         Args:
-            current_landmarks: Current frame landmarks
+            track: HandTrack the points were associated with
+            points: (21, 2) raw pixel coordinates
             
         Returns:
-            True if outlier, False otherwise
+            Landmarks (raw until the track has enough history)
         """
-        if len(self.landmark_buffer) == 0:
-            return False
-        
-        # Compare with most recent frame
-        last_frame = self.landmark_buffer[-1]
-        
-        # Calculate average distance between corresponding landmarks
-        total_distance = 0
-        for i in range(21):
-            dx = current_landmarks[i][1] - last_frame[i][1]
-            dy = current_landmarks[i][2] - last_frame[i][2]
-            distance = np.sqrt(dx**2 + dy**2)
-            total_distance += distance
-        
-        avg_distance = total_distance / 21
+        landmarks = Landmarks.from_points(points)
+        
+        # Apply ENHANCED smoothing with outlier rejection
+        if self.results_extrapolated:
+            # Extrapolated frames are smoothed but never enter the buffer
+            # (and don't count as stability evidence)
+            if len(track.landmark_buffer) >= 2:
+                smoothed = track.smoother.peek(points, self.frame_count).astype(np.int64)
+                landmarks = Landmarks.from_points(smoothed)
+            return landmarks
+        
+        # The displacement from the last accepted frame decides outliers (and
+        # is reused by adaptive skip's extrapolation)
+        is_outlier = False
+        if len(track.landmark_buffer) > 0:
+            track.measure_motion(points, self.frame_count)
+            is_outlier = self._is_outlier(track)
+        
+        if not is_outlier:
+            track.outlier_streak = 0
+        else:
+            track.outlier_streak += 1
+            if self.max_outlier_streak is not None and track.outlier_streak >= self.max_outlier_streak:
+                # Opt-in: after several jumps in a row treat the hand as really
+                # moved and restart the history from this frame. By default the
+                # track keeps rejecting until the hand comes back near its last
+                # accepted position, as the original detector did.
+                track.restart()
+                is_outlier = False
+        
+        # Outliers never reach the buffer or the smoother
+        if not is_outlier:
+            track.landmark_buffer.append(points, self.frame_count)
+            smoothed = track.smoother.update(points, self.frame_count)
+        else:
+            smoothed = track.smoother.estimate()
         
-        # Calculate hand size for normalization
-        wrist = last_frame[0]
-        middle_mcp = last_frame[9]
-        hand_size = np.sqrt((middle_mcp[1] - wrist[1])**2 + (middle_mcp[2] - wrist[2])**2)
+        # Temporal smoothing (weighted average, One-Euro or Kalman)
+        if len(track.landmark_buffer) >= 3 and smoothed is not None:
+            landmarks = Landmarks.from_points(smoothed.astype(np.int64))
+            
+            # Stability: smoothed output vs the previous raw frame
+            self._update_stability(track, landmarks.points)
         
-        # Outlier if average movement is more than threshold% of hand size
-        if hand_size > 0:
-            normalized_distance = avg_distance / hand_size
-            return normalized_distance > self.outlier_threshold
+        return landmarks
+    
+    def _is_outlier(self, track):
+        """
+        Check if the current frame jumped too far from the track's recent history
         
-        return False
+        Args:
+            track: HandTrack whose motion was just measured
+            
+        Returns:
+            True if outlier (average movement above outlier_threshold of hand size)
+        """
+        return track.motion is not None and track.motion > self.outlier_threshold
     
-    def _update_stability(self, landmarks):
+    def _update_stability(self, track, smoothed):
         """
-        Update hand stability tracking
+        Update a track's stability (running count of unsteady frames over the window)
         
         Args:
-            landmarks: Current smoothed landmarks
+            track: HandTrack whose smoothed landmarks were just computed
+            smoothed: (21, 2) smoothed landmark coordinates of this frame
         """
-        if len(self.landmark_buffer) < 2:
-            self.is_hand_stable = False
+        if len(track.landmark_buffer) < 2:
+            track.is_stable = False
             return
         
-        # Calculate movement from previous frame
-        prev_frame = self.landmark_buffer[-2]
-        
-        total_movement = 0
-        for i in range(21):
-            dx = landmarks[i][1] - prev_frame[i][1]
-            dy = landmarks[i][2] - prev_frame[i][2]
-            movement = np.sqrt(dx**2 + dy**2)
-            total_movement += movement
-        
-        avg_movement = total_movement / 21
-        
-        # Calculate hand size
-        wrist = landmarks[0]
-        middle_mcp = landmarks[9]
-        hand_size = np.sqrt((middle_mcp[1] - wrist[1])**2 + (middle_mcp[2] - wrist[2])**2)
+        # Movement of the smoothed hand from the previous raw frame, normalized by its size
+        displacement = smoothed - track.landmark_buffer[-2]
+        hand_size = np.sqrt(np.sum((smoothed[9] - smoothed[0]) ** 2))
+        if hand_size == 0:
+            track.is_stable = False
+            return
+        movement = np.sqrt(np.sum(displacement * displacement, axis=1)).mean() / hand_size
+        track.stability_window.append(1.0 if movement >= self.stability_threshold else 0.0)
         
-        # Normalize movement
-        if hand_size > 0:
-            normalized_movement = avg_movement / hand_size
-            self.stability_buffer.append(normalized_movement)
-            
-            # Hand is stable if recent movements are all below threshold
-            if len(self.stability_buffer) >= 3:  # Reduced from 5 to 3 frames
-                recent_movements = list(self.stability_buffer)[-3:]
-                self.is_hand_stable = all(m < self.stability_threshold for m in recent_movements)
-        else:
-            self.is_hand_stable = False
+        # Hand is stable if the last 3 movements are all below threshold
+        if track.stability_window.is_full():
+            track.is_stable = bool(track.stability_window.sum == 0)
     
     def get_landmark_features(self, img, hand_no=0):
         """
@@ -412,7 +812,7 @@ class HandDetector:
             return None
         
         # Extract x, y coordinates
-        coords = np.array([[lm[1], lm[2]] for lm in landmarks])
+        coords = landmarks.points
         
         # Normalize relative to wrist (landmark 0)
         wrist = coords[0]
@@ -433,117 +833,17 @@ class HandDetector:
         """
         Analyze which fingers are extended (UP) vs curled (DOWN)
         
+        All five fingers are evaluated in a few array operations (see
+        finger_states.compute_finger_states, which also takes (N, 21, 2) stacks).
+        A HandGeometry evaluates them once per frame however often it is asked.
+        
         Args:
-            landmarks: List of landmarks [[id, x, y], ...]
+            landmarks: Landmarks, HandGeometry (or list of [id, x, y])
             
         Returns:
             Dictionary with finger names and boolean states (True = UP, False = DOWN)
         """
-        if len(landmarks) < 21:
-            return None
-        
-        # Finger tip indices: [thumb, index, middle, ring, pinky]
-        tip_indices = [4, 8, 12, 16, 20]
-        # Finger base indices (knuckles)
-        base_indices = [2, 5, 9, 13, 17]
-        # Mid-joint indices for angle calculation
-        mid_indices = [3, 6, 10, 14, 18]
-        
-        finger_states = {}
-        finger_names = ['thumb', 'index', 'middle', 'ring', 'pinky']
-        
-        wrist = np.array([landmarks[0][1], landmarks[0][2]])
-        
-        for i, (tip_idx, mid_idx, base_idx, name) in enumerate(zip(tip_indices, mid_indices, base_indices, finger_names)):
-            tip = np.array([landmarks[tip_idx][1], landmarks[tip_idx][2]])
-            mid = np.array([landmarks[mid_idx][1], landmarks[mid_idx][2]])
-            base = np.array([landmarks[base_idx][1], landmarks[base_idx][2]])
-            
-            if name == 'thumb':
-                # IMPROVED THUMB DETECTION - Multi-factor approach
-                # The thumb moves perpendicular to other fingers and has unique geometry
-                
-                # Get key reference points
-                palm_center = np.array([landmarks[9][1], landmarks[9][2]])  # Middle finger base
-                index_base = np.array([landmarks[5][1], landmarks[5][2]])   # Index finger base
-                
-                # Method 1: Distance-based (primary)
-                # When thumb is extended, tip is far from palm center
-                tip_to_palm = np.linalg.norm(tip - palm_center)
-                base_to_palm = np.linalg.norm(base - palm_center)
-                distance_ratio = tip_to_palm / (base_to_palm + 0.001)
-                
-                # Method 2: Angle from wrist to thumb tip
-                # When extended, thumb points away from palm
-                wrist_to_tip = tip - wrist
-                wrist_to_palm = palm_center - wrist
-                
-                # Calculate angle between vectors
-                dot = np.dot(wrist_to_tip, wrist_to_palm)
-                norms = np.linalg.norm(wrist_to_tip) * np.linalg.norm(wrist_to_palm)
-                if norms > 0:
-                    cos_angle = np.clip(dot / norms, -1.0, 1.0)
-                    angle_deg = np.arccos(cos_angle) * 180 / np.pi
-                else:
-                    angle_deg = 0
-                
-                # Method 3: Thumb tip vs index base comparison
-                # Extended thumb is usually farther from wrist than index base
-                tip_to_wrist = np.linalg.norm(tip - wrist)
-                index_base_to_wrist = np.linalg.norm(index_base - wrist)
-                
-                # Method 4: Joint straightness
-                # Calculate if thumb joints are relatively straight
-                thumb_joint_mid = np.array([landmarks[3][1], landmarks[3][2]])
-                v1 = thumb_joint_mid - base
-                v2 = tip - thumb_joint_mid
-                joint_dot = np.dot(v1, v2)
-                joint_norms = np.linalg.norm(v1) * np.linalg.norm(v2)
-                if joint_norms > 0:
-                    joint_cos = np.clip(joint_dot / joint_norms, -1.0, 1.0)
-                    joint_angle = np.arccos(joint_cos) * 180 / np.pi
-                else:
-                    joint_angle = 180
-                
-                # Decision logic: Thumb is UP if multiple conditions are met
-                condition1 = distance_ratio > 1.15  # Tip significantly farther from palm
-                condition2 = angle_deg > 25  # Not too close to palm direction
-                condition3 = tip_to_wrist > index_base_to_wrist * 0.85  # Reasonable extension
-                condition4 = joint_angle < 150  # Joints relatively straight
-                
-                # Thumb is extended if at least 3 out of 4 conditions are true
-                votes = sum([condition1, condition2, condition3, condition4])
-                is_extended = votes >= 3
-                
-                finger_states[name] = is_extended
-            else:
-                # For other fingers, use improved angle + distance method
-                # Calculate vectors
-                v1 = mid - base  # Base to mid-joint
-                v2 = tip - mid   # Mid-joint to tip
-                
-                # Calculate angle between joints (0 = straight, 180 = curled back)
-                dot_product = np.dot(v1, v2)
-                norms = np.linalg.norm(v1) * np.linalg.norm(v2)
-                
-                if norms > 0:
-                    cos_angle = np.clip(dot_product / norms, -1.0, 1.0)
-                    angle = np.arccos(cos_angle) * 180 / np.pi
-                else:
-                    angle = 0
-                
-                # Also check distance from wrist
-                tip_dist = np.linalg.norm(tip - wrist)
-                base_dist = np.linalg.norm(base - wrist)
-                extension_ratio = tip_dist / (base_dist + 0.001)
-                
-                # Finger is extended if:
-                # 1. Angle is relatively straight (< 160 degrees)
-                # 2. Tip is farther from wrist than base
-                is_extended = (angle < 160) and (extension_ratio > 1.15)
-                finger_states[name] = is_extended
-        
-        return finger_states
+        return as_geometry(landmarks).finger_states
     
     def draw_finger_state_indicator(self, img, landmarks, x_offset=10, y_offset=200):
         """
@@ -551,7 +851,7 @@ class HandDetector:
         
         Args:
             img: Image to draw on
-            landmarks: List of landmarks [[id, x, y], ...]
+            landmarks: Landmarks (or list of [id, x, y])
             x_offset: X position for the indicator
             y_offset: Y position for the indicator
             
@@ -566,10 +866,8 @@ class HandDetector:
         # Create semi-transparent background panel
         panel_height = 180
         panel_width = 250
-        overlay = img.copy()
-        cv2.rectangle(overlay, (x_offset, y_offset), (x_offset + panel_width, y_offset + panel_height),
-                     (40, 40, 40), -1)
-        cv2.addWeighted(overlay, 0.7, img, 0.3, 0, img)
+        blend_rect(img, (x_offset, y_offset), (x_offset + panel_width, y_offset + panel_height),
+                   (40, 40, 40), 0.7)
         
         # Draw border
         cv2.rectangle(img, (x_offset, y_offset), (x_offset + panel_width, y_offset + panel_height),
@@ -0,0 +1,234 @@
+"""
+Hand Geometry Module
+Per-frame geometry of one hand (pairwise distances, joint angles, finger
+states, feature vector), each computed lazily and at most once, shared by
+the detector, classifiers and ML trainer
+"""
+import numpy as np
+
+from feature_extraction import AdvancedFeatureExtractor, compute_feature_vector
+from finger_states import compute_finger_states, finger_states_to_dict
+from landmarks import as_landmarks
+
+NUM_LANDMARKS = 21
+
+# Landmark chain of each finger (thumb to pinky): base, two inner joints, tip
+FINGER_CHAINS = np.array([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12],
+                          [13, 14, 15, 16], [17, 18, 19, 20]])
+
+# Joint-angle table columns, as (end, vertex, end) positions in a finger chain:
+#   0: first inner joint, 1: second inner joint, 2: first inner joint spanning to the tip
+JOINT_ANGLE_COLUMNS = ('joint', 'tip', 'bend')
+_JOINT_TRIPLES = np.array([[0, 1, 2], [1, 2, 3], [0, 1, 3]])
+_JOINT_A = FINGER_CHAINS[:, _JOINT_TRIPLES[:, 0]]
+_JOINT_VERTEX = FINGER_CHAINS[:, _JOINT_TRIPLES[:, 1]]
+_JOINT_B = FINGER_CHAINS[:, _JOINT_TRIPLES[:, 2]]
+_JOINT_TABLE_INDEX = {(int(a), int(vertex), int(b)): (finger, column)
+                      for finger in range(len(FINGER_CHAINS))
+                      for column, (a, vertex, b) in enumerate(zip(_JOINT_A[finger], _JOINT_VERTEX[finger],
+                                                                  _JOINT_B[finger]))}
+
+
+def _angles(points, a, vertex, b):
+    """
+    Angles in degrees at vertex between the rays to a and b (0 for zero-length rays)
+
+    Args:
+        points: (21, 2) coordinates
+        a, vertex, b: Equally shaped integer index arrays
+
+    Returns:
+        float64 array shaped like the index arrays
+    """
+    v1 = points[a] - points[vertex]
+    v2 = points[b] - points[vertex]
+    dots = v1[..., 0] * v2[..., 0] + v1[..., 1] * v2[..., 1]
+    mags = np.sqrt(v1[..., 0] ** 2 + v1[..., 1] ** 2) * np.sqrt(v2[..., 0] ** 2 + v2[..., 1] ** 2)
+    cos_angle = np.divide(dots, mags, out=np.zeros_like(dots), where=mags != 0)
+    angles = np.degrees(np.arccos(np.clip(cos_angle, -1.0, 1.0)))
+    return np.where(mags == 0, 0.0, angles)
+
+
+class HandGeometry:
+    """
+    Everything measured on one hand in one frame, computed on first use
+
+    Create one per hand per frame (as_geometry) and pass it to every
+    consumer instead of the landmarks: the 21x21 distance matrix, the
+    joint-angle table, finger states and the feature vector are then
+    computed at most once no matter how many consumers ask. It indexes
+    like Landmarks (len, [i][1], points, xs, ys), so code that only reads
+    landmarks accepts it unchanged.
+    """
+
+    def __init__(self, landmarks):
+        """
+        Args:
+            landmarks: Landmarks (or list of [id, x, y]) of one hand
+        """
+        self.landmarks = as_landmarks(landmarks)
+        self._distances = None
+        self._joint_angles = None
+        self._angle_cache = {}
+        self._finger_states = None
+        self._feature_vector = None
+        self._features = None
+
+    # ========== LANDMARKS INTERFACE (views, no copies) ==========
+
+    @property
+    def points(self):
+        """(N, 2) x, y coordinates"""
+        return self.landmarks.points
+
+    @property
+    def xs(self):
+        return self.landmarks.xs
+
+    @property
+    def ys(self):
+        return self.landmarks.ys
+
+    @property
+    def array(self):
+        return self.landmarks.array
+
+    def __len__(self):
+        return len(self.landmarks)
+
+    def __bool__(self):
+        return bool(self.landmarks)
+
+    def __getitem__(self, index):
+        return self.landmarks[index]
+
+    def __iter__(self):
+        return iter(self.landmarks)
+
+    def __array__(self, dtype=None, copy=None):
+        return self.landmarks.__array__(dtype, copy)
+
+    def __repr__(self):
+        return f"HandGeometry({len(self)} points)"
+
+    @property
+    def complete(self):
+        """True when all 21 landmarks are present"""
+        return len(self.landmarks) >= NUM_LANDMARKS
+
+    # ========== LAZILY COMPUTED GEOMETRY ==========
+
+    @property
+    def distances(self):
+        """(21, 21) matrix of pairwise landmark distances in pixels (symmetric, zero diagonal)"""
+        if self._distances is None:
+            points = self.points[:NUM_LANDMARKS]
+            deltas = points[:, None, :] - points[None, :, :]
+            self._distances = np.sqrt(deltas[..., 0] ** 2 + deltas[..., 1] ** 2)
+        return self._distances
+
+    def distance(self, i, j):
+        """Distance in pixels between landmarks i and j"""
+        return float(self.distances[i, j])
+
+    @property
+    def palm_width(self):
+        """Index MCP to pinky MCP distance (the usual scale normalizer)"""
+        return self.distance(5, 17)
+
+    @property
+    def joint_angles(self):
+        """
+        (5, 3) table of joint angles in degrees, thumb to pinky
+
+        Columns follow JOINT_ANGLE_COLUMNS: the angle at each finger's first
+        and second inner joint, and the angle at the first inner joint
+        between the base and the tip (e.g. MCP-PIP-TIP for the index).
+        """
+        if self._joint_angles is None:
+            self._joint_angles = _angles(self.points, _JOINT_A, _JOINT_VERTEX, _JOINT_B)
+        return self._joint_angles
+
+    def angle(self, a, vertex, b):
+        """
+        Angle in degrees at landmark vertex between landmarks a and b
+
+        Triples in the joint-angle table are read from it; any other triple
+        is computed once and remembered for the rest of the frame.
+
+        Args:
+            a, vertex, b: Landmark indices
+
+        Returns:
+            Angle in degrees (0 when a ray has zero length)
+        """
+        key = (a, vertex, b)
+        if key in _JOINT_TABLE_INDEX:
+            return float(self.joint_angles[_JOINT_TABLE_INDEX[key]])
+        if key not in self._angle_cache:
+            self._angle_cache[key] = float(_angles(self.points, np.array(a), np.array(vertex), np.array(b)))
+        return self._angle_cache[key]
+
+    def finger_curvature(self, chain):
+        """
+        Straightness of a landmark chain: end-to-end distance over the summed segments
+
+        Args:
+            chain: Landmark indices from base to tip
+
+        Returns:
+            Ratio (1.0 = perfectly straight)
+        """
+        distances = self.distances
+        direct = distances[chain[0], chain[-1]]
+        segments = sum(distances[chain[i], chain[i + 1]] for i in range(len(chain) - 1))
+        return float(direct / (segments + 0.001))
+
+    @property
+    def finger_states(self):
+        """
+        {'thumb': bool, ..., 'pinky': bool} (True = UP), or None for an incomplete hand
+
+        A new dict is returned on every call, so callers may keep or edit it.
+        """
+        if not self.complete:
+            return None
+        if self._finger_states is None:
+            self._finger_states = finger_states_to_dict(
+                compute_finger_states(self.points[:NUM_LANDMARKS], distances=self.distances))
+        return dict(self._finger_states)
+
+    @property
+    def feature_vector(self):
+        """(NUM_FEATURES,) float64 AdvancedFeatureExtractor vector, or None for an incomplete hand"""
+        if not self.complete:
+            return None
+        if self._feature_vector is None:
+            self._feature_vector = compute_feature_vector(self.points[:NUM_LANDMARKS], dtype=np.float64,
+                                                          distances=self.distances,
+                                                          joint_angles=self.joint_angles)
+        return self._feature_vector
+
+    @property
+    def features(self):
+        """Nested feature dict, as AdvancedFeatureExtractor.extract_all_features returns ({} if incomplete)"""
+        if self._features is None:
+            vector = self.feature_vector
+            self._features = AdvancedFeatureExtractor.vector_to_dict(vector) if vector is not None else {}
+        return self._features
+
+
+def as_geometry(landmarks):
+    """
+    Accept a HandGeometry, Landmarks or a legacy [[id, x, y], ...] list
+
+    Args:
+        landmarks: HandGeometry, Landmarks or list of [id, x, y]
+
+    Returns:
+        HandGeometry (the same object when it already is one, so its
+        cached quantities are shared)
+    """
+    if isinstance(landmarks, HandGeometry):
+        return landmarks
+    return HandGeometry(landmarks)
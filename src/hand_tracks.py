@@ -0,0 +1,176 @@
+"""
+Hand Tracks Module
+Per-hand temporal state keyed by a stable track ID, plus frame-to-frame
+association of detected hands to tracks (nearest wrist, handedness as a hint)
+"""
+import numpy as np
+
+from landmark_buffer import LandmarkRingBuffer
+from running_stats import RunningWindow
+
+WRIST = 0
+PALM_CENTER = 9  # Middle finger base - wrist to here is the reference hand size
+
+
+class HandTrack:
+    """
+    Everything HandDetector remembers about one physical hand
+
+    Smoothing history, motion, stability and wave windows all live here, so
+    two hands (or two signers) never mix their histories. The detector owns
+    the thresholds and updates the track once per frame.
+    """
+
+    def __init__(self, track_id, smoother, label=None):
+        """
+        Args:
+            track_id: Stable integer ID (unique until HandDetector.reset())
+            smoother: LandmarkSmoother instance owned by this track
+            label: MediaPipe handedness ('Left'/'Right') or None
+        """
+        self.track_id = track_id
+        self.label = label
+
+        # Raw history for outlier/stability checks; the smoother produces the output
+        self.landmark_buffer = LandmarkRingBuffer(capacity=7)
+        self.smoother = smoother
+        self.outlier_streak = 0
+
+        # Displacement of every landmark since the last accepted frame
+        self.displacement = np.zeros((21, 2))
+        self.motion = None  # Mean displacement / hand size (None until measured)
+        self.motion_frame = -1  # Frame number the displacement belongs to
+
+        self.stability_window = RunningWindow(3)  # 1 = frame moved too much, 0 = steady
+        self.is_stable = True  # Start as True to allow initial detection
+
+        # Wave detection (wrist x passed to detect_wave, last 15 positions).
+        # Both windows get one entry per step that follows another step, so
+        # the first step after a clear only sets the direction.
+        self.wave_movement = RunningWindow(13)  # |dx| of each step
+        self.wave_reversals = RunningWindow(13)  # 1 where consecutive steps change direction
+        self.last_wrist_x = None
+        self.last_wrist_dx = None
+
+        # Association state: where the hand was last seen (raw, unsmoothed)
+        self.wrist = None
+        self.hand_size = 0.0
+        self.last_seen = -1
+
+        # find_position result for the current frame (computed once per frame)
+        self.output_frame = -1
+        self.output = None
+
+    def observe(self, points, frame_id, label=None):
+        """
+        Record where the hand was detected this frame (used for association only)
+
+        Args:
+            points: (21, 2) raw pixel coordinates
+            frame_id: Current frame number
+            label: Handedness reported for this frame (None keeps the old one)
+        """
+        self.wrist = points[WRIST].copy()
+        self.hand_size = float(np.sqrt(np.sum((points[PALM_CENTER] - points[WRIST]) ** 2)))
+        self.last_seen = frame_id
+        if label is not None:
+            self.label = label
+
+    def measure_motion(self, points, frame_id):
+        """
+        Compute this frame's displacement from the last accepted frame (once per frame)
+
+        Sets displacement (21, 2) and motion, the mean landmark displacement
+        divided by the reference hand size (wrist to middle finger MCP).
+        motion is None when the reference hand has no size.
+
+        Args:
+            points: (21, 2) raw landmark coordinates of the current frame
+            frame_id: Current frame number
+        """
+        reference = self.landmark_buffer[-1]
+        np.subtract(points, reference, out=self.displacement)
+        self.motion_frame = frame_id
+
+        hand_size = np.sqrt(np.sum((reference[PALM_CENTER] - reference[WRIST]) ** 2))
+        if hand_size > 0:
+            distances = np.sqrt(np.sum(self.displacement * self.displacement, axis=1))
+            self.motion = distances.mean() / hand_size
+        else:
+            self.motion = None
+
+    def restart(self):
+        """Drop the smoothing, motion and wave history (the track ID is kept)"""
+        self.landmark_buffer.clear()
+        self.smoother.reset()
+        self.clear_wave()
+        self.motion_frame = -1
+        self.outlier_streak = 0
+
+    def clear_wave(self):
+        """Forget wrist movement history"""
+        self.wave_movement.clear()
+        self.wave_reversals.clear()
+        self.last_wrist_x = None
+        self.last_wrist_dx = None
+
+    def update_wave(self, wrist_x):
+        """
+        Add one wrist x position to the wave totals
+
+        Args:
+            wrist_x: Horizontal wrist position of the current frame
+        """
+        if self.last_wrist_x is not None:
+            wrist_dx = wrist_x - self.last_wrist_x
+            if self.last_wrist_dx is not None:
+                self.wave_reversals.append(1.0 if self.last_wrist_dx * wrist_dx < 0 else 0.0)
+                self.wave_movement.append(abs(wrist_dx))
+            self.last_wrist_dx = wrist_dx
+        self.last_wrist_x = wrist_x
+
+
+def match_tracks(tracks, wrists, labels, max_distance=2.0, label_penalty=0.5):
+    """
+    Assign this frame's detected hands to existing tracks
+
+    Cost is the wrist-to-wrist distance measured in the track's hand sizes,
+    plus label_penalty when both handedness labels are known and disagree
+    (MediaPipe's handedness flickers, so it only breaks near-ties). Pairs
+    are taken greedily from the cheapest; pairs above max_distance are never
+    matched. With at most a handful of hands this is a few tiny array ops.
+
+    Args:
+        tracks: List of HandTrack candidates
+        wrists: (D, 2) wrist pixel coordinates of the detected hands
+        labels: List of D handedness labels (None when unknown)
+        max_distance: Largest cost (in hand sizes) still treated as the same hand
+        label_penalty: Extra cost for a handedness mismatch
+
+    Returns:
+        List of D track indices (into `tracks`), -1 where a new track is needed
+    """
+    matches = [-1] * len(wrists)
+    if not tracks or len(wrists) == 0:
+        return matches
+
+    track_wrists = np.array([track.wrist for track in tracks])
+    scales = np.array([max(track.hand_size, 1.0) for track in tracks])
+    offsets = np.asarray(wrists, dtype=np.float64)[None, :, :] - track_wrists[:, None, :]
+    costs = np.sqrt(np.sum(offsets * offsets, axis=2)) / scales[:, None]
+
+    for t, track in enumerate(tracks):
+        for d, label in enumerate(labels):
+            if track.label is not None and label is not None and track.label != label:
+                costs[t, d] += label_penalty
+
+    costs[costs > max_distance] = np.inf
+    for _ in range(min(costs.shape)):
+        t, d = np.unravel_index(np.argmin(costs), costs.shape)
+        if not np.isfinite(costs[t, d]):
+            break
+        matches[d] = int(t)
+        costs[t, :] = np.inf
+        costs[:, d] = np.inf
+
+    return matches
@@ -0,0 +1,97 @@
+"""
+Inference Scale Controller
+Picks the resolution fed to MediaPipe from a per-frame latency budget
+The displayed frame keeps its full resolution; only the inference input shrinks
+"""
+
+
+class InferenceScaleController:
+    """
+    Step the inference scale down when inference is over budget, back up when well under
+
+    Latency is tracked as an exponential moving average. Two thresholds
+    (hysteresis) plus a settle period after every change stop the scale from
+    oscillating between neighbouring steps.
+    """
+
+    def __init__(self, target_ms=25.0, scales=(1.0, 0.75, 0.6, 0.5, 0.4),
+                 smoothing=0.2, upscale_ratio=0.6, settle_frames=15):
+        """
+        Initialize the controller at full resolution
+
+        Args:
+            target_ms: Per-frame inference latency budget in milliseconds
+            scales: Allowed scale factors, largest first
+            smoothing: EMA weight of the newest latency sample
+            upscale_ratio: Step back up only when the EMA is below target_ms * upscale_ratio
+            settle_frames: Samples to wait after a change before changing again
+        """
+        self.target_ms = target_ms
+        self.scales = sorted(scales, reverse=True)
+        self.smoothing = smoothing
+        self.upscale_ratio = upscale_ratio
+        self.settle_frames = settle_frames
+
+        self.level = 0  # Index into self.scales
+        self.avg_ms = None
+        self.frames_since_change = 0
+        self.scale_changes = 0
+
+    @property
+    def scale(self):
+        """Current inference scale factor"""
+        return self.scales[self.level]
+
+    def update(self, elapsed_ms):
+        """
+        Record one inference latency sample and adjust the scale
+
+        Args:
+            elapsed_ms: Time the last inference took (resize + convert + process)
+
+        Returns:
+            Scale to use for the next frame
+        """
+        if self.avg_ms is None:
+            self.avg_ms = elapsed_ms
+        else:
+            self.avg_ms += self.smoothing * (elapsed_ms - self.avg_ms)
+
+        self.frames_since_change += 1
+        if self.frames_since_change < self.settle_frames:
+            return self.scale
+
+        if self.avg_ms > self.target_ms and self.level < len(self.scales) - 1:
+            self._change_level(1)
+        elif self.avg_ms < self.target_ms * self.upscale_ratio and self.level > 0:
+            self._change_level(-1)
+
+        return self.scale
+
+    def _change_level(self, step):
+        """Move one step and expect latency to change proportionally to pixel count"""
+        old_scale = self.scale
+        self.level += step
+        self.avg_ms *= (self.scale / old_scale) ** 2
+        self.frames_since_change = 0
+        self.scale_changes += 1
+
+    def reset(self):
+        """Return to full resolution and forget latency history"""
+        self.level = 0
+        self.avg_ms = None
+        self.frames_since_change = 0
+
+    def get_stats(self):
+        """
+        Get controller state for diagnostics
+
+        Returns:
+            Dict with the current scale, latency EMA, target and number of changes
+        """
+        return {
+            'scale': self.scale,
+            'avg_ms': self.avg_ms or 0.0,
+            'target_ms': self.target_ms,
+            'changes': self.scale_changes
+        }
@@ -0,0 +1,139 @@
+"""
+Landmark Ring Buffer Module
+Preallocated NumPy ring buffer of recent landmark frames with vectorized smoothing
+Replaces a deque of [id, x, y] lists in HandDetector
+"""
+import numpy as np
+
+
+class LandmarkRingBuffer:
+    """
+    Fixed-capacity (capacity, num_landmarks, 2) ring buffer of landmark coordinates
+
+    Indexing follows deque conventions (0 = oldest, -1 = newest) and returns
+    (num_landmarks, 2) views. Each entry also stores the frame number it
+    came from.
+    """
+
+    def __init__(self, capacity=7, num_landmarks=21):
+        """
+        Initialize an empty buffer (all memory is allocated here)
+
+        Args:
+            capacity: Maximum number of frames kept (oldest are overwritten)
+            num_landmarks: Landmarks per frame
+        """
+        self.maxlen = capacity
+        self.num_landmarks = num_landmarks
+        self.data = np.zeros((capacity, num_landmarks, 2), dtype=np.float64)
+        self.frame_ids = np.zeros(capacity, dtype=np.int64)
+        self._start = 0   # Slot of the oldest frame
+        self._count = 0
+
+        # Linear weights for every fill level: frame j (oldest first) of n gets (j + 1) / n.
+        # The totals are summed in the same order as the original per-landmark loop
+        # so the smoothed output (after int truncation) is unchanged.
+        self._weights = [None]
+        self._weight_totals = [0.0]
+        for n in range(1, capacity + 1):
+            weights = np.array([(j + 1) / n for j in range(n)])
+            total = 0
+            for weight in weights:
+                total += weight
+            self._weights.append(weights)
+            self._weight_totals.append(total)
+
+        # Slot order (oldest first) for every start position of a full buffer.
+        # Frames are always summed oldest first - summing in slot order would
+        # change float rounding and occasionally the truncated result.
+        self._order = [np.roll(np.arange(capacity), -start) for start in range(capacity)]
+
+    def __len__(self):
+        return self._count
+
+    def __deepcopy__(self, memo):
+        """Independent copy with its own data arrays"""
+        clone = LandmarkRingBuffer(self.maxlen, self.num_landmarks)
+        clone.data[:] = self.data
+        clone.frame_ids[:] = self.frame_ids
+        clone._start = self._start
+        clone._count = self._count
+        return clone
+
+    def _slot(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("landmark buffer index out of range")
+        return (self._start + index) % self.maxlen
+
+    def __getitem__(self, index):
+        """(num_landmarks, 2) view of one frame (0 = oldest, -1 = newest)"""
+        return self.data[self._slot(index)]
+
+    def frame_id(self, index):
+        """Frame number stored with one entry (0 = oldest, -1 = newest)"""
+        return int(self.frame_ids[self._slot(index)])
+
+    def append(self, points, frame_id=0):
+        """
+        Copy one frame of landmarks into the buffer (overwrites the oldest when full)
+
+        Args:
+            points: (num_landmarks, 2) array-like of x, y coordinates
+            frame_id: Frame number the landmarks came from
+        """
+        if self._count < self.maxlen:
+            slot = (self._start + self._count) % self.maxlen
+            self._count += 1
+        else:
+            slot = self._start
+            self._start = (self._start + 1) % self.maxlen
+        self.data[slot] = points
+        self.frame_ids[slot] = frame_id
+
+    def clear(self):
+        """Drop all frames (memory is kept)"""
+        self._start = 0
+        self._count = 0
+
+    def ordered(self):
+        """
+        All frames oldest first
+
+        Returns:
+            (len, num_landmarks, 2) array (a view when the buffer hasn't wrapped)
+        """
+        if self._count < self.maxlen:
+            return self.data[:self._count]
+        return self.data[self._order[self._start]]
+
+    def weighted_average(self, extra=None):
+        """
+        Linearly weighted average of the buffered frames (newest weighted highest)
+
+        Args:
+            extra: Optional (num_landmarks, 2) frame treated as the newest entry
+                   without being stored (the oldest frame drops out if full)
+
+        Returns:
+            (num_landmarks, 2) int array, truncated like int() in the original loop
+        """
+        frames = self.ordered()
+        if extra is not None:
+            # Keep the newest maxlen - 1 stored frames (all of them while not full)
+            kept = frames[max(len(frames) - self.maxlen + 1, 0):]
+            frames = np.concatenate([kept, np.asarray(extra, dtype=np.float64)[None]])
+        n = len(frames)
+
+        # Accumulate frame by frame, oldest first, exactly like the original loop:
+        # a single dot product sums in BLAS order and can shift the truncated
+        # result by a pixel
+        weights = self._weights[n]
+        averaged = frames[0] * weights[0]
+        for j in range(1, n):
+            averaged += frames[j] * weights[j]
+
+        # astype truncates toward zero, like int()
+        averaged /= self._weight_totals[n]
+        return averaged.astype(np.int64)
@@ -0,0 +1,197 @@
+"""
+Landmark Cache Module
+Stores each video's per-frame MediaPipe results in one memory-mappable .npy file
+keyed by the video's content hash, and serves them back through a ReplayBackend
+"""
+import hashlib
+import os
+
+import numpy as np
+
+from detector_backends import NUM_LANDMARKS, ReplayBackend, pack_result
+
+CACHE_VERSION = 1  # Bump when the record layout or the detection settings change meaning
+HASH_CHUNK_BYTES = 1 << 20
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+
+
+def record_dtype(max_hands=1):
+    """
+    Structured dtype of one cached frame (fixed size, so the file can be memory-mapped)
+
+    Args:
+        max_hands: Hand slots per frame
+
+    Returns:
+        np.dtype with 'landmarks' (max_hands, 21, 3) float32, 'handedness'
+        (max_hands,) int8 and 'score' (max_hands,) float32 fields
+    """
+    return np.dtype([
+        ('landmarks', '<f4', (max_hands, NUM_LANDMARKS, 3)),
+        ('handedness', 'i1', (max_hands,)),
+        ('score', '<f4', (max_hands,))
+    ])
+
+
+def content_hash(source):
+    """
+    Hash a video file (or an image-sequence directory) by its bytes
+
+    Renaming or copying a recording keeps its cache entry; re-encoding it
+    does not.
+
+    Args:
+        source: Path to a video file or a directory of images
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    is_sequence = os.path.isdir(source)
+    if is_sequence:
+        paths = [os.path.join(source, name) for name in sorted(os.listdir(source))
+                 if name.lower().endswith(IMAGE_EXTENSIONS)]
+    else:
+        paths = [source]
+
+    for path in paths:
+        if is_sequence:
+            digest.update(os.path.basename(path).encode())  # Names fix the frame order
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+class LandmarkRecorder:
+    """Collects one video's detector results frame by frame (packed, fixed size)"""
+
+    def __init__(self, max_hands=1):
+        self.max_hands = max_hands
+        self.frames = []
+
+    def __len__(self):
+        return len(self.frames)
+
+    def add(self, result):
+        """
+        Store one frame's raw detection result
+
+        Args:
+            result: Object with multi_hand_landmarks / multi_handedness
+        """
+        self.frames.append(pack_result(result, self.max_hands))
+
+    def to_records(self):
+        """
+        Returns:
+            (F,) structured array of record_dtype(max_hands)
+        """
+        records = np.zeros(len(self.frames), dtype=record_dtype(self.max_hands))
+        for index, (landmarks, handedness, scores) in enumerate(self.frames):
+            records[index] = (landmarks, handedness, scores)
+        return records
+
+
+class LandmarkCache:
+    """
+    Directory of cached landmark recordings, one <key>.npy file per video
+
+    Files are written once (atomically, via a temporary file) and opened
+    read-only with np.load(mmap_mode='r'), so replaying a long video costs
+    almost no memory and nothing is parsed up front.
+    """
+
+    def __init__(self, cache_dir='landmark_cache'):
+        """
+        Args:
+            cache_dir: Directory holding the cache files (created on first save)
+        """
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    def key_for(self, source, **settings):
+        """
+        Cache key for a video and the detection settings that shape its landmarks
+
+        Any change to a setting gives a different key, so a recording is only
+        ever replayed under the configuration it was made with.
+
+        Args:
+            source: Video file or image directory
+            **settings: Every output-affecting setting, e.g. mirror=True plus
+                        HandDetector.output_settings() (hashed into the key)
+
+        Returns:
+            Key string (safe to use as a file name)
+        """
+        digest = hashlib.blake2b(digest_size=8)
+        for name in sorted(settings):
+            digest.update(f"{name}={settings[name]!r};".encode())
+        return f"{content_hash(source)}_v{CACHE_VERSION}_{digest.hexdigest()}"
+
+    def path(self, key):
+        """File that holds (or will hold) the recording for a key"""
+        return os.path.join(self.cache_dir, f"{key}.npy")
+
+    def load(self, key):
+        """
+        Open a cached recording
+
+        Args:
+            key: Key from key_for()
+
+        Returns:
+            Read-only memory-mapped structured array, or None on a cache miss
+        """
+        path = self.path(key)
+        if not os.path.exists(path):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return np.load(path, mmap_mode='r')
+
+    def save(self, key, records):
+        """
+        Write a recording (replaces an existing entry for the same key)
+
+        Args:
+            key: Key from key_for()
+            records: Structured array from LandmarkRecorder.to_records()
+
+        Returns:
+            Path of the written file
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            np.save(f, records)
+        os.replace(temp_path, path)  # Readers never see a half-written file
+        return path
+
+    @staticmethod
+    def backend(records):
+        """
+        Replay backend serving a cached recording
+
+        Args:
+            records: Structured array from load()
+
+        Returns:
+            ReplayBackend (field views of the memory map, nothing is copied)
+        """
+        return ReplayBackend(records['landmarks'], records['handedness'], records['score'])
+
+    def get_stats(self):
+        """
+        Returns:
+            Dict with hit/miss counts and the hit rate
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total > 0 else 0.0
+        }
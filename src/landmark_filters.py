@@ -0,0 +1,221 @@
+"""
+Landmark Filters Module
+Pluggable temporal smoothers for hand landmarks (all 21 x 2 coordinates at once)
+Moving average (original behaviour), One-Euro and constant-velocity Kalman
+"""
+import numpy as np
+
+from landmark_buffer import LandmarkRingBuffer
+
+
+class LandmarkSmoother:
+    """
+    Interface shared by all landmark smoothers
+
+    Time is measured in frame numbers (HandDetector.frame_count), so frames
+    skipped by adaptive inference simply show up as a larger step.
+    """
+
+    def update(self, points, frame_id):
+        """
+        Add a measurement and return the new estimate
+
+        Args:
+            points: (21, 2) pixel coordinates
+            frame_id: Frame number of the measurement
+
+        Returns:
+            (21, 2) float array
+        """
+        raise NotImplementedError
+
+    def peek(self, points, frame_id):
+        """Estimate for a measurement without changing the filter state"""
+        raise NotImplementedError
+
+    def estimate(self):
+        """Current estimate without a new measurement (None before the first update)"""
+        raise NotImplementedError
+
+    def reset(self):
+        """Forget all history"""
+        raise NotImplementedError
+
+    def settings(self):
+        """Constructor parameters that shape the output (e.g. for cache keys)"""
+        return {}
+
+
+class MovingAverageSmoother(LandmarkSmoother):
+    """Linearly weighted moving average over the last `window` frames (lag grows with the window)"""
+
+    def __init__(self, window=7):
+        self.buffer = LandmarkRingBuffer(capacity=window)
+
+    def update(self, points, frame_id):
+        self.buffer.append(points, frame_id)
+        return self.buffer.weighted_average()
+
+    def peek(self, points, frame_id):
+        return self.buffer.weighted_average(extra=points)
+
+    def estimate(self):
+        return self.buffer.weighted_average() if len(self.buffer) else None
+
+    def reset(self):
+        self.buffer.clear()
+
+    def settings(self):
+        return {'window': self.buffer.maxlen}
+
+
+class OneEuroSmoother(LandmarkSmoother):
+    """
+    One-Euro filter (Casiez et al.) vectorized over every coordinate
+
+    The cutoff frequency rises with landmark speed: slow, jittery landmarks
+    are smoothed hard while fast motion passes through with little lag.
+    """
+
+    def __init__(self, min_cutoff=1.0, beta=0.05, d_cutoff=1.0, frame_rate=30.0):
+        """
+        Args:
+            min_cutoff: Cutoff frequency (Hz) when the landmark is still - lower = less jitter
+            beta: Cutoff increase per pixel/second of speed - higher = less lag
+            d_cutoff: Cutoff frequency (Hz) for the speed estimate
+            frame_rate: Frames per second used to turn frame numbers into seconds
+        """
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.frame_rate = frame_rate
+        self.reset()
+
+    @staticmethod
+    def _alpha(cutoff, dt):
+        tau = 1.0 / (2 * np.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def _filter(self, points, frame_id):
+        """Compute (estimate, speed estimate) for a measurement without storing them"""
+        points = np.asarray(points, dtype=np.float64)
+        if self.x_hat is None:
+            return points.copy(), np.zeros_like(points)
+
+        dt = max(frame_id - self.last_frame, 1) / self.frame_rate
+        speed = (points - self.x_hat) / dt
+        a_d = self._alpha(self.d_cutoff, dt)
+        dx_hat = self.dx_hat + a_d * (speed - self.dx_hat)
+
+        # One cutoff per landmark from its 2D speed
+        cutoff = self.min_cutoff + self.beta * np.linalg.norm(dx_hat, axis=1, keepdims=True)
+        a = self._alpha(cutoff, dt)
+        x_hat = self.x_hat + a * (points - self.x_hat)
+        return x_hat, dx_hat
+
+    def update(self, points, frame_id):
+        self.x_hat, self.dx_hat = self._filter(points, frame_id)
+        self.last_frame = frame_id
+        return self.x_hat
+
+    def peek(self, points, frame_id):
+        return self._filter(points, frame_id)[0]
+
+    def estimate(self):
+        return self.x_hat
+
+    def reset(self):
+        self.x_hat = None
+        self.dx_hat = None
+        self.last_frame = 0
+
+    def settings(self):
+        return {'min_cutoff': self.min_cutoff, 'beta': self.beta,
+                'd_cutoff': self.d_cutoff, 'frame_rate': self.frame_rate}
+
+
+class KalmanSmoother(LandmarkSmoother):
+    """
+    Constant-velocity Kalman filter on every coordinate
+
+    Every coordinate uses the same motion and noise model and is updated on
+    the same frames, so they all share one 2x2 covariance. Each step is a
+    handful of (21, 2) array operations, independent of history length.
+    """
+
+    def __init__(self, process_noise=0.05, measurement_noise=9.0):
+        """
+        Args:
+            process_noise: Acceleration noise (pixels^2 per frame^3) - higher = follows motion faster
+            measurement_noise: Landmark jitter variance in pixels^2 - higher = smoother
+        """
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+        self.reset()
+
+    def _filter(self, points, frame_id):
+        """Compute (position, velocity, covariance) for a measurement without storing them"""
+        points = np.asarray(points, dtype=np.float64)
+        if self.position is None:
+            covariance = np.array([[self.measurement_noise, 0.0], [0.0, self.measurement_noise]])
+            return points.copy(), np.zeros_like(points), covariance
+
+        # Predict
+        dt = max(frame_id - self.last_frame, 1)
+        position = self.position + self.velocity * dt
+        transition = np.array([[1.0, dt], [0.0, 1.0]])
+        noise = self.process_noise * np.array([[dt ** 3 / 3, dt ** 2 / 2], [dt ** 2 / 2, dt]])
+        covariance = transition @ self.covariance @ transition.T + noise
+
+        # Update (position is measured, velocity is not)
+        gain = covariance[:, 0] / (covariance[0, 0] + self.measurement_noise)
+        innovation = points - position
+        position = position + gain[0] * innovation
+        velocity = self.velocity + gain[1] * innovation
+        covariance = covariance - np.outer(gain, covariance[0])
+        return position, velocity, covariance
+
+    def update(self, points, frame_id):
+        self.position, self.velocity, self.covariance = self._filter(points, frame_id)
+        self.last_frame = frame_id
+        return self.position
+
+    def peek(self, points, frame_id):
+        return self._filter(points, frame_id)[0]
+
+    def estimate(self):
+        return self.position
+
+    def reset(self):
+        self.position = None
+        self.velocity = None
+        self.covariance = None
+        self.last_frame = 0
+
+    def settings(self):
+        return {'process_noise': self.process_noise, 'measurement_noise': self.measurement_noise}
+
+
+SMOOTHERS = {
+    'moving_average': MovingAverageSmoother,
+    'one_euro': OneEuroSmoother,
+    'kalman': KalmanSmoother
+}
+
+
+def create_smoother(smoothing='moving_average', **kwargs):
+    """
+    Build a smoother by name (or pass an existing LandmarkSmoother through)
+
+    Args:
+        smoothing: 'moving_average', 'one_euro', 'kalman' or a LandmarkSmoother instance
+        **kwargs: Parameters for the smoother's constructor
+
+    Returns:
+        LandmarkSmoother
+    """
+    if isinstance(smoothing, LandmarkSmoother):
+        return smoothing
+    if smoothing not in SMOOTHERS:
+        raise ValueError(f"Unknown smoothing '{smoothing}' (use one of {list(SMOOTHERS)})")
+    return SMOOTHERS[smoothing](**kwargs)
@@ -0,0 +1,111 @@
+"""
+Landmarks Module
+Hand landmarks stored in one contiguous (N, 3) float array of [id, x, y] rows
+Indexes like the old list of [id, x, y] lists, so existing consumers keep working
+"""
+import numpy as np
+
+
+class Landmarks:
+    """
+    Container for one hand's landmarks backed by a single (N, 3) float64 array
+
+    Columns are id, x, y (pixel coordinates). Integer indexing returns a row
+    view, so legacy code such as `landmarks[8][1]` or `landmarks[8][1:]`
+    still works; new code should use `points`, `xs` and `ys` (views, no
+    copies) or `array` directly.
+    """
+
+    NUM_LANDMARKS = 21
+
+    __slots__ = ('array',)
+
+    def __init__(self, array=None):
+        """
+        Wrap an existing array (no copy when it's already float64)
+
+        Args:
+            array: (N, 3) array-like of [id, x, y] rows (default: empty)
+        """
+        if array is None:
+            self.array = np.empty((0, 3), dtype=np.float64)
+        else:
+            self.array = np.asarray(array, dtype=np.float64).reshape(-1, 3)
+
+    @classmethod
+    def from_points(cls, points):
+        """
+        Build landmarks from (N, 2) x, y coordinates (ids are 0..N-1)
+
+        Args:
+            points: (N, 2) array-like of pixel coordinates
+
+        Returns:
+            Landmarks
+        """
+        points = np.asarray(points)
+        array = np.empty((len(points), 3), dtype=np.float64)
+        array[:, 0] = np.arange(len(points))
+        array[:, 1:] = points
+        return cls(array)
+
+    @property
+    def points(self):
+        """(N, 2) view of the x, y columns"""
+        return self.array[:, 1:]
+
+    @property
+    def xs(self):
+        """(N,) view of the x column"""
+        return self.array[:, 1]
+
+    @property
+    def ys(self):
+        """(N,) view of the y column"""
+        return self.array[:, 2]
+
+    def __len__(self):
+        return len(self.array)
+
+    def __bool__(self):
+        return len(self.array) > 0
+
+    def __getitem__(self, index):
+        """Row view for an integer index ([id, x, y]), Landmarks for a slice"""
+        if isinstance(index, slice):
+            return Landmarks(self.array[index])
+        return self.array[index]
+
+    def __iter__(self):
+        return iter(self.array)
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None or dtype == self.array.dtype:
+            return self.array.copy() if copy else self.array
+        return self.array.astype(dtype)
+
+    def __repr__(self):
+        return f"Landmarks({len(self)} points)"
+
+    def copy(self):
+        """Independent copy (the array is duplicated)"""
+        return Landmarks(self.array.copy())
+
+    def tolist(self):
+        """Plain [[id, x, y], ...] lists of Python floats (e.g. for JSON)"""
+        return self.array.tolist()
+
+
+def as_landmarks(landmarks):
+    """
+    Accept Landmarks or a legacy [[id, x, y], ...] list
+
+    Args:
+        landmarks: Landmarks, list of [id, x, y] lists or (N, 3) array
+
+    Returns:
+        Landmarks (the same object when it already is one)
+    """
+    if isinstance(landmarks, Landmarks):
+        return landmarks
+    return Landmarks(landmarks)
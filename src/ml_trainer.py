@@ -12,6 +12,8 @@ from typing import Optional, Tuple, Dict, List
 # Import only when needed to speed up loading
 import numpy as np
 import cv2
+from landmarks import as_landmarks
+from hand_geometry import as_geometry
 
 class MLTrainer:
     """ML trainer with lazy sklearn import for faster startup"""
@@ -25,6 +27,7 @@ class MLTrainer:
         self.model = None
         self.scaler = None
         self.training_data = []
+        self.verbose = True  # Print top predictions on every predict() call
         
         # Lazy import flags
         self._sklearn_loaded = False
@@ -155,19 +158,57 @@ class MLTrainer:
             print(f"⚠️  Failed to extract image features from {image_path}: {e}")
             return np.zeros(324)  # Return zeros on error
     
+    @staticmethod
+    def geometric_features(points, distances=None):
+        """
+        Finger separation features that help distinguish V from W
+        
+        Training and prediction both build these columns here, so the two
+        can never drift apart.
+        
+        Args:
+            points: (21, 2) or (N, 21, 2) landmark x, y coordinates
+            distances: Optional precomputed (21, 21) or (N, 21, 21) pairwise
+                       distance matrix (e.g. HandGeometry.distances) to read
+                       the fingertip distances from instead of recomputing them
+            
+        Returns:
+            (4,) or (N, 4) array: index-middle, middle-ring and index-ring
+            fingertip distances and the middle-ring / index-middle ratio
+        """
+        if distances is not None:
+            distances = np.asarray(distances, dtype=np.float64)
+            index_middle_dist = distances[..., 8, 12]
+            middle_ring_dist = distances[..., 12, 16]
+            index_ring_dist = distances[..., 8, 16]
+        else:
+            points = np.asarray(points, dtype=np.float64)
+            index_tip = points[..., 8, :]  # landmark 8
+            middle_tip = points[..., 12, :]  # landmark 12
+            ring_tip = points[..., 16, :]  # landmark 16
+            
+            index_middle_dist = np.sqrt(np.sum((index_tip - middle_tip)**2, axis=-1))  # V has wider gap here
+            middle_ring_dist = np.sqrt(np.sum((middle_tip - ring_tip)**2, axis=-1))  # W has significant gap here
+            index_ring_dist = np.sqrt(np.sum((index_tip - ring_tip)**2, axis=-1))  # Overall span
+        
+        return np.stack([
+            index_middle_dist,
+            middle_ring_dist,
+            index_ring_dist,
+            middle_ring_dist / (index_middle_dist + 0.001)  # Ratio to distinguish patterns
+        ], axis=-1)
+    
     def add_training_sample(self, landmarks, label, finger_states=None):
         """
         Add a new training sample with finger states
         
         Args:
-            landmarks: List of 21 hand landmarks (x, y, z for each)
+            landmarks: Landmarks (or list of 21 [id, x, y] landmarks)
             label: Letter label (A-Z)
             finger_states: Dict with finger UP/DOWN states (optional)
         """
         # Flatten landmarks to 1D array (21 points × 3 coords = 63 features)
-        flattened = []
-        for point in landmarks:
-            flattened.extend([point[0], point[1], point[2]])
+        flattened = as_landmarks(landmarks).array.ravel().tolist()
         
         sample = {
             'landmarks': flattened,
@@ -236,62 +277,29 @@ class MLTrainer:
                 print(f"   {letter}: {stats[letter]} samples")
             
             # Prepare data - combine landmarks, finger states, AND advanced features
-            X_list = []
-            for s in self.training_data:
-                features = list(s['landmarks'])  # 63 landmark features
-                
-                # Add finger state features if available (5 binary features)
-                if 'finger_states' in s:
-                    finger_states = s['finger_states']
-                    features.extend([
-                        1 if finger_states.get('thumb', False) else 0,
-                        1 if finger_states.get('index', False) else 0,
-                        1 if finger_states.get('middle', False) else 0,
-                        1 if finger_states.get('ring', False) else 0,
-                        1 if finger_states.get('pinky', False) else 0
-                    ])
-                else:
-                    # No finger states - add zeros
-                    features.extend([0, 0, 0, 0, 0])
-                
-                # Add advanced geometric features to distinguish V vs W
-                # Extract landmark positions (they're stored as [id, x, y, id, x, y, ...])
-                lm_flat = s['landmarks']
-                landmarks_xyz = [(lm_flat[i], lm_flat[i+1], lm_flat[i+2]) for i in range(0, len(lm_flat), 3)]
-                
-                # Get key finger tip positions
-                index_tip = landmarks_xyz[8]  # landmark 8
-                middle_tip = landmarks_xyz[12]  # landmark 12
-                ring_tip = landmarks_xyz[16]  # landmark 16
-                wrist = landmarks_xyz[0]  # landmark 0
-                
-                # Calculate finger separation angles (helps distinguish V from W)
-                # Distance between index and middle tips
-                index_middle_dist = np.sqrt((index_tip[1] - middle_tip[1])**2 + (index_tip[2] - middle_tip[2])**2)
-                # Distance between middle and ring tips
-                middle_ring_dist = np.sqrt((middle_tip[1] - ring_tip[1])**2 + (middle_tip[2] - ring_tip[2])**2)
-                # Distance between index and ring tips
-                index_ring_dist = np.sqrt((index_tip[1] - ring_tip[1])**2 + (index_tip[2] - ring_tip[2])**2)
-                
-                # Add these geometric features
-                features.extend([
-                    index_middle_dist,  # V has wider gap here
-                    middle_ring_dist,   # W has significant gap here
-                    index_ring_dist,    # Overall span
-                    middle_ring_dist / (index_middle_dist + 0.001)  # Ratio to distinguish patterns
-                ])
-                
-                # Add image-based HOG features if photo exists (324 features)
+            # OPTIMIZED: the landmark, finger and geometric columns are built for all
+            # samples at once instead of feature by feature in a per-sample loop
+            landmark_features = np.array([s['landmarks'] for s in self.training_data], dtype=np.float64)  # 63 landmark features
+            
+            # Finger state features (5 binary features, zeros if not recorded)
+            finger_features = np.array([
+                [1 if s.get('finger_states', {}).get(name, False) else 0
+                 for name in ('thumb', 'index', 'middle', 'ring', 'pinky')]
+                for s in self.training_data
+            ], dtype=np.float64)
+            
+            # Advanced geometric features to distinguish V vs W
+            # (landmarks are stored as [id, x, y, id, x, y, ...])
+            points = landmark_features.reshape(-1, 21, 3)[:, :, 1:]
+            geometric_features = self.geometric_features(points)
+            
+            # Add image-based HOG features if photo exists (324 features, zeros without a photo)
+            img_features = np.zeros((len(self.training_data), 324))
+            for i, s in enumerate(self.training_data):
                 if 'photo_path' in s and s['photo_path']:
-                    img_features = self.extract_image_features(s['photo_path'])
-                else:
-                    img_features = np.zeros(324)  # No photo, use zeros
-                
-                features.extend(img_features.tolist())
-                
-                X_list.append(features)
+                    img_features[i] = self.extract_image_features(s['photo_path'])
             
-            X = np.array(X_list)
+            X = np.hstack([landmark_features, finger_features, geometric_features, img_features])
             y = np.array([s['label'] for s in self.training_data])
             
             print(f"📐 Feature count: {X.shape[1]} (63 landmarks + 5 finger + 4 geometric + 324 HOG image features)")
@@ -386,7 +394,8 @@ class MLTrainer:
         Predict letter from landmarks, finger states, and hand image using trained model
         
         Args:
-            landmarks: List of 21 hand landmarks (x, y, z for each)
+            landmarks: Landmarks, HandGeometry (reuses its distance matrix)
+                       or list of 21 [id, x, y] landmarks
             finger_states: Dict with finger UP/DOWN states (optional)
             hand_image: Cropped hand image for HOG feature extraction (optional)
             
@@ -397,42 +406,21 @@ class MLTrainer:
             return None, 0.0
         
         try:
-            # Flatten landmarks
-            flattened = []
-            for point in landmarks:
-                flattened.extend([point[0], point[1], point[2]])
-            
-            # Add finger state features (5 binary features)
-            if finger_states:
-                flattened.extend([
-                    1 if finger_states.get('thumb', False) else 0,
-                    1 if finger_states.get('index', False) else 0,
-                    1 if finger_states.get('middle', False) else 0,
-                    1 if finger_states.get('ring', False) else 0,
-                    1 if finger_states.get('pinky', False) else 0
-                ])
-            else:
-                # No finger states - add zeros
-                flattened.extend([0, 0, 0, 0, 0])
-            
-            # Add the same geometric features as training
-            # Get key finger tip positions (landmarks is list of [id, x, y])
-            index_tip = landmarks[8]  # landmark 8
-            middle_tip = landmarks[12]  # landmark 12
-            ring_tip = landmarks[16]  # landmark 16
-            
-            # Calculate finger separation distances
-            index_middle_dist = np.sqrt((index_tip[1] - middle_tip[1])**2 + (index_tip[2] - middle_tip[2])**2)
-            middle_ring_dist = np.sqrt((middle_tip[1] - ring_tip[1])**2 + (middle_tip[2] - ring_tip[2])**2)
-            index_ring_dist = np.sqrt((index_tip[1] - ring_tip[1])**2 + (index_tip[2] - ring_tip[2])**2)
-            
-            # Add geometric features (4 features)
-            flattened.extend([
-                index_middle_dist,
-                middle_ring_dist,
-                index_ring_dist,
-                middle_ring_dist / (index_middle_dist + 0.001)
-            ])
+            landmarks = as_geometry(landmarks)
+            
+            # Flattened landmarks (63 features) - the (21, 3) array already has that layout
+            landmark_features = landmarks.array.ravel()
+            
+            # Add finger state features (5 binary features, zeros if unknown)
+            finger_states = finger_states or {}
+            finger_features = np.array([
+                1 if finger_states.get(name, False) else 0
+                for name in ('thumb', 'index', 'middle', 'ring', 'pinky')
+            ], dtype=np.float64)
+            
+            # Add the same geometric features as training (4 features), read from the
+            # frame's shared distance matrix
+            geometric_features = self.geometric_features(landmarks.points, landmarks.distances)
             
             # Add HOG image features (324 features)
             if hand_image is not None:
@@ -450,16 +438,15 @@ class MLTrainer:
                     nbins = 9
                     hog = cv2.HOGDescriptor(win_size, block_size, block_stride, cell_size, nbins)
                     img_features = hog.compute(gray).flatten()
-                    
-                    flattened.extend(img_features.tolist())
                 except Exception as e:
                     print(f"⚠️  Failed to extract HOG features during prediction: {e}")
-                    flattened.extend(np.zeros(324).tolist())
+                    img_features = np.zeros(324)
             else:
                 # No image provided, use zeros
-                flattened.extend(np.zeros(324).tolist())
+                img_features = np.zeros(324)
             
-            X = np.array([flattened])
+            X = np.concatenate([landmark_features, finger_features, geometric_features,
+                                img_features.astype(np.float64)])[None]
             X_scaled = self.scaler.transform(X)
             
             # Get prediction and probability
@@ -482,11 +469,12 @@ class MLTrainer:
                 confidence = top1_prob
             
             # Print top 3 predictions for debugging
-            print(f"🔍 Predictions: ", end="")
-            for i, (label, prob) in enumerate(sorted_probs[:3]):
-                marker = "✅" if i == 0 else "  "
-                print(f"{marker}{label}:{prob:.1%} ", end="")
-            print(f"| Confidence: {confidence:.1%}")
+            if self.verbose:
+                print(f"🔍 Predictions: ", end="")
+                for i, (label, prob) in enumerate(sorted_probs[:3]):
+                    marker = "✅" if i == 0 else "  "
+                    print(f"{marker}{label}:{prob:.1%} ", end="")
+                print(f"| Confidence: {confidence:.1%}")
             
             return prediction, confidence
             
@@ -0,0 +1,91 @@
+"""
+Prediction Cache Module
+Change-detection gate for per-frame classification: while the hand barely
+moves (e.g. holding a letter), the last finger states and prediction are reused
+"""
+import numpy as np
+
+WRIST = 0
+PALM_CENTER = 9  # Middle finger base - wrist to here is the reference hand size
+
+
+class PredictionCache:
+    """
+    Reuse the last full evaluation while the landmarks stay within epsilon of it
+
+    The gate uses the largest single-landmark displacement, so one finger
+    starting to curl is never averaged away by the 20 landmarks that stay
+    put. It is measured against the landmarks of the last full evaluation
+    (not the previous frame), so slow drift still triggers a re-evaluation
+    once it adds up to epsilon.
+    """
+
+    def __init__(self, epsilon=0.05):
+        """
+        Args:
+            epsilon: Largest landmark displacement (as a fraction of the
+                     wrist-to-middle-MCP hand size) that counts as unchanged
+        """
+        self.epsilon = epsilon
+        self.hits = 0
+        self.misses = 0
+        self.reset()
+
+    def reset(self):
+        """Forget the cached evaluation (counters are kept)"""
+        self.reference = None
+        self.hand_size = 0.0
+        self.key = None
+        self.value = None
+
+    def lookup(self, points, key=None):
+        """
+        Get the cached evaluation if the hand hasn't moved since it was made
+
+        Args:
+            points: (21, 2) landmark pixel coordinates of the current frame
+            key: Whatever else the evaluation depends on (e.g. the model
+                 object); a different object is always a miss
+
+        Returns:
+            The stored value, or None when a full evaluation is needed
+        """
+        if self.reference is None or key is not self.key or self.hand_size <= 0:
+            self.misses += 1
+            return None
+
+        offsets = np.asarray(points, dtype=np.float64) - self.reference
+        displacement = np.sqrt(np.sum(offsets * offsets, axis=1)).max() / self.hand_size
+        if displacement >= self.epsilon:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return self.value
+
+    def store(self, points, value, key=None):
+        """
+        Remember a full evaluation and the landmarks it was made on
+
+        Args:
+            points: (21, 2) landmark pixel coordinates the value was computed from
+            value: Anything (e.g. (finger_states, prediction, confidence))
+            key: Same meaning as in lookup()
+        """
+        self.reference = np.array(points, dtype=np.float64)
+        self.hand_size = float(np.sqrt(np.sum((self.reference[PALM_CENTER] - self.reference[WRIST]) ** 2)))
+        self.key = key
+        self.value = value
+
+    @property
+    def hit_rate(self):
+        """Fraction of lookups answered from the cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def get_stats(self):
+        """
+        Returns:
+            Dict with hit/miss counts and the hit rate
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hit_rate}
@@ -0,0 +1,91 @@
+"""
+Running Statistics Module
+Fixed-size sliding window with O(1) running sum, mean and variance
+Values can be scalars or fixed-shape arrays (e.g. one feature vector per frame)
+"""
+import numpy as np
+
+
+class RunningWindow:
+    """
+    Sliding window over the last `size` values with incrementally maintained sums
+
+    append() adds the new value to the running sums and subtracts the value
+    that drops out, so statistics never rescan the window. The sums are
+    recomputed from the stored values once per wrap-around to stop float
+    rounding from accumulating (amortized O(1)).
+    """
+
+    def __init__(self, size, shape=()):
+        """
+        Initialize an empty window (all memory is allocated here)
+
+        Args:
+            size: Number of most recent values kept
+            shape: Shape of each value (() for scalars)
+        """
+        self.size = max(1, size)
+        self.values = np.zeros((self.size,) + tuple(shape), dtype=np.float64)
+        self._sum = np.zeros(shape, dtype=np.float64)
+        self._sum_sq = np.zeros(shape, dtype=np.float64)
+        self._next = 0    # Slot the next value is written to
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def is_full(self):
+        """True once `size` values have been added since the last clear()"""
+        return self._count == self.size
+
+    def append(self, value):
+        """
+        Add a value, dropping the oldest one when the window is full
+
+        Args:
+            value: Scalar or array of the window's shape
+        """
+        slot = self._next
+        if self._count == self.size:
+            old = self.values[slot]
+            self._sum -= old
+            self._sum_sq -= old * old
+        else:
+            self._count += 1
+
+        self.values[slot] = value
+        new = self.values[slot]
+        self._sum += new
+        self._sum_sq += new * new
+
+        self._next = (slot + 1) % self.size
+        if self._next == 0 and self._count == self.size:
+            self._sum = self.values.sum(axis=0)
+            self._sum_sq = (self.values * self.values).sum(axis=0)
+
+    @property
+    def sum(self):
+        """Sum of the values in the window"""
+        return self._sum
+
+    @property
+    def mean(self):
+        """Mean of the values in the window (0 when empty)"""
+        if self._count == 0:
+            return np.zeros_like(self._sum)
+        return self._sum / self._count
+
+    @property
+    def variance(self):
+        """Population variance of the values in the window (0 when empty)"""
+        if self._count == 0:
+            return np.zeros_like(self._sum)
+        mean = self._sum / self._count
+        return np.maximum(self._sum_sq / self._count - mean * mean, 0.0)
+
+    def clear(self):
+        """Drop all values (memory is kept)"""
+        self._sum = np.zeros_like(self._sum)
+        self._sum_sq = np.zeros_like(self._sum_sq)
+        self._next = 0
+        self._count = 0
@@ -0,0 +1,178 @@
+"""
+Video Recorder Module
+Background-thread video recording so encoding never stalls the main loop
+Frames are timestamped and resampled to a constant output frame rate
+"""
+import cv2
+import queue
+import threading
+import time
+
+
+class AsyncVideoRecorder:
+    """
+    cv2.VideoWriter running on its own thread behind a bounded queue
+
+    write() only (optionally) downsizes the frame and enqueues it. When the
+    queue is full the 'drop' policy discards the frame and the 'block' policy
+    waits for the writer. The writer places every frame on a constant-rate
+    timeline using its capture timestamp: frames are repeated to fill gaps
+    and skipped when they arrive faster than the output rate, so playback
+    speed matches real time whatever the processing rate was.
+    """
+
+    POLICIES = ('drop', 'block')
+
+    def __init__(self, filename, frame_size, fps=30.0, scale=1.0, queue_size=64,
+                 policy='drop', mirror=False, fourcc='mp4v'):
+        """
+        Initialize the recorder (file is opened by start())
+
+        Args:
+            filename: Output video path
+            frame_size: (width, height) of the frames that will be written
+            fps: Constant output frame rate
+            scale: Resize factor applied to every frame (e.g. 0.5 to cut encode cost)
+            queue_size: Maximum frames waiting for the writer thread
+            policy: 'drop' (discard when full) or 'block' (wait when full)
+            mirror: Flip frames horizontally before encoding
+            fourcc: Codec four-character code
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown recording policy '{policy}' (use one of {self.POLICIES})")
+
+        self.filename = filename
+        self.fps = fps
+        self.scale = scale
+        self.policy = policy
+        self.mirror = mirror
+        self.fourcc = fourcc
+
+        width, height = frame_size
+        self.output_size = (max(1, int(width * scale)), max(1, int(height * scale)))
+
+        self.queue = queue.Queue(maxsize=max(1, queue_size))
+        self.writer = None
+        self._thread = None
+        self._start_timestamp = None
+
+        # Counters (read these for diagnostics)
+        self.frames_received = 0     # write() calls
+        self.frames_dropped = 0      # Discarded because the queue was full ('drop' policy)
+        self.frames_written = 0      # Frames in the output file (including repeats)
+        self.frames_repeated = 0     # Extra copies written to fill timing gaps
+        self.frames_skipped = 0      # Arrived faster than the output frame rate
+
+    def start(self):
+        """
+        Open the output file and start the writer thread
+
+        Returns:
+            self (so calls can be chained)
+        """
+        fourcc = cv2.VideoWriter_fourcc(*self.fourcc)
+        self.writer = cv2.VideoWriter(self.filename, fourcc, self.fps, self.output_size)
+        if not self.writer.isOpened():
+            raise IOError(f"Could not open video writer: {self.filename}")
+
+        self._thread = threading.Thread(target=self._write_loop, name="VideoRecorder", daemon=True)
+        self._thread.start()
+        return self
+
+    def write(self, frame, timestamp=None, copy=True):
+        """
+        Queue a frame for recording (never encodes on the calling thread)
+
+        Args:
+            frame: BGR frame
+            timestamp: Capture time in seconds (default: time.time())
+            copy: Copy the frame first - required when the caller reuses the buffer
+
+        Returns:
+            True if the frame was queued, False if it was dropped
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        self.frames_received += 1
+
+        h, w = frame.shape[:2]
+        if (w, h) != self.output_size:
+            # Resizing produces a new array, so no extra copy is needed
+            frame = cv2.resize(frame, self.output_size, interpolation=cv2.INTER_AREA)
+        elif copy:
+            frame = frame.copy()
+
+        item = (timestamp, frame)
+        if self.policy == 'block':
+            self.queue.put(item)
+            return True
+
+        try:
+            self.queue.put_nowait(item)
+            return True
+        except queue.Full:
+            self.frames_dropped += 1
+            return False
+
+    def _write_loop(self):
+        """Writer thread: place frames on the constant-rate timeline and encode them"""
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+
+            timestamp, frame = item
+            if self._start_timestamp is None:
+                self._start_timestamp = timestamp
+
+            # Output slot this frame belongs to on the constant-rate timeline
+            slot = int(round((timestamp - self._start_timestamp) * self.fps))
+            if slot < self.frames_written:
+                self.frames_skipped += 1
+                continue
+
+            if self.mirror:
+                frame = cv2.flip(frame, 1)
+
+            # Repeat the frame until the timeline catches up with its timestamp
+            copies = slot - self.frames_written + 1
+            for _ in range(copies):
+                self.writer.write(frame)
+            self.frames_written += copies
+            self.frames_repeated += copies - 1
+
+    def stop(self):
+        """
+        Flush queued frames, stop the writer thread and close the file
+
+        Returns:
+            Dict of recording statistics
+        """
+        if self._thread is not None:
+            # The sentinel must get through even with the 'drop' policy
+            self.queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+        if self.writer is not None:
+            self.writer.release()
+            self.writer = None
+
+        return self.get_stats()
+
+    def get_stats(self):
+        """
+        Get recording statistics
+
+        Returns:
+            Dict with received/dropped/written/repeated/skipped frame counts
+            and the duration of the output video in seconds
+        """
+        return {
+            'received': self.frames_received,
+            'dropped': self.frames_dropped,
+            'written': self.frames_written,
+            'repeated': self.frames_repeated,
+            'skipped': self.frames_skipped,
+            'duration': self.frames_written / self.fps if self.fps > 0 else 0.0
+        }
@@ -0,0 +1,236 @@
+"""
+Offline Video Transcriber
+Runs the translator's detector/classifier/hold-time logic over recorded footage
+Headless: no cv2.imshow/waitKey, frames are processed as fast as the CPU allows
+"""
+import cv2
+import json
+import os
+import time
+
+from asl_translator import ASLTranslator
+from landmark_cache import LandmarkCache, LandmarkRecorder
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+
+
+def iter_frames(source, fps=None):
+    """
+    Iterate over the frames of a video file or an image-sequence directory
+
+    Args:
+        source: Path to a video file or a directory of images (sorted by name)
+        fps: Frame rate used for timestamps (default: the video's own rate, 30 for images)
+
+    Yields:
+        (frame_index, timestamp_seconds, frame)
+    """
+    if os.path.isdir(source):
+        fps = fps or 30.0
+        names = sorted(n for n in os.listdir(source) if n.lower().endswith(IMAGE_EXTENSIONS))
+        for index, name in enumerate(names):
+            frame = cv2.imread(os.path.join(source, name))
+            if frame is None:
+                print(f"⚠️  Skipping unreadable image: {name}")
+                continue
+            yield index, index / fps, frame
+        return
+
+    cap = cv2.VideoCapture(source)
+    if not cap.isOpened():
+        raise IOError(f"Could not open video: {source}")
+    fps = fps or cap.get(cv2.CAP_PROP_FPS) or 30.0
+
+    try:
+        index = 0
+        while True:
+            success, frame = cap.read()
+            if not success:
+                break
+            yield index, index / fps, frame
+            index += 1
+    finally:
+        cap.release()
+
+
+class VideoTranscriber:
+    """Headless transcription of recorded ASL footage"""
+
+    def __init__(self, data_file="training_data.json", model_file="asl_model.pkl", mirror=False,
+                 cache_dir=None, adaptive_skip=False, roi_mode=False, smoothing='moving_average'):
+        """
+        Initialize the transcriber (builds one detector and loads the ML model once)
+
+        Args:
+            data_file: Training data JSON used by MLTrainer
+            model_file: Trained model pickle used by MLTrainer
+            mirror: Flip frames horizontally (only for raw, un-mirrored camera footage;
+                    recordings made by the app are already mirrored)
+            cache_dir: Landmark cache directory - MediaPipe runs once per video and
+                       later runs replay the stored landmarks (None = no cache)
+            adaptive_skip: Extrapolate landmarks on stable frames
+                           (default: full inference on every frame)
+            roi_mode: Run MediaPipe on hand crops (default: full frames)
+            smoothing: Landmark smoother ('moving_average', 'one_euro' or 'kalman')
+
+        With the defaults every frame gets full-frame inference, so transcripts
+        match the ones built from cached landmarks.
+        """
+        self.mirror = mirror
+        self.cache = LandmarkCache(cache_dir) if cache_dir else None
+
+        # Latency-driven downscaling depends on machine load - keep offline results reproducible
+        self.translator = ASLTranslator(adaptive_skip=adaptive_skip, roi_mode=roi_mode, latency_target_ms=None,
+                                        smoothing=smoothing)
+        self.translator.audio_enabled = False
+        self.translator.verbose = False
+        self.live_backend = self.translator.detector.hands
+        self.roi_mode = self.translator.detector.roi_mode
+        self.adaptive_skip = self.translator.detector.adaptive_skip
+        # Captured before any run swaps the backend or toggles the modes
+        self.cache_settings = dict(self.translator.detector.output_settings(), mirror=mirror)
+
+        # Load the ML model directly so custom paths can be used
+        from ml_trainer import MLTrainer
+        trainer = MLTrainer(data_file=data_file, model_file=model_file)
+        trainer.verbose = False
+        self.translator.ml_trainer = trainer
+        self.translator.ml_trainer_loaded = True
+        self.translator.ml_enabled = trainer.model is not None
+
+        if not self.translator.ml_enabled:
+            print("⚠️  No trained model found - transcripts will be empty (hands are still tracked)")
+
+    def reset(self):
+        """Clear text and hold-time state so a new video starts fresh"""
+        translator = self.translator
+        translator.detector.reset()
+        translator.prediction_cache.reset()
+        translator.classifier.landmark_history.clear()
+        translator.current_text = ""
+        translator.last_letter = ""
+        translator.letter_start_time = 0
+        translator.letters_added = 0
+        translator.letter_history.clear()
+        translator.gesture_timeline.clear()
+        translator.total_gestures_detected = 0
+        # Video clock starts at 0, so don't begin inside a cooldown window
+        translator.last_letter_added_time = float('-inf')
+
+    def _use_landmark_source(self, records=None, recording=False):
+        """
+        Point the detector at MediaPipe or at a cached recording for the next video
+
+        Cached landmarks come from inference on every frame, so both the
+        recording pass and the replay pass run without adaptive skipping
+        (and replay without ROI crops) - the two then feed the classifier
+        identical landmarks.
+
+        Args:
+            records: Cached recording to replay (None = run MediaPipe)
+            recording: Whether this run's results are being recorded
+        """
+        detector = self.translator.detector
+        if records is not None:
+            detector.hands = self.cache.backend(records)
+            detector.roi_mode = False
+            detector.adaptive_skip = False
+        else:
+            detector.hands = self.live_backend
+            detector.roi_mode = self.roi_mode
+            detector.adaptive_skip = self.adaptive_skip and not recording
+
+    def transcribe(self, source, output_dir=None, fps=None):
+        """
+        Transcribe one video file or image-sequence directory
+
+        Writes <name>_transcript.txt and <name>_predictions.jsonl (one JSON
+        object per frame) into output_dir when given.
+
+        Args:
+            source: Video file or image directory
+            output_dir: Directory for result files (None = don't write files)
+            fps: Override the frame rate used for hold-time timestamps
+
+        Returns:
+            Dict with the transcript, per-frame predictions and throughput
+        """
+        translator = self.translator
+        records = recorder = key = None
+        if self.cache:
+            key = self.cache.key_for(source, **self.cache_settings)
+            records = self.cache.load(key)
+            if records is None:
+                recorder = LandmarkRecorder(translator.detector.max_hands)
+        self._use_landmark_source(records, recording=recorder is not None)
+        self.reset()
+
+        predictions = []
+        frames_with_hand = 0
+        reused_before = translator.prediction_cache.hits
+        evaluated_before = translator.prediction_cache.misses
+        start = time.perf_counter()
+
+        for index, timestamp, frame in iter_frames(source, fps):
+            letters_before = translator.letters_added
+
+            img, landmarks = translator.detect_frame(frame, mirror=self.mirror, draw=False)
+            if recorder is not None:
+                recorder.add(translator.detector.results)
+            result = translator.classify_frame(img, landmarks, current_time=timestamp)
+
+            if landmarks:
+                frames_with_hand += 1
+
+            predictions.append({
+                'frame': index,
+                'time': round(timestamp, 4),
+                'hand': bool(landmarks),
+                'letter': result['letter'],
+                'confidence': round(float(result['confidence']), 4),
+                'time_held': round(float(result['time_held']), 4),
+                'added': translator.current_text[-1] if translator.letters_added > letters_before else ""
+            })
+
+        elapsed = time.perf_counter() - start
+        if recorder is not None:
+            self.cache.save(key, recorder.to_records())
+        summary = {
+            'source': source,
+            'transcript': translator.current_text,
+            'frames': len(predictions),
+            'frames_with_hand': frames_with_hand,
+            'letters_added': translator.letters_added,
+            'seconds': elapsed,
+            'fps': len(predictions) / elapsed if elapsed > 0 else 0.0,
+            'predictions_reused': translator.prediction_cache.hits - reused_before,
+            'predictions_evaluated': translator.prediction_cache.misses - evaluated_before,
+            'landmark_cache': None if not self.cache else ('hit' if records is not None else 'miss'),
+            'predictions': predictions
+        }
+
+        if output_dir:
+            self.save_results(summary, output_dir)
+
+        return summary
+
+    def save_results(self, summary, output_dir):
+        """
+        Write the transcript and per-frame predictions to disk
+
+        Returns:
+            (transcript_path, predictions_path)
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        name = os.path.splitext(os.path.basename(os.path.normpath(summary['source'])))[0]
+
+        transcript_path = os.path.join(output_dir, f"{name}_transcript.txt")
+        with open(transcript_path, 'w') as f:
+            f.write(summary['transcript'] + "\n")
+
+        predictions_path = os.path.join(output_dir, f"{name}_predictions.jsonl")
+        with open(predictions_path, 'w') as f:
+            for row in summary['predictions']:
+                f.write(json.dumps(row) + "\n")
+
+        return transcript_path, predictions_path
@@ -0,0 +1,8 @@
+"""
+Shared pytest setup
+Makes the flat src/ modules importable by name, the same way main.py does
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -0,0 +1,92 @@
+"""
+Tests for the vectorized finger states against the original per-finger loop
+"""
+import numpy as np
+
+from finger_states import FINGER_NAMES, compute_finger_states, finger_states_to_dict
+
+
+def _angle(v1, v2, zero_value):
+    norms = np.linalg.norm(v1) * np.linalg.norm(v2)
+    if norms > 0:
+        return np.arccos(np.clip(np.dot(v1, v2) / norms, -1.0, 1.0)) * 180 / np.pi
+    return zero_value
+
+
+def legacy_finger_states(points):
+    """The original HandDetector.get_finger_states loop (on a (21, 2) array)"""
+    wrist = points[0]
+    palm_center = points[9]
+    states = {}
+    for tip_idx, mid_idx, base_idx, name in zip([4, 8, 12, 16, 20], [3, 6, 10, 14, 18],
+                                                [2, 5, 9, 13, 17], FINGER_NAMES):
+        tip, mid, base = points[tip_idx], points[mid_idx], points[base_idx]
+        if name == 'thumb':
+            distance_ratio = np.linalg.norm(tip - palm_center) / (np.linalg.norm(base - palm_center) + 0.001)
+            angle_deg = _angle(tip - wrist, palm_center - wrist, 0)
+            reach = np.linalg.norm(tip - wrist) > np.linalg.norm(points[5] - wrist) * 0.85
+            joint_angle = _angle(points[3] - base, tip - points[3], 180)
+            votes = sum([distance_ratio > 1.15, angle_deg > 25, reach, joint_angle < 150])
+            states[name] = votes >= 3
+        else:
+            angle = _angle(mid - base, tip - mid, 0)
+            extension_ratio = np.linalg.norm(tip - wrist) / (np.linalg.norm(base - wrist) + 0.001)
+            states[name] = bool(angle < 160 and extension_ratio > 1.15)
+    return states
+
+
+OPEN_HAND = np.array([[320, 400], [280, 380], [250, 350], [230, 320], [215, 290],
+                      [290, 300], [285, 250], [282, 220], [280, 195],
+                      [320, 295], [320, 240], [320, 205], [320, 178],
+                      [350, 300], [352, 250], [354, 218], [356, 195],
+                      [378, 310], [385, 270], [390, 245], [394, 225]], dtype=np.float64)
+
+
+def random_hands(count, seed=0):
+    """Open hand with random per-finger curl, jitter and integer pixels"""
+    rng = np.random.default_rng(seed)
+    hands = np.repeat(OPEN_HAND[None], count, axis=0)
+    for finger in range(5):
+        base = 2 if finger == 0 else 1 + 4 * finger
+        joints = list(range(base + 1, 4 * finger + 5))
+        curl = rng.random((count, 1, 1))
+        shrink = 1 - curl * (1 - np.linspace(0.6, -0.2, len(joints)))[None, :, None]
+        hands[:, joints] = hands[:, [base]] + (hands[:, joints] - hands[:, [base]]) * shrink
+    hands += rng.normal(0, 4, hands.shape)
+    return np.round(hands)
+
+
+def test_matches_original_loop_on_random_hands():
+    for points in random_hands(3000):
+        expected = legacy_finger_states(points)
+        assert finger_states_to_dict(compute_finger_states(points)) == expected
+
+
+def test_degenerate_hands_match_original_loop():
+    collapsed = OPEN_HAND.copy()
+    collapsed[5:9] = collapsed[5]          # Zero-length index finger
+    collapsed[1:5] = collapsed[2]          # Zero-length thumb
+    single_point = np.full((21, 2), 100.0)
+    for points in (collapsed, single_point):
+        assert finger_states_to_dict(compute_finger_states(points)) == legacy_finger_states(points)
+
+
+def test_open_hand_and_fist():
+    assert compute_finger_states(OPEN_HAND).all()
+
+    fist = OPEN_HAND.copy()
+    for base, joints in ((5, [6, 7, 8]), (9, [10, 11, 12]), (13, [14, 15, 16]), (17, [18, 19, 20])):
+        fist[joints] = fist[base] + (fist[base] - OPEN_HAND[0]) * 0.1  # Tips folded onto the knuckle
+    assert not compute_finger_states(fist)[1:].any()
+
+
+def test_batch_matches_single_hands_and_distance_matrix():
+    hands = random_hands(500, seed=1)
+    batch = compute_finger_states(hands)
+    assert batch.shape == (500, 5) and batch.dtype == bool
+    for points, states in zip(hands, batch):
+        np.testing.assert_array_equal(compute_finger_states(points), states)
+
+    offsets = hands[:, :, None, :] - hands[:, None, :, :]
+    distances = np.sqrt(np.sum(offsets * offsets, axis=-1))
+    np.testing.assert_array_equal(compute_finger_states(hands, distances=distances), batch)
@@ -0,0 +1,100 @@
+"""
+Tests for FrameGrabber (threaded latest-frame capture)
+The camera is replaced by a fake capture that yields numbered frames
+"""
+import threading
+import time
+
+import numpy as np
+
+from frame_grabber import FrameGrabber
+
+
+class FakeCapture:
+    """cv2.VideoCapture stand-in: frame k is a 1x1 image holding k"""
+
+    def __init__(self, interval=0.001, fail_every=0):
+        self.interval = interval
+        self.fail_every = fail_every
+        self.reads = 0
+        self.released = False
+        self.lock = threading.Lock()
+
+    def read(self):
+        time.sleep(self.interval)
+        with self.lock:
+            self.reads += 1
+            if self.fail_every and self.reads % self.fail_every == 0:
+                return False, None
+            return True, np.full((1, 1), self.reads, dtype=np.int64)
+
+    def isOpened(self):
+        return not self.released
+
+    def release(self):
+        self.released = True
+
+
+def make_grabber(buffer_size=2, **capture_args):
+    grabber = FrameGrabber(source=-1, buffer_size=buffer_size)
+    grabber.cap.release()
+    grabber.cap = FakeCapture(**capture_args)
+    return grabber
+
+
+def test_read_returns_increasing_frames_without_repeats():
+    grabber = make_grabber().start()
+    try:
+        seen = []
+        for _ in range(50):
+            success, frame = grabber.read(timeout=1.0)
+            assert success
+            seen.append(int(frame[0, 0]))
+        assert all(later > earlier for earlier, later in zip(seen, seen[1:]))
+    finally:
+        grabber.release()
+
+
+def test_slow_consumer_gets_the_newest_frame_and_stale_ones_are_dropped():
+    grabber = make_grabber(buffer_size=2).start()
+    try:
+        _, first = grabber.read(timeout=1.0)
+        time.sleep(0.05)  # Camera keeps producing (~1 frame/ms) while the main loop is busy
+        success, frame = grabber.read(timeout=1.0)
+        assert success
+        # Skipped straight past the backlog instead of returning the next queued frame
+        assert int(frame[0, 0]) - int(first[0, 0]) >= 10
+        stats = grabber.get_stats()
+        assert stats['consumed'] == 2
+        assert stats['dropped'] > 0
+        assert stats['captured'] >= stats['consumed'] + stats['dropped']
+    finally:
+        grabber.release()
+
+
+def test_capture_failures_are_skipped():
+    grabber = make_grabber(fail_every=3).start()
+    try:
+        for _ in range(10):
+            success, frame = grabber.read(timeout=1.0)
+            assert success
+            assert int(frame[0, 0]) % 3 != 0
+    finally:
+        grabber.release()
+
+
+def test_read_times_out_before_start():
+    grabber = make_grabber()
+    start = time.perf_counter()
+    assert grabber.read(timeout=0.05) == (False, None)
+    assert time.perf_counter() - start < 1.0
+    grabber.release()
+
+
+def test_release_stops_the_thread_and_the_camera():
+    grabber = make_grabber().start()
+    thread = grabber._thread
+    grabber.release()
+    assert not thread.is_alive()
+    assert grabber.cap.released
+    assert not grabber.isOpened()
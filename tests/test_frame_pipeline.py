@@ -0,0 +1,129 @@
+"""
+Tests for FramePipeline (multi-stage frame executor)
+"""
+import random
+import threading
+import time
+
+from frame_pipeline import FramePipeline
+
+
+def collect(pipeline, count, timeout=2.0):
+    results = []
+    for _ in range(count):
+        success, payload = pipeline.get(timeout=timeout)
+        assert success
+        results.append(payload)
+    return results
+
+
+def jittery(func):
+    """Wrap a stage function so its run time varies from frame to frame"""
+    def stage(payload):
+        time.sleep(random.random() * 0.002)
+        return func(payload)
+    return stage
+
+
+def test_results_come_out_in_submission_order():
+    pipeline = FramePipeline([
+        ('detect', jittery(lambda x: x * 2)),
+        ('classify', jittery(lambda x: x + 1)),
+        ('render', jittery(lambda x: (x, 'rendered')))
+    ], queue_size=2).start()
+    try:
+        results = []
+
+        def consume():
+            results.extend(collect(pipeline, 100))
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        for frame in range(100):
+            assert pipeline.submit(frame, timeout=2.0)
+        consumer.join(timeout=5.0)
+
+        assert results == [(frame * 2 + 1, 'rendered') for frame in range(100)]
+        stats = pipeline.get_stage_stats()
+        assert all(stage['frames'] == 100 and stage['errors'] == 0 for stage in stats.values())
+    finally:
+        pipeline.stop()
+
+
+def test_stages_overlap_frames():
+    delay = 0.02
+
+    def slow(payload):
+        time.sleep(delay)
+        return payload
+
+    pipeline = FramePipeline([('a', slow), ('b', slow), ('c', slow)], queue_size=2).start()
+    try:
+        frames = 10
+        start = time.perf_counter()
+
+        def produce():
+            for frame in range(frames):
+                pipeline.submit(frame, timeout=2.0)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        assert collect(pipeline, frames) == list(range(frames))
+        producer.join(timeout=2.0)
+
+        # Sequential execution would take frames * 3 * delay
+        assert time.perf_counter() - start < frames * 3 * delay * 0.75
+    finally:
+        pipeline.stop()
+
+
+def test_failed_frame_is_passed_through_as_none():
+    def fragile(payload):
+        if payload == 3:
+            raise ValueError("bad frame")
+        return payload
+
+    seen_downstream = []
+
+    def record(payload):
+        seen_downstream.append(payload)
+        return payload
+
+    pipeline = FramePipeline([('detect', fragile), ('classify', record)]).start()
+    try:
+        def produce():
+            for frame in range(6):
+                pipeline.submit(frame, timeout=2.0)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        assert collect(pipeline, 6) == [0, 1, 2, None, 4, 5]
+        producer.join(timeout=2.0)
+
+        # Downstream stages skip the failed frame instead of running on None
+        assert seen_downstream == [0, 1, 2, 4, 5]
+        assert pipeline.get_stage_stats()['detect']['errors'] == 1
+    finally:
+        pipeline.stop()
+
+
+def test_submit_applies_backpressure_and_stop_unblocks():
+    release = threading.Event()
+
+    def blocked(payload):
+        release.wait(timeout=2.0)
+        return payload
+
+    pipeline = FramePipeline([('detect', blocked)], queue_size=1).start()
+    try:
+        # One frame in the stage, one in its input queue, then the queue is full
+        assert pipeline.submit(0, timeout=0.5)
+        time.sleep(0.05)
+        assert pipeline.submit(1, timeout=0.5)
+        assert not pipeline.submit(2, timeout=0.1)
+        assert pipeline.get(timeout=0.05) == (False, None)
+    finally:
+        release.set()
+        pipeline.stop()
+    assert not pipeline.submit(3, timeout=0.1)
+    assert all(not stage.thread.is_alive() for stage in pipeline.stages)
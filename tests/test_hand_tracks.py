@@ -0,0 +1,117 @@
+"""
+Tests for per-hand tracking: stable track IDs and per-track history
+HandDetector runs on the replay backend, so no camera or model is needed
+"""
+import numpy as np
+
+from hand_detector import HandDetector
+from hand_tracks import HandTrack, match_tracks
+from landmark_filters import MovingAverageSmoother
+
+WIDTH, HEIGHT = 640, 480
+OPEN_HAND = np.array([[320, 400], [280, 380], [250, 350], [230, 320], [215, 290],
+                      [290, 300], [285, 250], [282, 220], [280, 195],
+                      [320, 295], [320, 240], [320, 205], [320, 178],
+                      [350, 300], [352, 250], [354, 218], [356, 195],
+                      [378, 310], [385, 270], [390, 245], [394, 225]], dtype=np.float64)
+
+
+def hand_at(x_offset, y_offset=0.0):
+    """Open hand (scaled down) shifted by pixels, as normalized x, y, z"""
+    points = (OPEN_HAND - OPEN_HAND[0]) * 0.5 + (x_offset, 350 + y_offset)
+    return np.column_stack([points / (WIDTH, HEIGHT), np.zeros(21)])
+
+
+def replay_detector(frames, labels, **kwargs):
+    """
+    Detector replaying per-frame hand lists
+
+    Args:
+        frames: List (per frame) of lists of (21, 3) normalized hands
+        labels: Matching lists of handedness codes (0 = Left, 1 = Right)
+    """
+    max_hands = max(2, max(len(hands) for hands in frames))
+    landmarks = np.full((len(frames), max_hands, 21, 3), np.nan, dtype=np.float32)
+    handedness = np.full((len(frames), max_hands), -1, dtype=np.int8)
+    for index, (hands, codes) in enumerate(zip(frames, labels)):
+        for slot, (hand, code) in enumerate(zip(hands, codes)):
+            landmarks[index, slot] = hand
+            handedness[index, slot] = code
+    return HandDetector(max_hands=max_hands, backend='replay',
+                        backend_params={'landmarks': landmarks, 'handedness': handedness}, **kwargs)
+
+
+def run(detector, frames):
+    """Track IDs per frame as {track ID: wrist x}"""
+    img = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+    history = []
+    for _ in frames:
+        detector.find_hands(img, draw=False, enhance_visual=False)
+        positions = detector.find_all_positions(img, smooth=False)
+        history.append({track_id: int(landmarks[0][1]) for track_id, landmarks in positions.items()})
+    return history
+
+
+def test_ids_follow_hands_when_mediapipe_swaps_their_order():
+    frames, labels = [], []
+    for t in range(40):
+        left, right = hand_at(150 + t), hand_at(450 - t)
+        # MediaPipe reports the hands in arbitrary order
+        frames.append([left, right] if t % 3 else [right, left])
+        labels.append([0, 1] if t % 3 else [1, 0])
+    history = run(replay_detector(frames, labels), frames)
+
+    first = history[0]
+    left_id = min(first, key=first.get)
+    right_id = max(first, key=first.get)
+    for t, positions in enumerate(history):
+        assert set(positions) == {left_id, right_id}
+        # (float32 normalized coordinates can truncate a pixel low)
+        assert abs(positions[left_id] - (150 + t)) <= 1
+        assert abs(positions[right_id] - (450 - t)) <= 1
+
+
+def test_id_survives_a_short_dropout_and_is_replaced_after_the_timeout():
+    frames = [[hand_at(300)]] * 5 + [[]] * 3 + [[hand_at(302)]] * 5 + [[]] * 20 + [[hand_at(300)]] * 2
+    labels = [[1] * len(hands) for hands in frames]
+    history = run(replay_detector(frames, labels, track_timeout=15), frames)
+
+    first_id, = history[0]
+    assert all(list(positions) == [first_id] for positions in history[8:13])
+    returned_id, = history[-1]
+    assert returned_id != first_id
+
+
+def test_each_track_keeps_its_own_smoothing_history():
+    frames = [[hand_at(150), hand_at(450)] for _ in range(10)]
+    labels = [[0, 1]] * 10
+    detector = replay_detector(frames, labels)
+    img = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+    for _ in frames:
+        detector.find_hands(img, draw=False, enhance_visual=False)
+        smoothed = detector.find_all_positions(img)
+
+    # Neither hand's smoothed position is pulled towards the other one
+    wrists = sorted(int(landmarks[0][1]) for landmarks in smoothed.values())
+    assert abs(wrists[0] - 150) <= 1 and abs(wrists[1] - 450) <= 1
+    assert len(detector.tracks) == 2
+
+
+def test_match_tracks_prefers_nearest_and_respects_max_distance():
+    tracks = []
+    for track_id, (x, label) in enumerate([(100, 'Left'), (400, 'Right')]):
+        track = HandTrack(track_id, MovingAverageSmoother(), label)
+        points = (OPEN_HAND - OPEN_HAND[0]) * 0.5 + (x, 350)
+        track.observe(points, frame_id=0)
+        tracks.append(track)
+
+    wrists = np.array([[395.0, 350.0], [104.0, 352.0]])
+    assert match_tracks(tracks, wrists, ['Right', 'Left']) == [1, 0]
+
+    # Far from every track (hand size is ~55 px, limit is 2 hand sizes) -> new track
+    assert match_tracks(tracks, np.array([[250.0, 100.0]]), [None]) == [-1]
+
+    # Handedness only breaks near-ties
+    between = np.array([[251.0, 350.0]])
+    assert match_tracks(tracks, between, ['Right'], max_distance=np.inf) == [1]
+    assert match_tracks(tracks, between, ['Left'], max_distance=np.inf) == [0]
@@ -0,0 +1,95 @@
+"""
+Tests for LandmarkRingBuffer against the deque of [id, x, y] lists it replaced
+"""
+import copy
+from collections import deque
+
+import numpy as np
+import pytest
+
+from landmark_buffer import LandmarkRingBuffer
+
+
+def legacy_weighted_average(frames):
+    """The original per-landmark loop from HandDetector.find_position"""
+    smoothed = []
+    buffer_size = len(frames)
+    for i in range(21):
+        weighted_x = 0
+        weighted_y = 0
+        total_weight = 0
+        for j, frame in enumerate(frames):
+            weight = (j + 1) / buffer_size
+            weighted_x += frame[i][1] * weight
+            weighted_y += frame[i][2] * weight
+            total_weight += weight
+        smoothed.append([int(weighted_x / total_weight), int(weighted_y / total_weight)])
+    return np.array(smoothed)
+
+
+def as_rows(points):
+    return [[i, int(x), int(y)] for i, (x, y) in enumerate(points)]
+
+
+def random_frames(count, seed=0):
+    rng = np.random.default_rng(seed)
+    base = rng.integers(50, 600, size=(21, 2))
+    return [base + rng.integers(-8, 9, size=(21, 2)) for _ in range(count)]
+
+
+@pytest.mark.parametrize('capacity', [1, 2, 3, 7])
+def test_indexing_and_order_match_deque(capacity):
+    buffer = LandmarkRingBuffer(capacity=capacity)
+    reference = deque(maxlen=capacity)
+    for frame_id, points in enumerate(random_frames(20)):
+        buffer.append(points, frame_id)
+        reference.append((frame_id, points))
+
+        assert len(buffer) == len(reference)
+        for index in range(-len(reference), len(reference)):
+            np.testing.assert_array_equal(buffer[index], reference[index][1])
+            assert buffer.frame_id(index) == reference[index][0]
+        np.testing.assert_array_equal(buffer.ordered(), np.stack([p for _, p in reference]))
+
+    with pytest.raises(IndexError):
+        buffer[capacity]
+
+
+def test_weighted_average_matches_original_loop():
+    buffer = LandmarkRingBuffer(capacity=7)
+    reference = deque(maxlen=7)
+    for points in random_frames(500, seed=1):
+        buffer.append(points)
+        reference.append(as_rows(points))
+        np.testing.assert_array_equal(buffer.weighted_average(), legacy_weighted_average(reference))
+
+
+@pytest.mark.parametrize('capacity', [1, 2, 3, 7])
+def test_weighted_average_extra_matches_appending_to_a_copy(capacity):
+    buffer = LandmarkRingBuffer(capacity=capacity)
+    reference = deque(maxlen=capacity)
+    frames = random_frames(30, seed=2)
+    for points, extra in zip(frames, frames[1:]):
+        buffer.append(points)
+        reference.append(as_rows(points))
+
+        with_extra = deque(reference, maxlen=capacity)
+        with_extra.append(as_rows(extra))
+        np.testing.assert_array_equal(buffer.weighted_average(extra=extra), legacy_weighted_average(with_extra))
+        # Peeking never changes the stored frames
+        assert len(buffer) == len(reference)
+        np.testing.assert_array_equal(buffer[-1], points)
+
+
+def test_clear_and_deepcopy():
+    buffer = LandmarkRingBuffer(capacity=3)
+    for points in random_frames(5):
+        buffer.append(points)
+
+    clone = copy.deepcopy(buffer)
+    clone.append(np.zeros((21, 2)))
+    assert not np.array_equal(clone[-1], buffer[-1])
+
+    buffer.clear()
+    assert len(buffer) == 0
+    assert len(clone) == 3
@@ -0,0 +1,103 @@
+"""
+Tests for the landmark cache: keys, hit/miss accounting and replay round trips
+"""
+import os
+import shutil
+
+import numpy as np
+
+from detector_backends import make_result
+from hand_detector import HandDetector
+from landmark_cache import LandmarkCache, LandmarkRecorder, content_hash
+
+
+def write_video(path, content=b"frame-bytes" * 1000):
+    with open(path, 'wb') as f:
+        f.write(content)
+    return str(path)
+
+
+def recorded_results(count=6, seed=0):
+    rng = np.random.default_rng(seed)
+    results = []
+    for index in range(count):
+        if index == 2:
+            results.append(make_result())  # No hand in this frame
+        else:
+            results.append(make_result([rng.random((21, 3))], ['Right'], [0.9]))
+    return results
+
+
+def test_key_depends_on_content_and_every_setting(tmp_path):
+    cache = LandmarkCache(str(tmp_path / 'cache'))
+    video = write_video(tmp_path / 'a.mp4')
+    renamed = str(tmp_path / 'b.mp4')
+    shutil.copy(video, renamed)
+    other = write_video(tmp_path / 'c.mp4', b"other-bytes" * 1000)
+
+    settings = {'mirror': False, 'max_hands': 1, 'roi_mode': False, 'smoothing': 'MovingAverageSmoother'}
+    key = cache.key_for(video, **settings)
+    assert cache.key_for(renamed, **settings) == key
+    assert cache.key_for(video, **dict(reversed(list(settings.items())))) == key
+    assert cache.key_for(other, **settings) != key
+    for name, value in (('mirror', True), ('max_hands', 2), ('roi_mode', True), ('smoothing', 'KalmanSmoother')):
+        assert cache.key_for(video, **dict(settings, **{name: value})) != key
+    assert len(os.path.basename(cache.path(key))) < 100
+
+
+def test_miss_then_hit_and_replay_round_trip(tmp_path):
+    cache = LandmarkCache(str(tmp_path / 'cache'))
+    key = cache.key_for(write_video(tmp_path / 'a.mp4'), mirror=False)
+    assert cache.load(key) is None
+
+    results = recorded_results()
+    recorder = LandmarkRecorder(max_hands=1)
+    for result in results:
+        recorder.add(result)
+    cache.save(key, recorder.to_records())
+
+    records = cache.load(key)
+    assert isinstance(records, np.memmap) and not records.flags.writeable
+    assert len(records) == len(results)
+    assert cache.get_stats() == {'hits': 1, 'misses': 1, 'hit_rate': 0.5}
+
+    backend = cache.backend(records)
+    for result in results:
+        replayed = backend.process(None)
+        if result.multi_hand_landmarks is None:
+            assert replayed.multi_hand_landmarks is None
+            continue
+        expected = np.array([(lm.x, lm.y, lm.z) for lm in result.multi_hand_landmarks[0].landmark], np.float32)
+        actual = np.array([(lm.x, lm.y, lm.z) for lm in replayed.multi_hand_landmarks[0].landmark], np.float32)
+        np.testing.assert_array_equal(actual, expected)
+        assert replayed.multi_handedness[0].classification[0].label == 'Right'
+    assert not [name for name in os.listdir(cache.cache_dir) if name.endswith('.tmp')]
+
+
+def test_content_hash_of_image_sequences(tmp_path):
+    frames = tmp_path / 'frames'
+    frames.mkdir()
+    for index in range(3):
+        write_video(frames / f"{index:03d}.png", bytes([index]) * 100)
+    write_video(frames / 'notes.txt', b"ignored")
+    digest = content_hash(str(frames))
+
+    (frames / 'notes.txt').write_bytes(b"still ignored")
+    assert content_hash(str(frames)) == digest
+    (frames / '001.png').write_bytes(b"changed")
+    assert content_hash(str(frames)) != digest
+
+
+def test_detector_output_settings_cover_modes_and_smoothing():
+    def settings(**kwargs):
+        detector = HandDetector(backend='replay', backend_params={'landmarks': np.zeros((0, 1, 21, 3))}, **kwargs)
+        return detector.output_settings()
+
+    baseline = settings()
+    assert baseline['smoothing'] == 'MovingAverageSmoother' and baseline['smoothing_window'] == 7
+    assert settings(detection_con=0.5) != baseline
+    assert settings(smoothing='one_euro') != baseline
+    assert settings(smoothing='one_euro', smoothing_params={'beta': 0.1}) != settings(smoothing='one_euro')
+    assert settings(adaptive_skip=True) != baseline
+    assert settings(latency_target_ms=25) != baseline
+    assert settings(max_hands=1) == baseline
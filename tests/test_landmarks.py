@@ -0,0 +1,61 @@
+"""
+Tests for Landmarks (array-backed replacement for lists of [id, x, y])
+"""
+import json
+
+import numpy as np
+
+from landmarks import Landmarks, as_landmarks
+
+
+def legacy_rows(seed=0):
+    rng = np.random.default_rng(seed)
+    return [[i, int(x), int(y)] for i, (x, y) in enumerate(rng.integers(0, 640, size=(21, 2)))]
+
+
+def test_indexes_like_the_legacy_list():
+    rows = legacy_rows()
+    landmarks = Landmarks(rows)
+
+    assert len(landmarks) == 21
+    assert bool(landmarks) and not Landmarks()
+    for i, row in enumerate(rows):
+        assert landmarks[i][1] == row[1] and landmarks[i][2] == row[2]
+        assert list(landmarks[i][1:]) == row[1:]
+    assert [list(row) for row in landmarks] == rows
+    assert landmarks.tolist() == rows
+    assert json.loads(json.dumps(landmarks.tolist())) == rows
+
+    head = landmarks[:5]
+    assert isinstance(head, Landmarks) and len(head) == 5
+
+
+def test_from_points_and_views():
+    points = np.arange(42, dtype=np.float64).reshape(21, 2)
+    landmarks = Landmarks.from_points(points)
+
+    np.testing.assert_array_equal(landmarks.array[:, 0], np.arange(21))
+    np.testing.assert_array_equal(landmarks.points, points)
+    np.testing.assert_array_equal(landmarks.xs, points[:, 0])
+    np.testing.assert_array_equal(landmarks.ys, points[:, 1])
+
+    # points/xs/ys are views into the one array
+    landmarks.xs[0] = -1
+    assert landmarks[0][1] == -1 and landmarks.points[0, 0] == -1
+
+
+def test_copy_is_independent():
+    landmarks = Landmarks(legacy_rows())
+    clone = landmarks.copy()
+    clone.points[:] = 0
+    assert landmarks.points.any()
+
+
+def test_as_landmarks_and_array_protocol():
+    landmarks = Landmarks(legacy_rows())
+    assert as_landmarks(landmarks) is landmarks
+    assert as_landmarks(legacy_rows()).tolist() == legacy_rows()
+
+    array = np.asarray(landmarks)
+    assert array.shape == (21, 3) and array.dtype == np.float64
+    assert np.asarray(landmarks, dtype=np.float32).dtype == np.float32
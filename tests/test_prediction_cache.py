@@ -0,0 +1,67 @@
+"""
+Tests for PredictionCache (reuse the last evaluation while the hand holds still)
+"""
+import numpy as np
+
+from prediction_cache import PredictionCache
+
+HAND = np.array([[320, 400], [280, 380], [250, 350], [230, 320], [215, 290],
+                 [290, 300], [285, 250], [282, 220], [280, 195],
+                 [320, 300], [320, 240], [320, 205], [320, 178],
+                 [350, 300], [352, 250], [354, 218], [356, 195],
+                 [378, 310], [385, 270], [390, 245], [394, 225]], dtype=np.float64)
+HAND_SIZE = 100.0  # Wrist (0) to middle finger MCP (9)
+
+
+def test_first_lookup_misses_and_small_jitter_hits():
+    cache = PredictionCache(epsilon=0.05)
+    model = object()
+    assert cache.lookup(HAND, key=model) is None
+
+    cache.store(HAND, ('states', 'A', 0.9), key=model)
+    jitter = np.random.default_rng(0).uniform(-2, 2, HAND.shape)  # < 0.05 * 100 px per landmark
+    assert cache.lookup(HAND + jitter, key=model) == ('states', 'A', 0.9)
+    assert cache.get_stats() == {'hits': 1, 'misses': 1, 'hit_rate': 0.5}
+
+
+def test_one_moving_finger_is_not_averaged_away():
+    cache = PredictionCache(epsilon=0.05)
+    cache.store(HAND, 'A')
+    moved = HAND.copy()
+    moved[8] += (0, 0.05 * HAND_SIZE)  # Only the index tip moves, by exactly epsilon
+    assert cache.lookup(moved) is None
+    moved[8] -= (0, 1)
+    assert cache.lookup(moved) == 'A'
+
+
+def test_slow_drift_is_measured_from_the_stored_frame():
+    cache = PredictionCache(epsilon=0.05)
+    cache.store(HAND, 'A')
+    results = [cache.lookup(HAND + (step, 0)) for step in range(10)]  # 1 px per frame
+    assert results[:5] == ['A'] * 5
+    assert results[5:] == [None] * 5
+
+
+def test_different_key_zero_hand_size_and_reset_miss():
+    cache = PredictionCache()
+    model = object()
+    cache.store(HAND, 'A', key=model)
+    assert cache.lookup(HAND, key=object()) is None
+
+    collapsed = HAND.copy()
+    collapsed[9] = collapsed[0]
+    cache.store(collapsed, 'B', key=model)
+    assert cache.lookup(collapsed, key=model) is None
+
+    cache.store(HAND, 'A', key=model)
+    cache.reset()
+    assert cache.lookup(HAND, key=model) is None
+    assert cache.hits == 0 and cache.misses == 3
+
+
+def test_store_copies_the_reference():
+    cache = PredictionCache()
+    points = HAND.copy()
+    cache.store(points, 'A')
+    points += 50
+    assert cache.lookup(HAND) == 'A'
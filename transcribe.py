@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+ASL Translator - Headless Transcription Entry Point
+Transcribes a recorded video (or image-sequence directory) without a display
+"""
+import sys
+import os
+import argparse
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+# Import and run
+from video_transcriber import VideoTranscriber
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Transcribe recorded ASL footage (headless)")
+    parser.add_argument("source", help="Video file or directory of image frames")
+    parser.add_argument("-o", "--output", default="transcripts",
+                        help="Directory for transcript and per-frame predictions (default: transcripts)")
+    parser.add_argument("--fps", type=float, default=None,
+                        help="Frame rate for hold-time timestamps (default: video rate, 30 for images)")
+    parser.add_argument("--model", default="asl_model.pkl", help="Trained model file")
+    parser.add_argument("--data", default="training_data.json", help="Training data file")
+    parser.add_argument("--mirror", action="store_true",
+                        help="Flip frames horizontally (raw camera footage only)")
+    parser.add_argument("--landmark-cache", default=None, metavar="DIR",
+                        help="Cache MediaPipe landmarks per video in DIR and replay them on later runs")
+    parser.add_argument("--adaptive-skip", action="store_true",
+                        help="Extrapolate landmarks on stable frames (default: infer every frame)")
+    parser.add_argument("--roi", action="store_true",
+                        help="Run MediaPipe on hand crops (default: full frames)")
+    parser.add_argument("--smoothing", choices=["moving_average", "one_euro", "kalman"], default="moving_average",
+                        help="Landmark smoother (default: the original 7-frame weighted average)")
+    args = parser.parse_args()
+
+    try:
+        transcriber = VideoTranscriber(data_file=args.data, model_file=args.model, mirror=args.mirror,
+                                       cache_dir=args.landmark_cache, adaptive_skip=args.adaptive_skip,
+                                       roi_mode=args.roi, smoothing=args.smoothing)
+        summary = transcriber.transcribe(args.source, output_dir=args.output, fps=args.fps)
+
+        print("=" * 60)
+        print(f"📼 {args.source}")
+        print(f"🖐️  Frames: {summary['frames']} ({summary['frames_with_hand']} with a hand)")
+        print(f"⚡ Speed: {summary['fps']:.1f} frames/sec")
+        if summary['landmark_cache']:
+            print(f"🗃️  Landmark cache: {summary['landmark_cache']}")
+        print(f"📋 Transcript: {summary['transcript'] or '(empty)'}")
+        print(f"💾 Results written to: {args.output}/")
+        print("=" * 60)
+    except KeyboardInterrupt:
+        print("\n\n👋 Goodbye!")
+        sys.exit(0)
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)